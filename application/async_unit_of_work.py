@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+from typing import Callable, List
+
+class AsyncUnitOfWork(ABC):
+    """
+    Transaction boundary of an async use case. The repositories opened on the
+    same unit of work only flush their changes, which are made durable together
+    by commit. Whatever is not committed when the async with block ends is rolled back.
+    """
+
+    def __init__(self):
+        self._after_commit: List[Callable[[], None]] = []
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.rollback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """To run callback once the next commit succeeds, such as invalidating what was cached from the old rows."""
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """To make every change of the unit of work durable in a single transaction."""
+        await self._commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    @abstractmethod
+    async def _commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """To discard the changes not committed yet."""
+        pass
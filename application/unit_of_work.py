@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+from typing import Callable, List
+
+class UnitOfWork(ABC):
+    """
+    Transaction boundary of a use case. The repositories opened on the same
+    unit of work only flush their changes, which are made durable together
+    by commit. Whatever is not committed when the with block ends is rolled back.
+    """
+
+    def __init__(self):
+        self._after_commit: List[Callable[[], None]] = []
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.rollback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """To run callback once the next commit succeeds, such as invalidating what was cached from the old rows."""
+        self._after_commit.append(callback)
+
+    def commit(self) -> None:
+        """To make every change of the unit of work durable in a single transaction."""
+        self._commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    @abstractmethod
+    def _commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """To discard the changes not committed yet."""
+        pass
@@ -0,0 +1,30 @@
+from typing import Iterator
+
+from domain.entities.grade import Grade
+from domain.entities.student import Student
+from domain.entities.subject import Subject
+from domain.repositories.grade_repository import GradeRepository
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.subject_repository import SubjectRepository
+
+class ExportDataUseCase:
+    def __init__(
+        self,
+        grade_repository: GradeRepository,
+        student_repository: StudentRepository,
+        subject_repository: SubjectRepository,
+        batch_size: int
+    ):
+        self.grade_repository = grade_repository
+        self.student_repository = student_repository
+        self.subject_repository = subject_repository
+        self.batch_size = batch_size
+
+    def execute_grades(self) -> Iterator[Grade]:
+        return self.grade_repository.stream_all(self.batch_size)
+
+    def execute_students(self) -> Iterator[Student]:
+        return self.student_repository.stream_all(self.batch_size)
+
+    def execute_subjects(self) -> Iterator[Subject]:
+        return self.subject_repository.stream_all(self.batch_size)
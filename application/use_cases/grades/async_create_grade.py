@@ -0,0 +1,45 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.entities.grade import Grade
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+from domain.exceptions.not_enough_arguments_exception import NotEnoughArgumentsException
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.exceptions.cannot_create_exception import CannotCreateException
+
+class AsyncCreateGradeUseCase:
+    def __init__(
+        self,
+        repository: AsyncGradeRepository,
+        student_repository: AsyncStudentRepository,
+        subject_repository: AsyncSubjectRepository,
+        unit_of_work: AsyncUnitOfWork
+    ):
+        self.repository = repository
+        self.student_repository = student_repository
+        self.subject_repository = subject_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, grade_data: Grade) -> Grade:
+
+        if not grade_data.student_id or not grade_data.subject_id:
+            raise NotEnoughArgumentsException("Student ID and Course ID are required.")
+        if not await self.student_repository.exists(grade_data.student_id):
+            raise ResourceNotFoundException(f"Student with ID {grade_data.student_id} not found.")
+        if not await self.subject_repository.exists(grade_data.subject_id):
+            raise ResourceNotFoundException(f"Course with ID {grade_data.subject_id} not found.")
+        if await self.repository.exists_for_student_and_subject(grade_data.student_id, grade_data.subject_id):
+            raise CannotCreateException(
+                f"Student with ID {grade_data.student_id} already has a grade for course with ID {grade_data.subject_id}."
+            )
+
+        async with self.unit_of_work:
+            created_grade = await self.repository.create(grade_data)
+
+            if not created_grade:
+                raise CannotCreateException("Cannot create grade")
+
+            await self.unit_of_work.commit()
+
+        return created_grade
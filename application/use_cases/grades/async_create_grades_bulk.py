@@ -0,0 +1,28 @@
+from typing import List
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.use_cases.grades.create_grades_bulk import merge_bulk_result, split_valid_grades
+
+from domain.entities.grade import Grade, GradeBulkResult
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+
+class AsyncCreateGradesBulkUseCase:
+    def __init__(self, repository: AsyncGradeRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, grades_data: List[Grade]) -> GradeBulkResult:
+        """
+        Create every valid grade in a single transaction. Invalid rows are
+        skipped and reported with their 1-based position in grades_data.
+        """
+        errors, valid_grades, valid_rows = split_valid_grades(grades_data)
+
+        if not valid_grades:
+            return GradeBulkResult(created=0, errors=errors)
+
+        async with self.unit_of_work:
+            result = await self.repository.create_many(valid_grades)
+            await self.unit_of_work.commit()
+
+        return merge_bulk_result(errors, result, valid_rows)
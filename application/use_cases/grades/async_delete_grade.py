@@ -0,0 +1,18 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncDeleteGradeUseCase:
+    def __init__(self, repository: AsyncGradeRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, grade_id: int):
+        async with self.unit_of_work:
+            grade_deleted = await self.repository.delete(grade_id)
+
+            if not grade_deleted:
+                raise ResourceNotFoundException("Grade cannot be found by id")
+
+            await self.unit_of_work.commit()
@@ -0,0 +1,21 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+from domain.entities.grade import Grade
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncUpdateGradeUseCase:
+    def __init__(self, grade_repository: AsyncGradeRepository, unit_of_work: AsyncUnitOfWork):
+        self.grade_repository = grade_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, grade_data: Grade) -> Grade:
+        # The grade, the student average, the dashboard and the report versions are committed together
+        async with self.unit_of_work:
+            updated_grade = await self.grade_repository.update(grade_data)
+            if not updated_grade:
+                raise ResourceNotFoundException("Grade cannot be found by id")
+
+            await self.unit_of_work.commit()
+
+        return updated_grade
@@ -1,3 +1,5 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.entities.grade import Grade
 from domain.repositories.grade_repository import GradeRepository
 from domain.repositories.student_repository import StudentRepository
@@ -11,11 +13,13 @@ class CreateGradeUseCase:
         self,
         repository: GradeRepository,
         student_repository: StudentRepository,
-        subject_repository: SubjectRepository
+        subject_repository: SubjectRepository,
+        unit_of_work: UnitOfWork
     ):
         self.repository = repository
         self.student_repository = student_repository
         self.subject_repository = subject_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, grade_data: Grade) -> Grade:
 
@@ -25,10 +29,17 @@ class CreateGradeUseCase:
             raise ResourceNotFoundException(f"Student with ID {grade_data.student_id} not found.")
         if not self.subject_repository.exists(grade_data.subject_id):
             raise ResourceNotFoundException(f"Course with ID {grade_data.subject_id} not found.")
+        if self.repository.exists_for_student_and_subject(grade_data.student_id, grade_data.subject_id):
+            raise CannotCreateException(
+                f"Student with ID {grade_data.student_id} already has a grade for course with ID {grade_data.subject_id}."
+            )
         
-        created_grade = self.repository.create(grade_data)
-        
-        if not created_grade:
-            raise CannotCreateException("Cannot create grade")
+        with self.unit_of_work:
+            created_grade = self.repository.create(grade_data)
+
+            if not created_grade:
+                raise CannotCreateException("Cannot create grade")
+
+            self.unit_of_work.commit()
         
         return created_grade
@@ -0,0 +1,74 @@
+from typing import List, Tuple
+
+from application.unit_of_work import UnitOfWork
+
+from domain.entities.grade import Grade, GradeBulkResult, GradeRowError
+from domain.repositories.grade_repository import GradeRepository
+
+def split_valid_grades(grades_data: List[Grade]) -> Tuple[List[GradeRowError], List[Grade], List[int]]:
+    """
+    Checks the rows of a bulk grade import that need no database access.
+
+    Args:
+        grades_data (List[Grade]): The grades to create.
+
+    Returns:
+        Tuple[List[GradeRowError], List[Grade], List[int]]: The errors of the
+        invalid rows, the valid grades and the 1-based row of each valid grade.
+    """
+    errors: List[GradeRowError] = []
+    valid_grades: List[Grade] = []
+    valid_rows: List[int] = []
+
+    for row, grade in enumerate(grades_data, start=1):
+        if not grade.student_id or not grade.subject_id:
+            errors.append(GradeRowError(row=row, message="Student ID and Course ID are required."))
+        elif grade.value is None or not 0 <= grade.value <= 100:
+            errors.append(GradeRowError(row=row, message="Value must be a number between 0 and 100."))
+        else:
+            valid_grades.append(grade)
+            valid_rows.append(row)
+
+    return errors, valid_grades, valid_rows
+
+def merge_bulk_result(errors: List[GradeRowError], result: GradeBulkResult, valid_rows: List[int]) -> GradeBulkResult:
+    """
+    Adds the rows the repository skipped to the ones rejected beforehand.
+
+    Args:
+        errors (List[GradeRowError]): The errors of the invalid rows.
+        result (GradeBulkResult): The result of creating the valid grades, whose
+        rows are positions among them.
+        valid_rows (List[int]): The 1-based row of each valid grade.
+
+    Returns:
+        GradeBulkResult: The grades created and the errors of every row, by row.
+    """
+    errors = errors + [
+        GradeRowError(row=valid_rows[error.row - 1], message=error.message)
+        for error in result.errors
+    ]
+    errors.sort(key=lambda error: error.row)
+
+    return GradeBulkResult(created=result.created, errors=errors)
+
+class CreateGradesBulkUseCase:
+    def __init__(self, repository: GradeRepository, unit_of_work: UnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, grades_data: List[Grade]) -> GradeBulkResult:
+        """
+        Create every valid grade in a single transaction. Invalid rows are
+        skipped and reported with their 1-based position in grades_data.
+        """
+        errors, valid_grades, valid_rows = split_valid_grades(grades_data)
+
+        if not valid_grades:
+            return GradeBulkResult(created=0, errors=errors)
+
+        with self.unit_of_work:
+            result = self.repository.create_many(valid_grades)
+            self.unit_of_work.commit()
+
+        return merge_bulk_result(errors, result, valid_rows)
@@ -1,16 +1,18 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.repositories.grade_repository import GradeRepository
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
-from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
 
 class DeleteGradeUseCase:
-    def __init__(self, repository: GradeRepository):
+    def __init__(self, repository: GradeRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, grade_id: int):
-        if not self.repository.exists(grade_id):
-            raise ResourceNotFoundException("Grade cannot be found by id")
-        
-        grade_deleted = self.repository.delete(grade_id)
+        with self.unit_of_work:
+            grade_deleted = self.repository.delete(grade_id)
+
+            if not grade_deleted:
+                raise ResourceNotFoundException("Grade cannot be found by id")
 
-        if not grade_deleted:
-            raise CannotDeleteResourceException("Cannot delete grade successfully")
\ No newline at end of file
+            self.unit_of_work.commit()
@@ -16,18 +16,28 @@ class GetGradeUseCase:
         
         return grade_obtained
     
+    def execute_by_ids(self, grade_ids: List[int]) -> List[Grade | None]:
+        """
+        Get the grades with the given IDs in the same order, with None for the ones not found.
+        """
+        grades_by_id = {grade.id: grade for grade in self.repository.get_many(grade_ids)}
+
+        return [grades_by_id.get(grade_id) for grade_id in grade_ids]
+
     def execute_all(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Grade]:
         grades_obtained = self.repository.get_all(
             page_size=page_size,
             page=page,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
         )
         
         return grades_obtained
@@ -0,0 +1,74 @@
+from typing import Optional, Tuple, List
+
+from domain.entities.grade import GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics
+from domain.entities.student import StudentReportDashboard
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_report_version_repository import AsyncReportVersionRepository
+
+class AsyncGetReportUseCase:
+    def __init__(
+        self,
+        grade_repository: AsyncGradeRepository,
+        student_repository: AsyncStudentRepository,
+        report_version_repository: AsyncReportVersionRepository
+    ):
+        self.grade_repository = grade_repository
+        self.student_repository = student_repository
+        self.report_version_repository = report_version_repository
+
+    async def get_student_report_version(self, student_id: str) -> int | None:
+        """
+        Get the version of the report of a student, which changes whenever its content does.
+        """
+        return await self.report_version_repository.get_student_version(student_id)
+
+    async def get_subject_report_version(self, subject_id: str) -> int | None:
+        """
+        Get the version of the report of a subject, which changes whenever its content does.
+        """
+        return await self.report_version_repository.get_subject_version(subject_id)
+
+    async def execute_by_student_id(self, student_id: str) -> Tuple[List[GradeToShowStudent], float]:
+        grades_obtained = await self.grade_repository.get_student_grades_to_show(student_id)
+        student_average = await self.student_repository.get_average_by_student_id(student_id)
+
+        if not grades_obtained or student_average is None:
+            raise ResourceNotFoundException(f"Cannot fount data for student with ID '{student_id}'")
+
+        return grades_obtained, student_average
+
+    async def execute_by_subject_id(
+        self,
+        subject_id: str,
+        include_grades: bool = True
+    ) -> Tuple[List[GradeToShowSubject], SubjectGradeStatistics]:
+        statistics = await self.grade_repository.get_subject_grade_statistics(subject_id)
+
+        if not statistics:
+            raise ResourceNotFoundException(f"Cannot found data for subject with ID '{subject_id}'")
+
+        grades_obtained: List[GradeToShowSubject] = []
+        if include_grades:
+            grades_obtained = await self.grade_repository.get_subject_grades_to_show(subject_id) or []
+
+        return grades_obtained, statistics
+
+    async def execute_all_students_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        students_dashboard_list = await self.student_repository.get_all_for_dashboard(
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+
+        return students_dashboard_list
@@ -1,19 +1,34 @@
 from typing import Optional, Tuple, List
 
-from domain.entities.grade import GradeToShowStudent, GradeToShowSubject
+from domain.entities.grade import GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics
 from domain.entities.student import StudentReportDashboard
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 from domain.repositories.grade_repository import GradeRepository
 from domain.repositories.student_repository import StudentRepository
+from domain.repositories.report_version_repository import ReportVersionRepository
 
 class GetReportUseCase:
     def __init__(
         self,
         grade_repository: GradeRepository,
-        student_repository: StudentRepository
+        student_repository: StudentRepository,
+        report_version_repository: ReportVersionRepository
     ):
         self.grade_repository = grade_repository
         self.student_repository = student_repository
+        self.report_version_repository = report_version_repository
+
+    def get_student_report_version(self, student_id: str) -> int | None:
+        """
+        Get the version of the report of a student, which changes whenever its content does.
+        """
+        return self.report_version_repository.get_student_version(student_id)
+
+    def get_subject_report_version(self, subject_id: str) -> int | None:
+        """
+        Get the version of the report of a subject, which changes whenever its content does.
+        """
+        return self.report_version_repository.get_subject_version(subject_id)
 
     def execute_by_student_id(self, student_id: str) -> Tuple[List[GradeToShowStudent], float]:
         grades_obtained = self.grade_repository.get_student_grades_to_show(student_id)
@@ -24,50 +39,36 @@ class GetReportUseCase:
         
         return grades_obtained, student_average
     
-    def execute_by_subject_id(self, subject_id: str) -> Tuple[List[GradeToShowSubject], float]:
-        grades_obtained = self.grade_repository.get_subject_grades_to_show(subject_id)
+    def execute_by_subject_id(
+        self,
+        subject_id: str,
+        include_grades: bool = True
+    ) -> Tuple[List[GradeToShowSubject], SubjectGradeStatistics]:
+        statistics = self.grade_repository.get_subject_grade_statistics(subject_id)
 
-        if not grades_obtained:
+        if not statistics:
             raise ResourceNotFoundException(f"Cannot found data for subject with ID '{subject_id}'")
         
-        value_counter: int = 0
-        average: float = 0.0
-        for grade in grades_obtained:
-            value_counter += grade.value
-
-        average = value_counter / len(grades_obtained)
+        grades_obtained: List[GradeToShowSubject] = []
+        if include_grades:
+            grades_obtained = self.grade_repository.get_subject_grades_to_show(subject_id) or []
 
-        return grades_obtained, average
+        return grades_obtained, statistics
     
     def execute_all_students_dashboard(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[StudentReportDashboard]:
-        students_obtained = self.student_repository.get_all(
+        students_dashboard_list = self.student_repository.get_all_for_dashboard(
             page_size=page_size,
             page=page,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
         )
-        
-        students_dashboard_list: List[StudentReportDashboard] = []
-        for student in students_obtained:
-            student_status = self.grade_repository.is_regular_student(student.id)
-
-            student_for_dashboard = StudentReportDashboard(
-                id=student.id,
-                name=student.name,
-                lastname=student.lastname,
-                email=student.email,
-                semester=student.semester,
-                average=student.average,
-                status=student_status
-            )
-
-            students_dashboard_list.append(student_for_dashboard)
 
         return students_dashboard_list
-
@@ -0,0 +1,28 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.entities.student import Student
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_student_id_repository import AsyncStudentIdRepository
+from domain.exceptions.cannot_create_exception import CannotCreateException
+
+class AsyncCreateStudentUseCase:
+    def __init__(self, repository: AsyncStudentRepository, id_repository: AsyncStudentIdRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.id_repository = id_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, student_data: Student) -> Student:
+        student_data.id = await self.generate_student_id()
+
+        async with self.unit_of_work:
+            created_student = await self.repository.create(student_data)
+
+            if not created_student:
+                raise CannotCreateException("Cannot create student")
+
+            await self.unit_of_work.commit()
+
+        return created_student
+
+    async def generate_student_id(self, year: int = 2025) -> str:
+        return (await self.id_repository.next_ids(year))[0]
@@ -0,0 +1,38 @@
+from typing import List
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.use_cases.students.create_students_bulk import assign_student_ids, split_valid_students
+
+from domain.entities.student import Student, StudentBulkResult
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.repositories.async_student_id_repository import AsyncStudentIdRepository
+
+class AsyncCreateStudentsBulkUseCase:
+    def __init__(self, repository: AsyncStudentRepository, id_repository: AsyncStudentIdRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.id_repository = id_repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, students_data: List[Student], year: int = 2025) -> StudentBulkResult:
+        """
+        Create every valid student in a single transaction, with IDs reserved
+        in one batch. Invalid rows are skipped and reported with their 1-based
+        position in students_data.
+        """
+        errors, valid_students, valid_rows = split_valid_students(students_data)
+
+        if not valid_students:
+            return StudentBulkResult(created=0, ids=[None] * len(students_data), errors=errors)
+
+        ids = assign_student_ids(
+            valid_students,
+            valid_rows,
+            await self.id_repository.next_ids(year, len(valid_students)),
+            len(students_data)
+        )
+
+        async with self.unit_of_work:
+            await self.repository.create_many(valid_students)
+            await self.unit_of_work.commit()
+
+        return StudentBulkResult(created=len(valid_students), ids=ids, errors=errors)
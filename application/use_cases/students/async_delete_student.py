@@ -0,0 +1,18 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncDeleteStudentUseCase:
+    def __init__(self, repository: AsyncStudentRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, student_id: str):
+        async with self.unit_of_work:
+            student_deleted = await self.repository.delete(student_id)
+
+            if not student_deleted:
+                raise ResourceNotFoundException("Student cannot be found by id")
+
+            await self.unit_of_work.commit()
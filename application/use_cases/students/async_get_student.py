@@ -0,0 +1,50 @@
+from typing import List, Optional
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.entities.student import Student
+
+class AsyncGetStudentUseCase:
+    def __init__(self, student_repository: AsyncStudentRepository):
+        self.repository = student_repository
+
+    async def execute_by_id(self, student_id: str) -> Student:
+        student_obtained = await self.repository.get_by_id(student_id)
+
+        if not student_obtained:
+            raise ResourceNotFoundException("Student cannot be found by id")
+
+        return student_obtained
+
+    async def execute_by_ids(self, student_ids: List[str]) -> List[Student | None]:
+        """
+        Get the students with the given IDs in the same order, with None for the ones not found.
+        """
+        students_by_id = {student.id: student for student in await self.repository.get_many(student_ids)}
+
+        return [students_by_id.get(student_id) for student_id in student_ids]
+
+    async def execute_by_semester(self, students_semester: int) -> List[Student]:
+        students_obtained = await self.repository.get_by_semester(students_semester)
+
+        if not students_obtained:
+            raise ResourceNotFoundException("No students found by semester")
+
+        return students_obtained
+
+    async def execute_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> list[Student]:
+        students_obtained = await self.repository.get_all(
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+
+        return students_obtained
@@ -0,0 +1,21 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_student_repository import AsyncStudentRepository
+from domain.entities.student import Student
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncUpdateStudentUseCase:
+    def __init__(self, repository: AsyncStudentRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, student_data: Student) -> Student:
+        async with self.unit_of_work:
+            updated_student = await self.repository.update(student_data)
+
+            if not updated_student:
+                raise ResourceNotFoundException("Student cannot be found by id")
+
+            await self.unit_of_work.commit()
+
+        return updated_student
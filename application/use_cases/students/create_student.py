@@ -1,30 +1,28 @@
-import random
+from application.unit_of_work import UnitOfWork
 
 from domain.entities.student import Student
 from domain.repositories.student_repository import StudentRepository
+from domain.repositories.student_id_repository import StudentIdRepository
 from domain.exceptions.cannot_create_exception import CannotCreateException
 
 class CreateStudentUseCase:
-    def __init__(self, repository: StudentRepository):
+    def __init__(self, repository: StudentRepository, id_repository: StudentIdRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.id_repository = id_repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, student_data: Student) -> Student:
         student_data.id = self.generate_student_id()
 
-        created_student = self.repository.create(student_data)
+        with self.unit_of_work:
+            created_student = self.repository.create(student_data)
 
-        if not created_student:
-            raise CannotCreateException("Cannot create student")
+            if not created_student:
+                raise CannotCreateException("Cannot create student")
+
+            self.unit_of_work.commit()
             
         return created_student
     
     def generate_student_id(self, year: int = 2025) -> str:
-        prefix = f"A{str(year)[-2:]}00"
-        random_digits = f"{random.randint(0, 9999):04d}"
-        new_id = prefix + random_digits
-
-        if self.repository.exists(new_id):
-            return self.generate_student_id(year)
-        
-        return new_id
-        
\ No newline at end of file
+        return self.id_repository.next_ids(year)[0]
@@ -0,0 +1,112 @@
+from typing import List, Tuple
+
+from pydantic import EmailStr, TypeAdapter, ValidationError
+
+from application.unit_of_work import UnitOfWork
+
+from domain.entities.student import Student, StudentBulkResult, StudentRowError
+from domain.repositories.student_repository import StudentRepository
+from domain.repositories.student_id_repository import StudentIdRepository
+
+# The same check POST /students/ runs, so bulk rows are accepted exactly when single ones are
+EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+def normalize_email(email: object) -> str | None:
+    """
+    Validates email as EmailStr does.
+
+    Args:
+        email (object): The email of a row.
+
+    Returns:
+        str | None: The normalized email, or None if it is not a valid address.
+    """
+    if not isinstance(email, str):
+        return None
+
+    try:
+        return EMAIL_ADAPTER.validate_python(email)
+    except ValidationError:
+        return None
+
+def split_valid_students(students_data: List[Student]) -> Tuple[List[StudentRowError], List[Student], List[int]]:
+    """
+    Checks the rows of a bulk student import, normalizing the email of the valid ones.
+
+    Args:
+        students_data (List[Student]): The students to create.
+
+    Returns:
+        Tuple[List[StudentRowError], List[Student], List[int]]: The errors of the
+        invalid rows, the valid students and the 1-based row of each valid student.
+    """
+    emails = [normalize_email(student.email) for student in students_data]
+    errors: List[StudentRowError] = []
+    valid_students: List[Student] = []
+    valid_rows: List[int] = []
+
+    for row, (student, email) in enumerate(zip(students_data, emails), start=1):
+        if not student.name or not student.lastname:
+            errors.append(StudentRowError(row=row, message="Name and lastname are required."))
+        elif email is None:
+            errors.append(StudentRowError(row=row, message="Email must be a valid email address."))
+        elif student.semester is None:
+            errors.append(StudentRowError(row=row, message="Semester must be a whole number."))
+        else:
+            # Stored as POST /students/ stores it, normalized by EmailStr
+            student.email = email
+            valid_students.append(student)
+            valid_rows.append(row)
+
+    return errors, valid_students, valid_rows
+
+def assign_student_ids(students: List[Student], rows: List[int], student_ids: List[str], row_count: int) -> List[str | None]:
+    """
+    Gives the reserved IDs to the valid students.
+
+    Args:
+        students (List[Student]): The valid students.
+        rows (List[int]): The 1-based row of each valid student.
+        student_ids (List[str]): One reserved ID per valid student.
+        row_count (int): The rows of the import.
+
+    Returns:
+        List[str | None]: The ID of every row in input order, None for the invalid ones.
+    """
+    ids: List[str | None] = [None] * row_count
+
+    for row, student, student_id in zip(rows, students, student_ids):
+        student.id = student_id
+        ids[row - 1] = student_id
+
+    return ids
+
+class CreateStudentsBulkUseCase:
+    def __init__(self, repository: StudentRepository, id_repository: StudentIdRepository, unit_of_work: UnitOfWork):
+        self.repository = repository
+        self.id_repository = id_repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, students_data: List[Student], year: int = 2025) -> StudentBulkResult:
+        """
+        Create every valid student in a single transaction, with IDs reserved
+        in one batch. Invalid rows are skipped and reported with their 1-based
+        position in students_data.
+        """
+        errors, valid_students, valid_rows = split_valid_students(students_data)
+
+        if not valid_students:
+            return StudentBulkResult(created=0, ids=[None] * len(students_data), errors=errors)
+
+        ids = assign_student_ids(
+            valid_students,
+            valid_rows,
+            self.id_repository.next_ids(year, len(valid_students)),
+            len(students_data)
+        )
+
+        with self.unit_of_work:
+            self.repository.create_many(valid_students)
+            self.unit_of_work.commit()
+
+        return StudentBulkResult(created=len(valid_students), ids=ids, errors=errors)
@@ -1,16 +1,18 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.repositories.student_repository import StudentRepository
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
-from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
 
 class DeleteStudentUseCase:
-    def __init__(self, repository: StudentRepository):
+    def __init__(self, repository: StudentRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, student_id: str):
-        if not self.repository.exists(student_id):
-            raise ResourceNotFoundException("Student cannot be found by id")
-        
-        student_deleted = self.repository.delete(student_id)
+        with self.unit_of_work:
+            student_deleted = self.repository.delete(student_id)
+
+            if not student_deleted:
+                raise ResourceNotFoundException("Student cannot be found by id")
 
-        if not student_deleted:
-            raise CannotDeleteResourceException("Cannot delete student successfully")
\ No newline at end of file
+            self.unit_of_work.commit()
@@ -15,6 +15,14 @@ class GetStudentUseCase:
         
         return student_obtained
     
+    def execute_by_ids(self, student_ids: List[str]) -> List[Student | None]:
+        """
+        Get the students with the given IDs in the same order, with None for the ones not found.
+        """
+        students_by_id = {student.id: student for student in self.repository.get_many(student_ids)}
+
+        return [students_by_id.get(student_id) for student_id in student_ids]
+
     def execute_by_semester(self, students_semester: int) -> List[Student]:
         students_obtained = self.repository.get_by_semester(students_semester)
 
@@ -28,13 +36,15 @@ class GetStudentUseCase:
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> list[Student]:
         students_obtained = self.repository.get_all(
             page_size=page_size,
             page=page,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
         )
         
         return students_obtained
\ No newline at end of file
@@ -0,0 +1,34 @@
+from application.unit_of_work import UnitOfWork
+
+from domain.repositories.student_average_repository import StudentAverageRepository
+from domain.repositories.student_dashboard_repository import StudentDashboardRepository
+from domain.repositories.report_version_repository import ReportVersionRepository
+
+class RebuildStudentAveragesUseCase:
+    def __init__(
+        self,
+        repository: StudentAverageRepository,
+        student_dashboard_repository: StudentDashboardRepository,
+        report_version_repository: ReportVersionRepository,
+        unit_of_work: UnitOfWork
+    ):
+        self.repository = repository
+        self.student_dashboard_repository = student_dashboard_repository
+        self.report_version_repository = report_version_repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self) -> int:
+        """
+        Recompute every student average from scratch, then the students dashboard
+        built from them. Returns the number of students updated.
+        """
+        # One transaction, so readers never see the new averages next to the old dashboard
+        with self.unit_of_work:
+            students_updated = self.repository.rebuild()
+
+            # Any student report may have changed
+            self.report_version_repository.bump_all_students()
+            self.student_dashboard_repository.rebuild()
+            self.unit_of_work.commit()
+
+        return students_updated
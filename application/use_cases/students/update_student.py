@@ -1,19 +1,21 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.repositories.student_repository import StudentRepository
 from domain.entities.student import Student
-from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 
 class UpdateStudentUseCase:
-    def __init__(self, repository: StudentRepository):
+    def __init__(self, repository: StudentRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, student_data: Student) -> Student:
-        if not self.repository.exists(student_data.id):
-            raise ResourceNotFoundException("Student cannot be found by id")
+        with self.unit_of_work:
+            updated_student = self.repository.update(student_data)
 
-        updated_student = self.repository.update(student_data)
-        
-        if not updated_student:
-           raise CannotUpdateResourceException("Student cannot be updated")
+            if not updated_student:
+                raise ResourceNotFoundException("Student cannot be found by id")
+
+            self.unit_of_work.commit()
         
-        return updated_student
\ No newline at end of file
+        return updated_student
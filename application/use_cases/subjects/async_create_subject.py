@@ -0,0 +1,33 @@
+import uuid
+
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.entities.subject import Subject
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+from domain.exceptions.cannot_create_exception import CannotCreateException
+
+class AsyncCreateSubjectUseCase:
+    def __init__(self, repository: AsyncSubjectRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, subject_data: Subject) -> Subject:
+        subject_data.id = await self.generate_subject_id()
+
+        async with self.unit_of_work:
+            created_subject = await self.repository.create(subject_data)
+
+            if not created_subject:
+                raise CannotCreateException("Cannot create subject successfully")
+
+            await self.unit_of_work.commit()
+
+        return created_subject
+
+    async def generate_subject_id(self) -> str:
+        new_id = str(uuid.uuid4())
+
+        if await self.repository.exists(new_id):
+            return await self.generate_subject_id()
+
+        return new_id
@@ -0,0 +1,18 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncDeleteSubjectUseCase:
+    def __init__(self, repository: AsyncSubjectRepository, unit_of_work: AsyncUnitOfWork):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, subject_id: str):
+        async with self.unit_of_work:
+            subject_deleted = await self.repository.delete(subject_id)
+
+            if not subject_deleted:
+                raise ResourceNotFoundException("Subject cannot be found by id")
+
+            await self.unit_of_work.commit()
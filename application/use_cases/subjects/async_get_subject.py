@@ -0,0 +1,51 @@
+from typing import List, Optional
+
+from domain.entities.subject import Subject
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncGetSubjectUseCase:
+    def __init__(self, repository: AsyncSubjectRepository):
+        self.respository = repository
+
+    async def execute_by_id(self, subject_id: str) -> Subject:
+        subject_obtained = await self.respository.get_by_id(subject_id)
+
+        if not subject_obtained:
+            raise ResourceNotFoundException("Subject cannot be found by id")
+
+        return subject_obtained
+
+    async def execute_by_ids(self, subject_ids: List[str]) -> List[Subject | None]:
+        """
+        Get the subjects with the given IDs in the same order, with None for the ones not found.
+        """
+        subjects_by_id = {subject.id: subject for subject in await self.respository.get_many(subject_ids)}
+
+        return [subjects_by_id.get(subject_id) for subject_id in subject_ids]
+
+    async def execute_by_semester(self, subjects_semester: int) -> list[Subject]:
+        subjects_obtained = await self.respository.get_by_semester(subjects_semester)
+
+        if not subjects_obtained:
+            raise ResourceNotFoundException("Subject cannot be found by id")
+
+        return subjects_obtained
+
+    async def execute_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Subject]:
+        subjects_obtained = await self.respository.get_all(
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+
+        return subjects_obtained
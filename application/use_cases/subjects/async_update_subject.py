@@ -0,0 +1,21 @@
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+from domain.entities.subject import Subject
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+
+class AsyncUpdateSubjectUseCase:
+    def __init__(self, repository: AsyncSubjectRepository, unit_of_work: AsyncUnitOfWork):
+        self.respository = repository
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, subject_data: Subject) -> Subject:
+        async with self.unit_of_work:
+            updated_subject = await self.respository.update(subject_data)
+
+            if not updated_subject:
+                raise ResourceNotFoundException("Subject cannot be found by id")
+
+            await self.unit_of_work.commit()
+
+        return updated_subject
@@ -1,20 +1,26 @@
 import uuid
 
+from application.unit_of_work import UnitOfWork
+
 from domain.entities.subject import Subject
 from domain.repositories.subject_repository import SubjectRepository
 from domain.exceptions.cannot_create_exception import CannotCreateException
 
 class CreateSubjectUseCase:
-    def __init__(self, repository: SubjectRepository):
+    def __init__(self, repository: SubjectRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, subject_data: Subject) -> Subject:
         subject_data.id = self.generate_subject_id()
 
-        created_subject = self.repository.create(subject_data)
+        with self.unit_of_work:
+            created_subject = self.repository.create(subject_data)
+
+            if not created_subject:
+                raise CannotCreateException("Cannot create subject successfully")
 
-        if not created_subject:
-            raise CannotCreateException("Cannot create subject successfully")
+            self.unit_of_work.commit()
         
         return created_subject
         
@@ -1,16 +1,18 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.repositories.subject_repository import SubjectRepository
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
-from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
 
 class DeleteSubjectUseCase:
-    def __init__(self, repository: SubjectRepository):
+    def __init__(self, repository: SubjectRepository, unit_of_work: UnitOfWork):
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, subject_id: str):
-        if not self.repository.exists(subject_id):
-            raise ResourceNotFoundException("Subject cannot be found by id")
-        
-        subject_deleted = self.repository.delete(subject_id)
+        with self.unit_of_work:
+            subject_deleted = self.repository.delete(subject_id)
+
+            if not subject_deleted:
+                raise ResourceNotFoundException("Subject cannot be found by id")
 
-        if not subject_deleted:
-            raise CannotDeleteResourceException("Cannot delete subject successfully")
+            self.unit_of_work.commit()
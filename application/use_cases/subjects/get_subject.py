@@ -16,6 +16,14 @@ class GetSubjectUseCase:
         
         return subject_obtained
     
+    def execute_by_ids(self, subject_ids: List[str]) -> List[Subject | None]:
+        """
+        Get the subjects with the given IDs in the same order, with None for the ones not found.
+        """
+        subjects_by_id = {subject.id: subject for subject in self.respository.get_many(subject_ids)}
+
+        return [subjects_by_id.get(subject_id) for subject_id in subject_ids]
+
     def execute_by_semester(self, subjects_semester: int) -> list[Subject]:
         subjects_obtained = self.respository.get_by_semester(subjects_semester)
 
@@ -29,13 +37,15 @@ class GetSubjectUseCase:
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Subject]:
         subjects_obtained = self.respository.get_all(
             page_size=page_size,
             page=page,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
         )
         
         return subjects_obtained
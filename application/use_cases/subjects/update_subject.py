@@ -1,19 +1,21 @@
+from application.unit_of_work import UnitOfWork
+
 from domain.repositories.subject_repository import SubjectRepository
 from domain.entities.subject import Subject
-from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 
 class UpdateSubjectUseCase:
-    def __init__(self, repository: SubjectRepository):
+    def __init__(self, repository: SubjectRepository, unit_of_work: UnitOfWork):
         self.respository = repository
+        self.unit_of_work = unit_of_work
 
     def execute(self, subject_data: Subject) -> Subject:
-        if not self.respository.exists(subject_data.id):
-            raise ResourceNotFoundException("Subject cannot be found by id")
+        with self.unit_of_work:
+            updated_subject = self.respository.update(subject_data)
 
-        updated_subject = self.respository.update(subject_data)
-        
-        if not updated_subject:
-           raise CannotUpdateResourceException("Subject cannot be updated")
+            if not updated_subject:
+                raise ResourceNotFoundException("Subject cannot be found by id")
+
+            self.unit_of_work.commit()
         
-        return updated_subject
\ No newline at end of file
+        return updated_subject
@@ -0,0 +1,106 @@
+"""
+Measures the CPU cost of compressing representative list payloads against the
+bytes it saves. The pages of /grades/ and /reports/students are built from
+synthetic entities with the same serializers the routers use, in both the
+default and the columnar format, and compressed with every gzip level given
+and with brotli when the package is installed:
+
+    python -m benchmarks.compression --rows 1000 --levels 1 6 9
+"""
+import argparse
+import random
+import statistics
+import time
+
+from typing import Callable, List, Tuple
+
+from domain.entities.grade import Grade
+from domain.entities.student import StudentReportDashboard
+
+from infrastructure.middleware.compression import BrotliCompressor, GzipCompressor, brotli
+from infrastructure.schemas.grades_schema import GRADE_LIST_SERIALIZER
+from infrastructure.schemas.report_schema import STUDENTS_DASHBOARD_LIST_SERIALIZER
+
+NAMES = ["Ana", "Luis", "Maria", "Jose", "Sofia", "Diego"]
+LASTNAMES = ["Lopez", "Perez", "Garcia", "Hernandez", "Martinez"]
+
+def build_grades(rows: int) -> List[Grade]:
+    return [
+        Grade(
+            id=index,
+            student_id=f"A25{index // 5:06d}",
+            subject_id=f"{random.getrandbits(128):032x}",
+            value=float(random.randint(0, 100))
+        )
+        for index in range(1, rows + 1)
+    ]
+
+def build_dashboard(rows: int) -> List[StudentReportDashboard]:
+    students = []
+
+    for index in range(1, rows + 1):
+        average = round(random.uniform(0, 100), 2)
+        students.append(StudentReportDashboard(
+            id=f"A25{index:06d}",
+            name=random.choice(NAMES),
+            lastname=random.choice(LASTNAMES),
+            email=f"student{index}@example.com",
+            semester=random.randint(1, 9),
+            status=average >= 70,
+            average=average,
+            grades_count=random.randint(0, 8),
+            credits_attempted=random.randint(0, 48)
+        ))
+
+    return students
+
+def measure(payload: bytes, build_compressor: Callable, repeat: int) -> Tuple[float, int]:
+    """
+    Compresses payload repeat times and returns the median milliseconds spent
+    and the compressed size.
+    """
+    times = []
+    compressed = b""
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = build_compressor().finish(payload)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times) * 1e3, len(compressed)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="items per page")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per payload and coding")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9], help="gzip levels to measure")
+    parser.add_argument("--brotli-qualities", type=int, nargs="+", default=[1, 4, 11], help="brotli qualities to measure")
+    args = parser.parse_args()
+
+    random.seed(0)
+    grades = build_grades(args.rows)
+    students = build_dashboard(args.rows)
+    payloads = [
+        ("/grades/", GRADE_LIST_SERIALIZER.to_json(grades)),
+        ("/grades/ columnar", GRADE_LIST_SERIALIZER.to_columnar_json(grades)),
+        ("/reports/students", STUDENTS_DASHBOARD_LIST_SERIALIZER.to_json(students)),
+        ("/reports/students columnar", STUDENTS_DASHBOARD_LIST_SERIALIZER.to_columnar_json(students)),
+    ]
+
+    codings = [(f"gzip-{level}", lambda level=level: GzipCompressor(level)) for level in args.levels]
+    if brotli is not None:
+        codings += [(f"br-{quality}", lambda quality=quality: BrotliCompressor(quality)) for quality in args.brotli_qualities]
+    else:
+        print("brotli is not installed, only gzip is measured\n")
+
+    print(f"{'payload':<28} {'coding':<8} {'bytes':>10} {'compressed':>11} {'saved':>7} {'ms':>8} {'MB/s':>8}")
+    for name, payload in payloads:
+        print(f"{name:<28} {'identity':<8} {len(payload):>10} {len(payload):>11} {0:>6.1f}% {0:>8.3f} {'-':>8}")
+        for coding, build_compressor in codings:
+            elapsed, size = measure(payload, build_compressor, args.repeat)
+            saved = 100 * (1 - size / len(payload))
+            throughput = len(payload) / 1e6 / (elapsed / 1e3) if elapsed else float("inf")
+            print(f"{name:<28} {coding:<8} {len(payload):>10} {size:>11} {saved:>6.1f}% {elapsed:>8.3f} {throughput:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Enrolls many students at once through POST /students/ and checks that every
+request got its own ID. The API is started with uvicorn and --workers
+processes, each handing out IDs from its own blocks, unless --base-url points
+to a running one:
+
+    python -m benchmarks.concurrent_enrollment --students 5000 --concurrency 64 --workers 4
+
+The run fails when a request errors or two students share an ID. The students
+created are removed at the end unless --keep-data is given.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import httpx
+
+from sqlalchemy import delete
+
+from infrastructure.db.database import SessionLocal
+from infrastructure.db.models import StudentModel
+
+from benchmarks.load_test import start_server, summarize
+
+async def enroll(base_url: str, students: int, concurrency: int) -> Tuple[List[str], List[float], Dict[int, int], float]:
+    """
+    Creates students from concurrency workers and returns the IDs received,
+    the latency of every request, the count of every status code and the
+    seconds the run took.
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    next_index = iter(range(students))
+    ids: List[str] = []
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        async def worker():
+            for index in next_index:
+                start = time.perf_counter()
+                response = await client.post("/students/", json={
+                    "name": "Enrollment",
+                    "lastname": f"Student {index}",
+                    "email": f"enrollment{index}@example.com",
+                    "semester": 1
+                })
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 201:
+                    ids.append(response.json()["id"])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, students))))
+
+    return ids, latencies, statuses, time.perf_counter() - start
+
+def remove_students(ids: List[str]) -> None:
+    db = SessionLocal()
+
+    try:
+        db.execute(delete(StudentModel).where(StudentModel.id.in_(ids)))
+        db.commit()
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4, help="uvicorn processes of the API started by the benchmark")
+    parser.add_argument("--base-url", help="URL of a running API, one is started when missing")
+    parser.add_argument("--port", type=int, default=8766, help="port of the API started by the benchmark")
+    parser.add_argument("--keep-data", action="store_true", help="keep the students created")
+    args = parser.parse_args()
+
+    server = None if args.base_url else start_server(args.port, args.workers)
+    base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+
+    try:
+        ids, latencies, statuses, elapsed = asyncio.run(enroll(base_url, args.students, args.concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    duplicates = [student_id for student_id, count in Counter(ids).items() if count > 1]
+    summary = summarize(latencies, statuses, elapsed)
+    print(f"{len(ids)} students created, {summary['errors']} errors, {len(duplicates)} duplicated IDs")
+    print(f"p50 {summary['p50_ms']:.2f} ms  p99 {summary['p99_ms']:.2f} ms  {summary['throughput_rps']:.1f} req/s")
+
+    if not args.keep_data:
+        remove_students(ids)
+
+    if duplicates or summary["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Measures the per-row cost of serializing a page of grades, comparing the
+original path of the list endpoints with the row projection path:
+
+- orm: loads GradeModel instances, maps each one to a Grade entity, builds a
+  GradeResponseDTO per item and lets FastAPI validate the list again through
+  response_model before encoding it, as the routers used to do.
+- rows: selects the grade columns, maps the rows to Grade entities and dumps
+  them with the pre-built GRADE_LIST_SERIALIZER, as build_list_response does.
+- columnar: same as rows, dumped in the ?format=columnar layout.
+
+The fetch and serialize phases are timed separately, and the size of the
+encoded page is reported. It runs against the
+configured database, seeding --rows synthetic grades in a transaction that is
+rolled back at the end, so nothing is left behind:
+
+    python -m benchmarks.list_serialization --rows 1000 --repeat 20
+"""
+import argparse
+import json
+import statistics
+import time
+
+from typing import Callable, List, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from infrastructure.db.database import SessionLocal
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.db.queries import build_grade_rows_query
+from infrastructure.mappers.grade_mappers import map_grade_model_to_entity
+from infrastructure.schemas.grades_schema import GradeResponseDTO, GRADE_LIST_SERIALIZER
+
+RESPONSE_MODEL_ADAPTER = TypeAdapter(List[GradeResponseDTO])
+BENCHMARK_ID_PREFIX = "benchmark-"
+
+def seed_grades(db: Session, rows: int) -> None:
+    """
+    Inserts rows grades of as many synthetic students for one synthetic subject,
+    without committing.
+    """
+    subject_id = f"{BENCHMARK_ID_PREFIX}subject"
+    student_ids = [f"{BENCHMARK_ID_PREFIX}{index:06d}" for index in range(rows)]
+
+    db.execute(insert(SubjectModel), [{
+        "id": subject_id,
+        "name": "Benchmark",
+        "description": "Synthetic subject",
+        "credits": 5,
+        "semester": 1
+    }])
+    db.execute(insert(StudentModel), [
+        {
+            "id": student_id,
+            "name": "Benchmark",
+            "lastname": "Student",
+            "email": f"{student_id}@example.com",
+            "semester": 1,
+            "average": 0.0
+        }
+        for student_id in student_ids
+    ])
+    db.execute(insert(GradeModel), [
+        {"student_id": student_id, "subject_id": subject_id, "value": float(index % 101)}
+        for index, student_id in enumerate(student_ids)
+    ])
+
+def fetch_orm(db: Session, rows: int) -> list:
+    grade_models = (
+        db.query(GradeModel)
+        .filter(GradeModel.student_id.startswith(BENCHMARK_ID_PREFIX))
+        .order_by(GradeModel.id)
+        .limit(rows)
+        .all()
+    )
+    return [map_grade_model_to_entity(grade_model) for grade_model in grade_models]
+
+def fetch_rows(db: Session, rows: int) -> list:
+    grade_rows = db.execute(
+        build_grade_rows_query()
+        .where(GradeModel.student_id.startswith(BENCHMARK_ID_PREFIX))
+        .order_by(GradeModel.id)
+        .limit(rows)
+    ).all()
+    return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
+
+def serialize_orm(grades: list) -> bytes:
+    # Mirrors FastAPI's serialize_response: the returned DTOs are dumped,
+    # validated against response_model, dumped again and encoded by JSONResponse
+    response_content = [GradeResponseDTO.model_validate(grade).model_dump() for grade in grades]
+    value = RESPONSE_MODEL_ADAPTER.validate_python(response_content)
+    content = RESPONSE_MODEL_ADAPTER.dump_python(value, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def serialize_rows(grades: list) -> bytes:
+    return GRADE_LIST_SERIALIZER.to_json(grades)
+
+def serialize_columnar(grades: list) -> bytes:
+    return GRADE_LIST_SERIALIZER.to_columnar_json(grades)
+
+def measure(
+    db: Session,
+    rows: int,
+    repeat: int,
+    fetch: Callable[[Session, int], list],
+    serialize: Callable[[list], bytes]
+) -> Tuple[float, float, int, int]:
+    """
+    Runs fetch and serialize repeat times and returns the median microseconds
+    per row of each phase, along with the number of rows read and the size in
+    bytes of the encoded page.
+    """
+    fetch_times, serialize_times = [], []
+    grades = fetch(db, rows)
+    content = b""
+
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        grades = fetch(db, rows)
+        fetch_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        content = serialize(grades)
+        serialize_times.append(time.perf_counter() - start)
+
+    count = max(len(grades), 1)
+    return (
+        statistics.median(fetch_times) * 1e6 / count,
+        statistics.median(serialize_times) * 1e6 / count,
+        len(grades),
+        len(content)
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000, help="grades per page")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per path")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+
+    try:
+        seed_grades(db, args.rows)
+        if serialize_orm(fetch_orm(db, args.rows)) != serialize_rows(fetch_rows(db, args.rows)):
+            raise SystemExit("Both paths must produce the same JSON")
+
+        paths = (
+            ("orm", fetch_orm, serialize_orm),
+            ("rows", fetch_rows, serialize_rows),
+            ("columnar", fetch_rows, serialize_columnar)
+        )
+        print(f"{'path':<9} {'rows':>6} {'fetch us/row':>14} {'serialize us/row':>18} {'total us/row':>14} {'bytes':>10}")
+        for name, fetch, serialize in paths:
+            fetch_cost, serialize_cost, count, size = measure(db, args.rows, args.repeat, fetch, serialize)
+            print(f"{name:<9} {count:>6} {fetch_cost:>14.2f} {serialize_cost:>18.2f} {fetch_cost + serialize_cost:>14.2f} {size:>10}")
+    finally:
+        db.rollback()
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Load tests every router against a local database seeded with a synthetic
+dataset, and writes the throughput and latency percentiles of each endpoint
+to a JSON file that can be diffed between commits.
+
+The dataset (--students x --subjects, with --grades-per-student grades each)
+is generated from --seed, so every run reads the same rows. It is inserted with
+IDs prefixed by LOAD, replacing the rows of a previous run, and removed at the
+end unless --keep-data is given. The database is the one configured through
+the POSTGRES_* variables, and must be migrated with `alembic upgrade head`.
+
+Unless --base-url points to a running API, one is started with uvicorn on
+--port, in the DATABASE_MODE of the environment. Every endpoint receives
+--requests requests from --concurrency concurrent clients, one endpoint at a
+time, so the figures of an endpoint are not skewed by the others:
+
+    python -m benchmarks.load_test --students 2000 --subjects 40 --concurrency 16 --output load_test.json
+
+Besides the read endpoints, the run updates grades and students with PUT, which
+also exercises the average, dashboard, report version and cache invalidation
+paths. Creating and deleting resources is left out so the dataset stays fixed.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from sqlalchemy import delete, insert, select
+
+from infrastructure.db.database import SessionLocal, DATABASE_MODE
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.repositories.student_average_repository_impl import StudentAverageRepositoryImpl
+from infrastructure.repositories.student_dashboard_repository_impl import StudentDashboardRepositoryImpl
+
+LOAD_ID_PREFIX = "LOAD"
+SERVER_START_TIMEOUT_SECONDS = 30
+
+@dataclass
+class Dataset:
+    student_ids: List[str]
+    subject_ids: List[str]
+    grade_ids: List[int] = field(default_factory=list)
+    semesters: List[int] = field(default_factory=lambda: list(range(1, 10)))
+
+@dataclass
+class Endpoint:
+    name: str
+    method: str
+    build_request: Callable[[Dataset, int], Dict[str, Any]]
+    # Fraction of --requests sent to the endpoint, for the expensive ones
+    weight: float = 1.0
+
+def pick(values: List, index: int):
+    return values[index % len(values)]
+
+ENDPOINTS = [
+    Endpoint("GET /students/", "GET", lambda data, i: {"url": "/students/", "params": {"pageSize": 25, "current": i % 20 + 1}}),
+    Endpoint("GET /students/{id}", "GET", lambda data, i: {"url": f"/students/{pick(data.student_ids, i * 7)}"}),
+    Endpoint("GET /students/semester/{n}", "GET", lambda data, i: {"url": f"/students/semester/{pick(data.semesters, i)}"}, weight=0.2),
+    Endpoint("POST /students/batch-get", "POST", lambda data, i: {"url": "/students/batch-get", "json": {"ids": [pick(data.student_ids, i * 50 + offset) for offset in range(50)]}}),
+    Endpoint("PUT /students/{id}", "PUT", lambda data, i: {"url": f"/students/{pick(data.student_ids, i * 11)}", "json": {"semester": i % 9 + 1}}),
+    Endpoint("GET /subjects/", "GET", lambda data, i: {"url": "/subjects/", "params": {"pageSize": 25}}),
+    Endpoint("GET /subjects/{id}", "GET", lambda data, i: {"url": f"/subjects/{pick(data.subject_ids, i)}"}),
+    Endpoint("GET /subjects/semester/{n}", "GET", lambda data, i: {"url": f"/subjects/semester/{pick(data.semesters, i)}"}),
+    Endpoint("POST /subjects/batch-get", "POST", lambda data, i: {"url": "/subjects/batch-get", "json": {"ids": data.subject_ids[:50]}}),
+    Endpoint("GET /grades/", "GET", lambda data, i: {"url": "/grades/", "params": {"pageSize": 100, "current": i % 20 + 1}}),
+    Endpoint("GET /grades/ columnar", "GET", lambda data, i: {"url": "/grades/", "params": {"pageSize": 100, "current": i % 20 + 1, "format": "columnar"}}),
+    Endpoint("GET /grades/{id}", "GET", lambda data, i: {"url": f"/grades/{pick(data.grade_ids, i * 13)}"}),
+    Endpoint("GET /grades/student/{id}", "GET", lambda data, i: {"url": f"/grades/student/{pick(data.student_ids, i * 3)}"}),
+    Endpoint("GET /grades/subject/{id}", "GET", lambda data, i: {"url": f"/grades/subject/{pick(data.subject_ids, i)}"}, weight=0.2),
+    Endpoint("GET /grades/students/{id}", "GET", lambda data, i: {"url": f"/grades/students/{pick(data.student_ids, i * 5)}"}),
+    Endpoint("GET /grades/subjects/{id}", "GET", lambda data, i: {"url": f"/grades/subjects/{pick(data.subject_ids, i)}"}, weight=0.2),
+    Endpoint("POST /grades/batch-get", "POST", lambda data, i: {"url": "/grades/batch-get", "json": {"ids": [pick(data.grade_ids, i * 100 + offset) for offset in range(100)]}}),
+    Endpoint("PUT /grades/{id}", "PUT", lambda data, i: {"url": f"/grades/{pick(data.grade_ids, i * 17)}", "json": {"value": float(50 + i % 50)}}),
+    Endpoint("GET /reports/students", "GET", lambda data, i: {"url": "/reports/students", "params": {"pageSize": 25, "sorters[0][field]": "average", "sorters[0][order]": "desc"}}),
+    Endpoint("GET /reports/students/{id}/grades", "GET", lambda data, i: {"url": f"/reports/students/{pick(data.student_ids, i * 7)}/grades"}),
+    Endpoint("GET /reports/subjects/{id}/grades", "GET", lambda data, i: {"url": f"/reports/subjects/{pick(data.subject_ids, i)}/grades"}, weight=0.2),
+    Endpoint("GET /exports/grades.csv", "GET", lambda data, i: {"url": "/exports/grades.csv"}, weight=0.02),
+    Endpoint("GET /exports/students.ndjson", "GET", lambda data, i: {"url": "/exports/students.ndjson"}, weight=0.02),
+    Endpoint("GET /monitoring/pool", "GET", lambda data, i: {"url": "/monitoring/pool"}),
+    Endpoint("GET /monitoring/cache", "GET", lambda data, i: {"url": "/monitoring/cache"}),
+]
+
+def remove_dataset(db) -> None:
+    """Deletes the rows seeded by a previous run, students cascade to their stats and dashboard rows."""
+    load_students = select(StudentModel.id).where(StudentModel.id.startswith(LOAD_ID_PREFIX))
+    load_subjects = select(SubjectModel.id).where(SubjectModel.id.startswith(LOAD_ID_PREFIX))
+
+    db.execute(delete(GradeModel).where(
+        GradeModel.student_id.in_(load_students) | GradeModel.subject_id.in_(load_subjects)
+    ))
+    db.execute(delete(StudentModel).where(StudentModel.id.startswith(LOAD_ID_PREFIX)))
+    db.execute(delete(SubjectModel).where(SubjectModel.id.startswith(LOAD_ID_PREFIX)))
+    db.commit()
+
+def seed_dataset(students: int, subjects: int, grades_per_student: int, seed: int) -> Dataset:
+    """
+    Replaces the synthetic dataset, along with the averages and dashboard rows
+    of its students.
+    """
+    rng = random.Random(seed)
+    dataset = Dataset(
+        student_ids=[f"{LOAD_ID_PREFIX}{index:07d}" for index in range(students)],
+        subject_ids=[f"{LOAD_ID_PREFIX}-subject-{index:05d}" for index in range(subjects)]
+    )
+    db = SessionLocal()
+
+    try:
+        remove_dataset(db)
+        db.execute(insert(SubjectModel), [
+            {
+                "id": subject_id,
+                "name": f"Subject {index}",
+                "description": "Synthetic subject",
+                "credits": rng.randint(3, 8),
+                "semester": index % 9 + 1
+            }
+            for index, subject_id in enumerate(dataset.subject_ids)
+        ])
+        db.execute(insert(StudentModel), [
+            {
+                "id": student_id,
+                "name": f"Student {index}",
+                "lastname": rng.choice(["Lopez", "Perez", "Garcia", "Hernandez"]),
+                "email": f"{student_id.lower()}@example.com",
+                "semester": rng.randint(1, 9),
+                "average": 0.0
+            }
+            for index, student_id in enumerate(dataset.student_ids)
+        ])
+        grade_rows = [
+            {"student_id": student_id, "subject_id": subject_id, "value": float(rng.randint(0, 100))}
+            for student_id in dataset.student_ids
+            for subject_id in rng.sample(dataset.subject_ids, min(grades_per_student, subjects))
+        ]
+        dataset.grade_ids = list(db.scalars(insert(GradeModel).returning(GradeModel.id), grade_rows))
+
+        changes: Dict[str, Tuple[float, int]] = {}
+        for grade_row in grade_rows:
+            value_sum, count = changes.get(grade_row["student_id"], (0.0, 0))
+            changes[grade_row["student_id"]] = (value_sum + grade_row["value"], count + 1)
+
+        StudentAverageRepositoryImpl(db).apply_grade_changes(changes)
+        StudentDashboardRepositoryImpl(db).refresh_students(dataset.student_ids)
+        db.commit()
+    finally:
+        db.close()
+
+    return dataset
+
+def summarize(latencies: List[float], statuses: Dict[int, int], elapsed: float) -> Dict[str, Any]:
+    """
+    Builds the figures of an endpoint from the latencies of its requests, in seconds.
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1e3, 3),
+        "p50_ms": round(cuts[49] * 1e3, 3),
+        "p95_ms": round(cuts[94] * 1e3, 3),
+        "p99_ms": round(cuts[98] * 1e3, 3),
+        "max_ms": round(max(latencies) * 1e3, 3),
+    }
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    endpoint: Endpoint,
+    dataset: Dataset,
+    requests: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """
+    Sends the requests of an endpoint from concurrency workers and summarizes them.
+    """
+    next_index = iter(range(requests))
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async def worker():
+        for index in next_index:
+            request = endpoint.build_request(dataset, index)
+            start = time.perf_counter()
+            response = await client.request(endpoint.method, **request)
+            await response.aread()
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+
+    return summarize(latencies, statuses, time.perf_counter() - start)
+
+async def run_load(base_url: str, dataset: Dataset, requests: int, concurrency: int, warmup: int) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    results = {}
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        for endpoint in ENDPOINTS:
+            endpoint_requests = max(1, round(requests * endpoint.weight))
+            if warmup:
+                await run_endpoint(client, endpoint, dataset, min(warmup, endpoint_requests), concurrency)
+            results[endpoint.name] = await run_endpoint(client, endpoint, dataset, endpoint_requests, concurrency)
+            print(f"{endpoint.name:<36} p50 {results[endpoint.name]['p50_ms']:>9.2f} ms  p99 {results[endpoint.name]['p99_ms']:>9.2f} ms  "
+                  f"{results[endpoint.name]['throughput_rps']:>8.1f} req/s  {results[endpoint.name]['errors']} errors")
+
+    return results
+
+def start_server(port: int, workers: int = 1) -> subprocess.Popen:
+    """
+    Starts the API with uvicorn and waits until it answers.
+    """
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning"
+        ],
+        env=os.environ.copy()
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("The API exited during start up")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/monitoring/pool", timeout=1)
+            return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+
+    server.terminate()
+    raise SystemExit("The API did not start in time")
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--subjects", type=int, default=20)
+    parser.add_argument("--grades-per-student", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic dataset")
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint, scaled down for the expensive ones")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=10, help="untimed requests per endpoint before measuring")
+    parser.add_argument("--base-url", help="URL of a running API, one is started when missing")
+    parser.add_argument("--port", type=int, default=8765, help="port of the API started by the benchmark")
+    parser.add_argument("--output", default="load_test_results.json")
+    parser.add_argument("--keep-data", action="store_true", help="keep the synthetic dataset after the run")
+    args = parser.parse_args()
+
+    dataset = seed_dataset(args.students, args.subjects, args.grades_per_student, args.seed)
+    server = None if args.base_url else start_server(args.port)
+    base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+
+    try:
+        endpoints = asyncio.run(run_load(base_url, dataset, args.requests, args.concurrency, args.warmup))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if not args.keep_data:
+            db = SessionLocal()
+            try:
+                remove_dataset(db)
+            finally:
+                db.close()
+
+    report = {
+        "commit": get_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database_mode": DATABASE_MODE,
+        "dataset": {
+            "students": args.students,
+            "subjects": args.subjects,
+            "grades_per_student": args.grades_per_student,
+            "grades": len(dataset.grade_ids),
+            "seed": args.seed
+        },
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "endpoints": endpoints
+    }
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+        output.write("\n")
+
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -19,4 +19,23 @@ class GradeToShowStudent:
 class GradeToShowSubject:
     id: int
     student: str
-    value: float
\ No newline at end of file
+    value: float
+
+@dataclass
+class SubjectGradeStatistics:
+    count: int
+    average: float
+    minimum: float
+    maximum: float
+    standard_deviation: float
+    pass_rate: float
+
+@dataclass
+class GradeRowError:
+    row: int
+    message: str
+
+@dataclass
+class GradeBulkResult:
+    created: int
+    errors: List[GradeRowError]
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List
 
 @dataclass
 class Student:
@@ -17,4 +18,18 @@ class StudentReportDashboard:
     email: str
     semester: int
     status: bool
-    average: float = 0.0
\ No newline at end of file
+    average: float = 0.0
+    grades_count: int = 0
+    credits_attempted: int = 0
+
+@dataclass
+class StudentRowError:
+    row: int
+    message: str
+
+@dataclass
+class StudentBulkResult:
+    created: int
+    # The ID given to every row, in input order, or None for the rows skipped
+    ids: List[str | None]
+    errors: List[StudentRowError]
@@ -0,0 +1,8 @@
+class InvalidCursorException(Exception):
+    """
+    Exception raised when a pagination cursor is malformed or does not match the requested sorting.
+    """
+
+    def __init__(self, message: str = "Invalid pagination cursor."):
+        super().__init__(message)
+        self.message = message
@@ -0,0 +1,114 @@
+from abc import ABC, abstractmethod
+
+from typing import List, Optional
+
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult
+
+class AsyncGradeRepository(ABC):
+    @abstractmethod
+    async def create(self, grade: Grade) -> Grade:
+        """
+        To create a new grade in the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        """
+        To create several grades in a single transaction. Grades whose student
+        or subject does not exist, or that duplicate an existing grade, are skipped
+        and reported by their 1-based position.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, grade_id: int) -> Grade:
+        """
+        To get a grade by its ID from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        """
+        To get the grades with the given IDs in a single query, skipping the ones that do not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Grade]:
+        """
+        To get all grades from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, grade: Grade) -> Grade:
+        """
+        To update an existing grade in the repository. Returns None if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, grade_id: int) -> Grade | None:
+        """
+        To delete a grade by its ID from the repository, returning the deleted
+        grade, or None if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, grade_id: int) -> bool:
+        """
+        To check if a grade exists in the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        """
+        To check if a student already has a grade for a subject.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_student_id(self, student_id: str) -> List[Grade] | None:
+        """
+        To get a student by their ID from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_subject_id(self, subject_id: str) -> List[Grade] | None:
+        """
+        To get a subject by its ID from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def get_student_grades_to_show(self, student_id: str) -> List[GradeToShowStudent] | None:
+        """
+        To get student grades by their ID from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def get_subject_grades_to_show(self, subject_id: str) -> List[GradeToShowSubject] | None:
+        """
+        To get subject grades by their ID from the repository.
+        """
+        pass
+
+    @abstractmethod
+    async def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        """
+        To get the aggregated grade statistics of a subject by its ID.
+        """
+        pass
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+from typing import Iterable
+
+class AsyncReportVersionRepository(ABC):
+    @abstractmethod
+    async def get_student_version(self, student_id: str) -> int | None:
+        """To get the version of the report of a student, or None if the student does not exist."""
+        pass
+
+    @abstractmethod
+    async def get_subject_version(self, subject_id: str) -> int | None:
+        """To get the version of the report of a subject, or None if the subject does not exist."""
+        pass
+
+    @abstractmethod
+    async def bump_grade_changes(self, student_ids: Iterable[str], subject_ids: Iterable[str]) -> None:
+        """To give a new version to the reports of the students and subjects whose grades changed."""
+        pass
+
+    @abstractmethod
+    async def bump_student(self, student_id: str) -> None:
+        """To give a new version to the report of a student and to the reports of the subjects showing them."""
+        pass
+
+    @abstractmethod
+    async def bump_subject(self, subject_id: str) -> None:
+        """To give a new version to the report of a subject and to the reports of the students showing it."""
+        pass
+
+    @abstractmethod
+    async def bump_all_students(self) -> None:
+        """To give a new version to the report of every student."""
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from typing import Iterable
+
+class AsyncStudentDashboardRepository(ABC):
+    @abstractmethod
+    async def refresh_students(self, student_ids: Iterable[str]) -> None:
+        """To recompute the dashboard snapshot of the given students."""
+        pass
+
+    @abstractmethod
+    async def refresh_subject_students(self, subject_id: str) -> None:
+        """To recompute the dashboard snapshot of every student graded in a subject."""
+        pass
+
+    @abstractmethod
+    async def rebuild(self) -> int:
+        """To recompute the dashboard snapshot of every student and return the students refreshed."""
+        pass
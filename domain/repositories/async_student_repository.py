@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+
+from typing import List, Optional
+
+from domain.entities.student import Student, StudentReportDashboard
+
+class AsyncStudentRepository(ABC):
+    @abstractmethod
+    async def create(self, student: Student) -> Student:
+        """To create a new student record."""
+        pass
+
+    @abstractmethod
+    async def create_many(self, students: List[Student]) -> None:
+        """To create several student records, whose IDs are already set, in a single transaction."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, student_id: str) -> Student | None:
+        """To retrieve a student record by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, student_ids: List[str]) -> List[Student]:
+        """To retrieve the student records with the given IDs in a single query, skipping the missing ones."""
+        pass
+
+    @abstractmethod
+    async def get_by_semester(self, students_semester: int) -> List[Student]:
+        """To retrieve all students record by its semester."""
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Student]:
+        """To retrieve all student records."""
+        pass
+
+    @abstractmethod
+    async def update(self, student: Student) -> Student:
+        """To update an existing student record, or to get None if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def delete(self, student_id: str) -> bool:
+        """To delete a student record by its ID, or to get False if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def exists(self, student_id: str) -> bool:
+        """To check if a student record exists by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_average_by_student_id(self, student_id: str) -> float:
+        """To get the average grade of a student by their ID."""
+        pass
+
+    @abstractmethod
+    async def get_all_for_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        """To retrieve a page of students together with their regular status."""
+        pass
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+
+from typing import List, Optional
+
+from domain.entities.subject import Subject
+
+class AsyncSubjectRepository(ABC):
+    @abstractmethod
+    async def create(self, subject: Subject) -> Subject:
+        """To create a new subject record."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, subject_id: str) -> Subject | None:
+        """To retrieve a subject record by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, subject_ids: List[str]) -> List[Subject]:
+        """To retrieve the subject records with the given IDs in a single query, skipping the missing ones."""
+        pass
+
+    @abstractmethod
+    async def get_by_semester(self, subjects_semester: int) -> List[Subject]:
+        """To retrieve all subjects record by its semester."""
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Subject]:
+        """To retrieve all subject records."""
+        pass
+
+    @abstractmethod
+    async def update(self, subject: Subject) -> Subject:
+        """To update an existing subject record, or to get None if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def delete(self, subject_id: str) -> bool:
+        """To delete a subject record by its ID, or to get False if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def exists(self, subject_id: str) -> bool:
+        """To check if a subject record exists by its ID."""
+        pass
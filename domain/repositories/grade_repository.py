@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult
 
 class GradeRepository(ABC):
     @abstractmethod
@@ -12,6 +12,15 @@ class GradeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        """
+        To create several grades in a single transaction. Grades whose student
+        or subject does not exist, or that duplicate an existing grade, are skipped
+        and reported by their 1-based position.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, grade_id: int) -> Grade:
         """
@@ -19,13 +28,21 @@ class GradeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        """
+        To get the grades with the given IDs in a single query, skipping the ones that do not exist.
+        """
+        pass
+
     @abstractmethod
     def get_all(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Grade]:
         """
         To get all grades from the repository.
@@ -35,14 +52,15 @@ class GradeRepository(ABC):
     @abstractmethod
     def update(self, grade: Grade) -> Grade:
         """
-        To update an existing grade in the repository.
+        To update an existing grade in the repository. Returns None if it does not exist.
         """
         pass
 
     @abstractmethod
-    def delete(self, grade_id: int) -> bool:
+    def delete(self, grade_id: int) -> Grade | None:
         """
-        To delete a grade by its ID from the repository.
+        To delete a grade by its ID from the repository, returning the deleted
+        grade, or None if it does not exist.
         """
         pass
 
@@ -53,6 +71,13 @@ class GradeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        """
+        To check if a student already has a grade for a subject.
+        """
+        pass
+
     @abstractmethod
     def get_by_student_id(self, student_id: str) -> List[Grade] | None:
         """
@@ -82,8 +107,15 @@ class GradeRepository(ABC):
         pass
 
     @abstractmethod
-    def is_regular_student(self, student_id: str) -> bool:
+    def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        """
+        To get the aggregated grade statistics of a subject by its ID.
+        """
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> Iterator[Grade]:
         """
-        To check if a student is regular based on their grades.
+        To iterate over every grade in ID order, fetching them from the repository in batches.
         """
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from typing import Dict, Tuple
+
+class StudentAverageRepository(ABC):
+    @abstractmethod
+    def apply_grade_change(self, student_id: str, value_delta: float, count_delta: int) -> float:
+        """To apply a grade mutation to the running sum and count of a student and return the new average."""
+        pass
+
+    @abstractmethod
+    def apply_grade_changes(self, changes: Dict[str, Tuple[float, int]]) -> None:
+        """To apply the grade mutations of several students, given as value and count deltas by student ID."""
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """To rebuild every running sum, count and average from the grades and return the students updated."""
+        pass
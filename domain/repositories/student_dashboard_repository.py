@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from typing import Iterable
+
+class StudentDashboardRepository(ABC):
+    @abstractmethod
+    def refresh_students(self, student_ids: Iterable[str]) -> None:
+        """To recompute the dashboard snapshot of the given students."""
+        pass
+
+    @abstractmethod
+    def refresh_subject_students(self, subject_id: str) -> None:
+        """To recompute the dashboard snapshot of every student graded in a subject."""
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """To recompute the dashboard snapshot of every student and return the students refreshed."""
+        pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from typing import List
+
+class StudentIdRepository(ABC):
+    @abstractmethod
+    def next_ids(self, year: int, count: int = 1) -> List[str]:
+        """To hand out count student IDs of a year that were never handed out before."""
+        pass
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from domain.entities.student import Student
+from domain.entities.student import Student, StudentReportDashboard
 
 class StudentRepository(ABC):
     @abstractmethod
@@ -10,10 +10,20 @@ class StudentRepository(ABC):
         """To create a new student record."""
         pass
 
+    @abstractmethod
+    def create_many(self, students: List[Student]) -> None:
+        """To create several student records, whose IDs are already set, in a single transaction."""
+        pass
+
     @abstractmethod
     def get_by_id(self, student_id: str) -> Student | None:
         """To retrieve a student record by its ID."""
         pass
+
+    @abstractmethod
+    def get_many(self, student_ids: List[str]) -> List[Student]:
+        """To retrieve the student records with the given IDs in a single query, skipping the missing ones."""
+        pass
     
     @abstractmethod
     def get_by_semester(self, students_semester: int) ->List[Student]:
@@ -26,19 +36,20 @@ class StudentRepository(ABC):
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Student]:
         """To retrieve all student records."""
         pass
 
     @abstractmethod
     def update(self, student: Student) -> Student:
-        """To update an existing student record."""
+        """To update an existing student record, or to get None if it does not exist."""
         pass
 
     @abstractmethod
     def delete(self, student_id: str) -> bool:
-        """To delete a student record by its ID."""
+        """To delete a student record by its ID, or to get False if it does not exist."""
         pass
 
     @abstractmethod
@@ -49,4 +60,21 @@ class StudentRepository(ABC):
     @abstractmethod
     def get_average_by_student_id(self, student_id: str) -> float:
         """To get the average grade of a student by their ID."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_all_for_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        """To retrieve a page of students together with their regular status."""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> Iterator[Student]:
+        """To iterate over every student record in ID order, fetching them in batches."""
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from domain.entities.subject import Subject
 
@@ -26,22 +26,33 @@ class SubjectRepository(ABC):
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Subject]:
         """To retrieve all subject records."""
         pass
 
+    @abstractmethod
+    def get_many(self, subject_ids: List[str]) -> List[Subject]:
+        """To retrieve the subject records with the given IDs in a single query, skipping the missing ones."""
+        pass
+
     @abstractmethod
     def update(self, subject: Subject) -> Subject:
-        """To update an existing subject record."""
+        """To update an existing subject record, or to get None if it does not exist."""
         pass
 
     @abstractmethod
     def delete(self, subject_id: str) -> bool:
-        """To delete a subject record by its ID."""
+        """To delete a subject record by its ID, or to get False if it does not exist."""
         pass
 
     @abstractmethod
     def exists(self, subject_id: str) -> bool:
         """To check if a subject record exists by its ID."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> Iterator[Subject]:
+        """To iterate over every subject record in ID order, fetching them in batches."""
+        pass
@@ -0,0 +1,437 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Response
+
+from typing import Annotated, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.db.async_database import get_async_db
+from infrastructure.db.async_unit_of_work_impl import get_async_unit_of_work
+from infrastructure.repositories.async_grade_repository_impl import AsyncGradeRepositoryImpl
+from infrastructure.repositories.async_cached_grade_repository_impl import AsyncCachedGradeRepositoryImpl
+from infrastructure.repositories.async_student_repository_impl import AsyncStudentRepositoryImpl
+from infrastructure.repositories.async_cached_student_repository_impl import AsyncCachedStudentRepositoryImpl
+from infrastructure.repositories.async_subject_repository_impl import AsyncSubjectRepositoryImpl
+from infrastructure.repositories.async_cached_subject_repository_impl import AsyncCachedSubjectRepositoryImpl
+from infrastructure.mappers.grade_mappers import (
+    map_create_grade_dto_to_entity,
+    map_update_grade_dto_to_entity,
+    map_bulk_grade_rows_to_entities,
+    map_grades_csv_to_entities
+)
+from infrastructure.schemas.grades_schema import (
+    CreateGradeDTO,
+    UpdateGradeDTO,
+    GradeResponseDTO,
+    GradeToShowStudentResponseDTO,
+    GradeToShowSubjectResponseDTO,
+    BulkGradeRowDTO,
+    BulkGradeResponseDTO,
+    BatchGetGradesDTO,
+    BatchGetGradesResponseDTO,
+    GRADE_LIST_SERIALIZER,
+    GRADE_TO_SHOW_STUDENT_LIST_SERIALIZER,
+    GRADE_TO_SHOW_SUBJECT_LIST_SERIALIZER
+)
+from infrastructure.schemas.student_schema import StudentResponseDTO, STUDENT_LIST_SERIALIZER
+from infrastructure.schemas.subject_schema import SubjectResponseDTO, SUBJECT_LIST_SERIALIZER
+from infrastructure.utils.constants import SORTERS_FIELD, SORTERS_ORDER
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_GRADES_SORT_FIELDS, ALLOWED_STUDENT_SORT_FIELDS, ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.use_cases.grades.async_create_grade import AsyncCreateGradeUseCase
+from application.use_cases.grades.async_create_grades_bulk import AsyncCreateGradesBulkUseCase
+from application.use_cases.grades.async_get_grade import AsyncGetGradeUseCase
+from application.use_cases.grades.async_delete_grade import AsyncDeleteGradeUseCase
+from application.use_cases.grades.async_update_grade import AsyncUpdateGradeUseCase
+from application.use_cases.students.async_get_student import AsyncGetStudentUseCase
+from application.use_cases.subjects.async_get_subject import AsyncGetSubjectUseCase
+
+from domain.exceptions.not_enough_arguments_exception import NotEnoughArgumentsException
+from domain.exceptions.cannot_create_exception import CannotCreateException
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
+from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+from domain.utils.constants import UNEXPECTED_ERROR
+from domain.utils.exception_detail_wrapper import exception_detail_wrapper
+
+router = APIRouter(prefix="/grades", tags=["Grades"])
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=GradeResponseDTO)
+async def create_grade(
+    grade_data: CreateGradeDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> GradeResponseDTO:
+    """
+    Create a new grade.
+    """
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        student_repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        subject_repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateGradeUseCase(repo, student_repo, subject_repo, unit_of_work)
+        grade = await use_case.execute(
+            map_create_grade_dto_to_entity(grade_data)
+        )
+        return GradeResponseDTO.model_validate(grade)
+    except NotEnoughArgumentsException as e:
+        raise exception_detail_wrapper(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            exception=e,
+            error_type="NotEnoughArgumentsException"
+        )
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk", status_code=status.HTTP_200_OK, response_model=BulkGradeResponseDTO)
+async def create_grades_bulk(
+    grades_data: List[BulkGradeRowDTO],
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> BulkGradeResponseDTO:
+    """
+    Create several grades from a JSON array in a single transaction.
+    Invalid rows are skipped and reported by their 1-based position.
+    """
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateGradesBulkUseCase(repo, unit_of_work)
+        result = await use_case.execute(
+            map_bulk_grade_rows_to_entities(grades_data)
+        )
+        return BulkGradeResponseDTO.model_validate(result)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk/csv", status_code=status.HTTP_200_OK, response_model=BulkGradeResponseDTO)
+async def create_grades_bulk_from_csv(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> BulkGradeResponseDTO:
+    """
+    Create several grades from a CSV upload with a student_id,subject_id,value
+    header in a single transaction. Invalid rows are skipped and reported by
+    their 1-based position, not counting the header.
+    """
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateGradesBulkUseCase(repo, unit_of_work)
+        result = await use_case.execute(
+            map_grades_csv_to_entities(content)
+        )
+        return BulkGradeResponseDTO.model_validate(result)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/students", status_code=status.HTTP_200_OK, response_model=List[StudentResponseDTO])
+async def get_all_students(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None)
+) -> List[StudentResponseDTO]:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        use_case = AsyncGetStudentUseCase(repo)
+        students = await use_case.execute_all(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENT_LIST_SERIALIZER, students, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/subjects", status_code=status.HTTP_200_OK, response_model=List[SubjectResponseDTO])
+async def get_all_subjects(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None)
+) -> List[SubjectResponseDTO]:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db))
+        use_case = AsyncGetSubjectUseCase(repo)
+        subjects = await use_case.execute_all(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, subjects, page_size, ALLOWED_SUBJECT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/students/{student_id}", status_code=status.HTTP_200_OK, response_model=List[GradeToShowStudentResponseDTO])
+async def get_student_grades(
+    student_id: str,
+    db: AsyncSession = Depends(get_async_db),
+) -> List[GradeToShowStudentResponseDTO]:
+    repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+    use_case = AsyncGetGradeUseCase(repo)
+    students = await use_case.execute_get_grades_by_student_id(student_id)
+    return build_list_response(GRADE_TO_SHOW_STUDENT_LIST_SERIALIZER, students)
+
+@router.get("/subjects/{subject_id}", status_code=status.HTTP_200_OK, response_model=List[GradeToShowSubjectResponseDTO])
+async def get_subject_grades(
+    subject_id: str,
+    db: AsyncSession = Depends(get_async_db),
+) -> List[GradeToShowSubjectResponseDTO]:
+    repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+    use_case = AsyncGetGradeUseCase(repo)
+    subjects = await use_case.execute_get_grades_by_subject_id(subject_id)
+    return build_list_response(GRADE_TO_SHOW_SUBJECT_LIST_SERIALIZER, subjects)
+
+@router.get("/{grade_id}", status_code=status.HTTP_200_OK, response_model=GradeResponseDTO)
+async def get_grade_by_id(
+    grade_id: int,
+    db: AsyncSession = Depends(get_async_db)
+) -> GradeResponseDTO:
+    """
+    Get a grade by Id
+    """
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        use_case = AsyncGetGradeUseCase(repo)
+        grade = await use_case.execute_by_id(grade_id)
+        return GradeResponseDTO.model_validate(grade)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/student/{student_id}", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
+async def get_grade_by_student_id(
+    student_id: str,
+    db: AsyncSession = Depends(get_async_db)
+) -> List[GradeResponseDTO]:
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        use_case = AsyncGetGradeUseCase(repo)
+        grades = await use_case.execute_by_student_id(student_id)
+        return build_list_response(GRADE_LIST_SERIALIZER, grades)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:  
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/subject/{subject_id}", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
+async def get_grade_by_subject_id(
+    subject_id: str,
+    db: AsyncSession = Depends(get_async_db)
+) -> List[GradeResponseDTO]:
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        use_case = AsyncGetGradeUseCase(repo)
+        grades = await use_case.execute_by_subject_id(subject_id)
+        return build_list_response(GRADE_LIST_SERIALIZER, grades)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+    
+@router.get("/", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
+async def get_all_grade(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
+) -> List[GradeResponseDTO]:
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        use_case = AsyncGetGradeUseCase(repo)
+        grades = await use_case.execute_all(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, grades, page_size, ALLOWED_GRADES_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(GRADE_LIST_SERIALIZER, grades, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetGradesResponseDTO)
+async def get_grades_by_ids(
+    batch_data: BatchGetGradesDTO,
+    db: AsyncSession = Depends(get_async_db)
+) -> BatchGetGradesResponseDTO:
+    """
+    Get several grades by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the grades not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        use_case = AsyncGetGradeUseCase(repo)
+        grades = await use_case.execute_by_ids(batch_data.ids)
+        return BatchGetGradesResponseDTO(
+            results=[
+                GradeResponseDTO.model_validate(grade) if grade is not None else None
+                for grade in grades
+            ],
+            missing_ids=[
+                grade_id for grade_id, grade in zip(batch_data.ids, grades) if grade is None
+            ]
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.put("/{grade_id}", status_code=status.HTTP_200_OK, response_model=GradeResponseDTO)
+async def update_grade(
+    grade_id: int,
+    grade_data: UpdateGradeDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> GradeResponseDTO:
+    """
+    Update a grade by Id
+    """
+    try:
+        grade_repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncUpdateGradeUseCase(grade_repo, unit_of_work)
+        grade = await use_case.execute(
+            map_update_grade_dto_to_entity(grade_id, grade_data)
+        )
+        return GradeResponseDTO.model_validate(grade)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotUpdateResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.delete("/{grade_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_grade(
+    grade_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> None:
+    """
+    Delete a grade by Id
+    """
+    try:
+        repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncDeleteGradeUseCase(repo, unit_of_work)
+        await use_case.execute(grade_id)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotDeleteResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
@@ -0,0 +1,163 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Header,
+    Query,
+    Response
+)
+
+from typing import Annotated, Optional, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.db.async_database import get_async_db
+from infrastructure.repositories.async_subject_repository_impl import AsyncSubjectRepositoryImpl
+from infrastructure.repositories.async_student_repository_impl import AsyncStudentRepositoryImpl
+from infrastructure.repositories.async_cached_student_repository_impl import AsyncCachedStudentRepositoryImpl
+from infrastructure.repositories.async_grade_repository_impl import AsyncGradeRepositoryImpl
+from infrastructure.repositories.async_cached_grade_repository_impl import AsyncCachedGradeRepositoryImpl
+from infrastructure.repositories.async_report_version_repository_impl import AsyncReportVersionRepositoryImpl
+from infrastructure.schemas.report_schema import ReportStudentsResponseDTO, ReportSubjectsResponseDTO, StudentsDashboardResponseDTO, STUDENTS_DASHBOARD_LIST_SERIALIZER
+from infrastructure.utils.constants import SORTERS_FIELD, SORTERS_ORDER
+from infrastructure.utils.http_caching import build_etag, etag_matches, not_modified_response, set_cache_headers
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+
+from application.use_cases.reports.async_get_report import AsyncGetReportUseCase
+
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+@router.get("/students/{student_id}/grades", status_code=status.HTTP_200_OK, response_model=ReportStudentsResponseDTO)
+async def get_student_subjects_grades(
+    student_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+) -> ReportStudentsResponseDTO:
+    """
+    Get grades with average for a specific student by their ID.
+    Send the ETag of a previous response in If-None-Match to get a 304 while it is unchanged.
+    """
+    try:
+        student_repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        grade_repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        report_version_repo = AsyncReportVersionRepositoryImpl(db)
+        use_case = AsyncGetReportUseCase(
+            student_repository=student_repo,
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
+        )
+        version = await use_case.get_student_report_version(student_id)
+        if version is not None:
+            etag = build_etag(version)
+            if etag_matches(if_none_match, etag):
+                return not_modified_response(etag)
+            set_cache_headers(response, etag)
+
+        grades, average = await use_case.execute_by_student_id(student_id)
+        return ReportStudentsResponseDTO(
+            subjects=grades,
+            average=average
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error initializing use case: {str(e)}"
+        )
+
+@router.get("/subjects/{subject_id}/grades", status_code=status.HTTP_200_OK, response_model=ReportSubjectsResponseDTO)
+async def get_subject_students_grades(
+    subject_id: str,
+    response: Response,
+    include_students: Annotated[bool, Query(alias="includeStudents")] = True,
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+) -> ReportSubjectsResponseDTO:
+    """
+    Get students with grades for a specific subject by its ID, along with
+    the subject statistics. Use includeStudents=false to get only the statistics.
+    Send the ETag of a previous response in If-None-Match to get a 304 while it is unchanged.
+    """
+    try:
+        student_repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        grade_repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        report_version_repo = AsyncReportVersionRepositoryImpl(db)
+        use_case = AsyncGetReportUseCase(
+            student_repository=student_repo,
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
+        )
+        version = await use_case.get_subject_report_version(subject_id)
+        if version is not None:
+            etag = build_etag(version, "students" if include_students else "statistics")
+            if etag_matches(if_none_match, etag):
+                return not_modified_response(etag)
+            set_cache_headers(response, etag)
+
+        students, statistics = await use_case.execute_by_subject_id(
+            subject_id,
+            include_grades=include_students
+        )
+        return ReportSubjectsResponseDTO(
+            students=students,
+            average=statistics.average,
+            statistics=statistics
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error initializing use case: {str(e)}"
+        )
+    
+@router.get("/students", status_code=status.HTTP_200_OK, response_model=List[StudentsDashboardResponseDTO])
+async def get_all_students_for_dashboard(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
+) -> List[StudentsDashboardResponseDTO]:
+    """
+    Get all the students for the students dashboard
+    """
+
+    try:
+        student_repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        grade_repo = AsyncCachedGradeRepositoryImpl(AsyncGradeRepositoryImpl(db))
+        report_version_repo = AsyncReportVersionRepositoryImpl(db)
+        use_case = AsyncGetReportUseCase(
+            student_repository=student_repo,
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
+        )
+        students = await use_case.execute_all_students_dashboard(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENTS_DASHBOARD_LIST_SERIALIZER, students, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error initializing use case: {str(e)}"
+        )
\ No newline at end of file
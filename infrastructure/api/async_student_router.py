@@ -0,0 +1,289 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
+
+from typing import Annotated, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.use_cases.students.async_create_student import AsyncCreateStudentUseCase
+from application.use_cases.students.async_create_students_bulk import AsyncCreateStudentsBulkUseCase
+from application.use_cases.students.async_get_student import AsyncGetStudentUseCase
+from application.use_cases.students.async_update_student import AsyncUpdateStudentUseCase
+from application.use_cases.students.async_delete_student import AsyncDeleteStudentUseCase
+
+from domain.exceptions.cannot_create_exception import CannotCreateException
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
+from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+from domain.utils.constants import UNEXPECTED_ERROR
+
+from infrastructure.repositories.async_student_repository_impl import AsyncStudentRepositoryImpl
+from infrastructure.repositories.async_cached_student_repository_impl import AsyncCachedStudentRepositoryImpl
+from infrastructure.repositories.async_student_id_repository_impl import async_student_id_repository
+from infrastructure.schemas.student_schema import CreateStudentDTO, UpdateStudentDTO, StudentResponseDTO, BatchGetStudentsDTO, BatchGetStudentsResponseDTO, BulkStudentRowDTO, BulkStudentResponseDTO, STUDENT_LIST_SERIALIZER
+from infrastructure.mappers.student_mappers import map_create_student_dto_to_entity, map_update_student_dto_to_entity, map_bulk_student_rows_to_entities, map_students_csv_to_entities
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+from infrastructure.db.async_database import get_async_db
+from infrastructure.db.async_unit_of_work_impl import get_async_unit_of_work
+
+router = APIRouter(prefix="/students", tags=["Students"])
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=StudentResponseDTO)
+async def create_student(
+    student_data: CreateStudentDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> StudentResponseDTO:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateStudentUseCase(repo, async_student_id_repository, unit_of_work)
+        student = await use_case.execute(
+            map_create_student_dto_to_entity(student_data)
+        )
+        return StudentResponseDTO.model_validate(student)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk", status_code=status.HTTP_200_OK, response_model=BulkStudentResponseDTO)
+async def create_students_bulk(
+    students_data: List[BulkStudentRowDTO],
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> BulkStudentResponseDTO:
+    """
+    Enroll several students from a JSON array in a single transaction.
+    Returns the ID given to every row in input order; invalid rows are
+    skipped, get a null ID and are reported by their 1-based position.
+    """
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateStudentsBulkUseCase(repo, async_student_id_repository, unit_of_work)
+        result = await use_case.execute(
+            map_bulk_student_rows_to_entities(students_data)
+        )
+        return BulkStudentResponseDTO.model_validate(result)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk/csv", status_code=status.HTTP_200_OK, response_model=BulkStudentResponseDTO)
+async def create_students_bulk_from_csv(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> BulkStudentResponseDTO:
+    """
+    Enroll several students from a CSV upload with a name,lastname,email,semester
+    header in a single transaction. Returns the ID given to every data row in
+    input order; invalid rows are skipped, get a null ID and are reported by
+    their 1-based position, not counting the header.
+    """
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateStudentsBulkUseCase(repo, async_student_id_repository, unit_of_work)
+        result = await use_case.execute(
+            map_students_csv_to_entities(content)
+        )
+        return BulkStudentResponseDTO.model_validate(result)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.get("/{student_id}", status_code=status.HTTP_200_OK, response_model=StudentResponseDTO)
+async def get_student_by_id(
+    student_id: str,
+    db: AsyncSession = Depends(get_async_db)
+) -> StudentResponseDTO:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        use_case = AsyncGetStudentUseCase(repo)
+        student = await use_case.execute_by_id(student_id)
+        return StudentResponseDTO.model_validate(student)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
+@router.get("/semester/{students_semester}", status_code=status.HTTP_200_OK, response_model=List[StudentResponseDTO])
+async def get_students_by_semester(
+    students_semester: int,
+    db: AsyncSession = Depends(get_async_db)
+) -> List[StudentResponseDTO]:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        use_case = AsyncGetStudentUseCase(repo)
+        students = await use_case.execute_by_semester(students_semester)
+        return build_list_response(STUDENT_LIST_SERIALIZER, students)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+
+@router.get("/", status_code=status.HTTP_200_OK, response_model=list[StudentResponseDTO])
+async def get_all_students(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias="sorters[0][field]"),
+    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]"),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
+) -> List[StudentResponseDTO]:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        use_case = AsyncGetStudentUseCase(repo)
+        students = await use_case.execute_all(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENT_LIST_SERIALIZER, students, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetStudentsResponseDTO)
+async def get_students_by_ids(
+    batch_data: BatchGetStudentsDTO,
+    db: AsyncSession = Depends(get_async_db)
+) -> BatchGetStudentsResponseDTO:
+    """
+    Get several students by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the students not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db))
+        use_case = AsyncGetStudentUseCase(repo)
+        students = await use_case.execute_by_ids(batch_data.ids)
+        return BatchGetStudentsResponseDTO(
+            results=[
+                StudentResponseDTO.model_validate(student) if student is not None else None
+                for student in students
+            ],
+            missing_ids=[
+                student_id for student_id, student in zip(batch_data.ids, students) if student is None
+            ]
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.put("/{student_id}", status_code=status.HTTP_200_OK, response_model=StudentResponseDTO)
+async def update_student(
+    student_id: str,
+    student_data: UpdateStudentDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> StudentResponseDTO:
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncUpdateStudentUseCase(repo, unit_of_work)
+        updated_student = await use_case.execute(
+            map_update_student_dto_to_entity(student_id, student_data)
+        )
+        return StudentResponseDTO.model_validate(updated_student)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotUpdateResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_student(
+    student_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+):
+    try:
+        repo = AsyncCachedStudentRepositoryImpl(AsyncStudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncDeleteStudentUseCase(repo, unit_of_work)
+        await use_case.execute(student_id)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotDeleteResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
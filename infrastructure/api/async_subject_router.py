@@ -0,0 +1,214 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+
+from typing import Annotated, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.use_cases.subjects.async_create_subject import AsyncCreateSubjectUseCase
+from application.use_cases.subjects.async_get_subject import AsyncGetSubjectUseCase
+from application.use_cases.subjects.async_update_subject import AsyncUpdateSubjectUseCase
+from application.use_cases.subjects.async_delete_subject import AsyncDeleteSubjectUseCase
+
+from domain.exceptions.cannot_create_exception import CannotCreateException
+from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
+from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+from domain.utils.constants import UNEXPECTED_ERROR
+
+from infrastructure.db.async_database import get_async_db
+from infrastructure.db.async_unit_of_work_impl import get_async_unit_of_work
+from infrastructure.repositories.async_subject_repository_impl import AsyncSubjectRepositoryImpl
+from infrastructure.repositories.async_cached_subject_repository_impl import AsyncCachedSubjectRepositoryImpl
+from infrastructure.schemas.subject_schema import CreateSubjectDTO, UpdateSubjectDTO, SubjectResponseDTO, BatchGetSubjectsDTO, BatchGetSubjectsResponseDTO, SUBJECT_LIST_SERIALIZER
+from infrastructure.mappers.subject_mappers import map_create_subject_dto_to_entity, map_update_subject_dto_to_entity
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.serialization import build_list_response
+
+router = APIRouter(prefix="/subjects", tags=["Subjects"])
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=SubjectResponseDTO)
+async def create_subject(
+    subject_data: CreateSubjectDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> SubjectResponseDTO:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncCreateSubjectUseCase(repo, unit_of_work)
+        subject = await use_case.execute(
+            map_create_subject_dto_to_entity(subject_data)
+        )
+        return SubjectResponseDTO.model_validate(subject)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.get("/{subject_id}", status_code=status.HTTP_200_OK, response_model=SubjectResponseDTO)
+async def get_subject_by_id(
+    subject_id: str,
+    db: AsyncSession = Depends(get_async_db)
+) -> SubjectResponseDTO:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db))
+        use_case = AsyncGetSubjectUseCase(repo)
+        subject = await use_case.execute_by_id(subject_id)
+        return SubjectResponseDTO.model_validate(subject)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.get("/semester/{subjects_semester}", status_code=status.HTTP_200_OK, response_model=List[SubjectResponseDTO])
+async def get_subjects_by_semester(
+    subjects_semester: int,
+    db: AsyncSession = Depends(get_async_db)
+) -> List[SubjectResponseDTO]:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db))
+        use_case = AsyncGetSubjectUseCase(repo)
+        subjects = await use_case.execute_by_semester(subjects_semester)
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+            
+@router.get("/", status_code=status.HTTP_200_OK, response_model=list[SubjectResponseDTO])
+async def get_all_subjects(
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    page_size: Annotated[int, Query(alias="pageSize")] = 25,
+    current: Annotated[int, Query(alias="current")] = 1,
+    sort_field: Optional[str] = Query(default=None, alias="sorters[0][field]"),
+    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]"),
+    cursor: Optional[str] = Query(default=None)
+) -> List[SubjectResponseDTO]:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db))
+        use_case = AsyncGetSubjectUseCase(repo)
+        subjects = await use_case.execute_all(
+            page_size=page_size,
+            page=current,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, subjects, page_size, ALLOWED_SUBJECT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetSubjectsResponseDTO)
+async def get_subjects_by_ids(
+    batch_data: BatchGetSubjectsDTO,
+    db: AsyncSession = Depends(get_async_db)
+) -> BatchGetSubjectsResponseDTO:
+    """
+    Get several subjects by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the subjects not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db))
+        use_case = AsyncGetSubjectUseCase(repo)
+        subjects = await use_case.execute_by_ids(batch_data.ids)
+        return BatchGetSubjectsResponseDTO(
+            results=[
+                SubjectResponseDTO.model_validate(subject) if subject is not None else None
+                for subject in subjects
+            ],
+            missing_ids=[
+                subject_id for subject_id, subject in zip(batch_data.ids, subjects) if subject is None
+            ]
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.put("/{subject_id}", status_code=status.HTTP_200_OK, response_model=SubjectResponseDTO)
+async def update_subject(
+    subject_id: str,
+    subject_data: UpdateSubjectDTO,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> SubjectResponseDTO:
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncUpdateSubjectUseCase(repo, unit_of_work)
+        updated_subject = await use_case.execute(
+            map_update_subject_dto_to_entity(subject_id, subject_data)
+        )
+        return SubjectResponseDTO.model_validate(updated_subject)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotUpdateResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.delete("/{subject_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_subject(
+    subject_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    unit_of_work: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+):
+    try:
+        repo = AsyncCachedSubjectRepositoryImpl(AsyncSubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = AsyncDeleteSubjectUseCase(repo, unit_of_work)
+        await use_case.execute(subject_id)
+    except ResourceNotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CannotDeleteResourceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
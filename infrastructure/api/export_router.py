@@ -0,0 +1,75 @@
+from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+
+from typing import Callable, Iterator
+
+from domain.entities.grade import Grade
+from domain.entities.student import Student
+from domain.entities.subject import Subject
+
+from infrastructure.db.database import SessionLocal
+from infrastructure.repositories.grade_repository_impl import GradeRepositoryImpl
+from infrastructure.repositories.student_repository_impl import StudentRepositoryImpl
+from infrastructure.repositories.subject_repository_impl import SubjectRepositoryImpl
+from infrastructure.utils.constants import EXPORT_BATCH_SIZE
+from infrastructure.utils.export_formats import ExportFormat, EXPORT_MEDIA_TYPES, stream_csv, stream_ndjson
+
+from application.use_cases.exports.export_data import ExportDataUseCase
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+def export_response(
+    resource: str,
+    entity_type: type,
+    export_format: ExportFormat,
+    select_entities: Callable[[ExportDataUseCase], Iterator]
+) -> StreamingResponse:
+    """
+    Builds a streaming response for an export. The session is owned by the
+    generator, since the body is produced after the request dependencies exit.
+    """
+    def generate() -> Iterator[str | bytes]:
+        db = SessionLocal()
+
+        try:
+            use_case = ExportDataUseCase(
+                grade_repository=GradeRepositoryImpl(db),
+                student_repository=StudentRepositoryImpl(db),
+                subject_repository=SubjectRepositoryImpl(db),
+                batch_size=EXPORT_BATCH_SIZE
+            )
+            entities = select_entities(use_case)
+
+            if export_format == ExportFormat.CSV:
+                yield from stream_csv(entities, entity_type, EXPORT_BATCH_SIZE)
+            else:
+                yield from stream_ndjson(entities, EXPORT_BATCH_SIZE)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{export_format.value}"'}
+    )
+
+@router.get("/grades.{export_format}", status_code=status.HTTP_200_OK)
+async def export_grades(export_format: ExportFormat) -> StreamingResponse:
+    """
+    Export every grade as CSV or NDJSON.
+    """
+    return export_response("grades", Grade, export_format, lambda use_case: use_case.execute_grades())
+
+@router.get("/students.{export_format}", status_code=status.HTTP_200_OK)
+async def export_students(export_format: ExportFormat) -> StreamingResponse:
+    """
+    Export every student as CSV or NDJSON.
+    """
+    return export_response("students", Student, export_format, lambda use_case: use_case.execute_students())
+
+@router.get("/subjects.{export_format}", status_code=status.HTTP_200_OK)
+async def export_subjects(export_format: ExportFormat) -> StreamingResponse:
+    """
+    Export every subject as CSV or NDJSON.
+    """
+    return export_response("subjects", Subject, export_format, lambda use_case: use_case.execute_subjects())
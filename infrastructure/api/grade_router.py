@@ -1,26 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Response
 
 from typing import Annotated, List, Optional
 
 from sqlalchemy.orm import Session
 
 from infrastructure.db.database import get_db
+from infrastructure.db.unit_of_work_impl import get_unit_of_work
 from infrastructure.repositories.grade_repository_impl import GradeRepositoryImpl
+from infrastructure.repositories.cached_grade_repository_impl import CachedGradeRepositoryImpl
 from infrastructure.repositories.student_repository_impl import StudentRepositoryImpl
+from infrastructure.repositories.cached_student_repository_impl import CachedStudentRepositoryImpl
 from infrastructure.repositories.subject_repository_impl import SubjectRepositoryImpl
-from infrastructure.mappers.grade_mappers import map_create_grade_dto_to_entity, map_update_grade_dto_to_entity
+from infrastructure.repositories.cached_subject_repository_impl import CachedSubjectRepositoryImpl
+from infrastructure.mappers.grade_mappers import (
+    map_create_grade_dto_to_entity,
+    map_update_grade_dto_to_entity,
+    map_bulk_grade_rows_to_entities,
+    map_grades_csv_to_entities
+)
 from infrastructure.schemas.grades_schema import (
     CreateGradeDTO,
     UpdateGradeDTO,
     GradeResponseDTO,
     GradeToShowStudentResponseDTO,
-    GradeToShowSubjectResponseDTO
+    GradeToShowSubjectResponseDTO,
+    BulkGradeRowDTO,
+    BulkGradeResponseDTO,
+    BatchGetGradesDTO,
+    BatchGetGradesResponseDTO,
+    GRADE_LIST_SERIALIZER,
+    GRADE_TO_SHOW_STUDENT_LIST_SERIALIZER,
+    GRADE_TO_SHOW_SUBJECT_LIST_SERIALIZER
 )
-from infrastructure.schemas.student_schema import StudentResponseDTO
-from infrastructure.schemas.subject_schema import SubjectResponseDTO
+from infrastructure.schemas.student_schema import StudentResponseDTO, STUDENT_LIST_SERIALIZER
+from infrastructure.schemas.subject_schema import SubjectResponseDTO, SUBJECT_LIST_SERIALIZER
 from infrastructure.utils.constants import SORTERS_FIELD, SORTERS_ORDER
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_GRADES_SORT_FIELDS, ALLOWED_STUDENT_SORT_FIELDS, ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+from infrastructure.utils.threadpool import blocking_endpoint
 
+from application.unit_of_work import UnitOfWork
 from application.use_cases.grades.create_grade import CreateGradeUseCase
+from application.use_cases.grades.create_grades_bulk import CreateGradesBulkUseCase
 from application.use_cases.grades.get_grade import GetGradeUseCase
 from application.use_cases.grades.delete_grade import DeleteGradeUseCase
 from application.use_cases.grades.update_grade import UpdateGradeUseCase
@@ -32,25 +54,27 @@ from domain.exceptions.cannot_create_exception import CannotCreateException
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
 from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
 from domain.utils.constants import UNEXPECTED_ERROR
 from domain.utils.exception_detail_wrapper import exception_detail_wrapper
-from domain.services.grade_service import GradeService
 
 router = APIRouter(prefix="/grades", tags=["Grades"])
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=GradeResponseDTO)
-async def create_grade(
+@blocking_endpoint
+def create_grade(
     grade_data: CreateGradeDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> GradeResponseDTO:
     """
     Create a new grade.
     """
     try:
-        repo = GradeRepositoryImpl(db)
-        student_repo = StudentRepositoryImpl(db)
-        subject_repo = SubjectRepositoryImpl(db)
-        use_case = CreateGradeUseCase(repo, student_repo, subject_repo)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        student_repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        subject_repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateGradeUseCase(repo, student_repo, subject_repo, unit_of_work)
         grade = use_case.execute(
             map_create_grade_dto_to_entity(grade_data)
         )
@@ -77,24 +101,91 @@ async def create_grade(
             detail=UNEXPECTED_ERROR + str(e)
         )
     
+@router.post("/bulk", status_code=status.HTTP_200_OK, response_model=BulkGradeResponseDTO)
+@blocking_endpoint
+def create_grades_bulk(
+    grades_data: List[BulkGradeRowDTO],
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
+) -> BulkGradeResponseDTO:
+    """
+    Create several grades from a JSON array in a single transaction.
+    Invalid rows are skipped and reported by their 1-based position.
+    """
+    try:
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateGradesBulkUseCase(repo, unit_of_work)
+        result = use_case.execute(
+            map_bulk_grade_rows_to_entities(grades_data)
+        )
+        return BulkGradeResponseDTO.model_validate(result)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk/csv", status_code=status.HTTP_200_OK, response_model=BulkGradeResponseDTO)
+@blocking_endpoint
+def create_grades_bulk_from_csv(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
+) -> BulkGradeResponseDTO:
+    """
+    Create several grades from a CSV upload with a student_id,subject_id,value
+    header in a single transaction. Invalid rows are skipped and reported by
+    their 1-based position, not counting the header.
+    """
+    try:
+        content = file.file.read().decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateGradesBulkUseCase(repo, unit_of_work)
+        result = use_case.execute(
+            map_grades_csv_to_entities(content)
+        )
+        return BulkGradeResponseDTO.model_validate(result)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+    
 @router.get("/students", status_code=status.HTTP_200_OK, response_model=List[StudentResponseDTO])
-async def get_all_students(
+@blocking_endpoint
+def get_all_students(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
-    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER)
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None)
 ) -> List[StudentResponseDTO]:
     try:
-        repo = StudentRepositoryImpl(db)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
         use_case = GetStudentUseCase(repo)
         students = use_case.execute_all(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENT_LIST_SERIALIZER, students, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        return [StudentResponseDTO.model_validate(student) for student in students]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -102,23 +193,33 @@ async def get_all_students(
         )
     
 @router.get("/subjects", status_code=status.HTTP_200_OK, response_model=List[SubjectResponseDTO])
-async def get_all_subjects(
+@blocking_endpoint
+def get_all_subjects(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
-    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER)
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None)
 ) -> List[SubjectResponseDTO]:
     try:
-        repo = SubjectRepositoryImpl(db)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db))
         use_case = GetSubjectUseCase(repo)
         subjects = use_case.execute_all(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, subjects, page_size, ALLOWED_SUBJECT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        return [SubjectResponseDTO.model_validate(subject) for subject in subjects]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -126,27 +227,30 @@ async def get_all_subjects(
         )
     
 @router.get("/students/{student_id}", status_code=status.HTTP_200_OK, response_model=List[GradeToShowStudentResponseDTO])
-async def get_student_grades(
+@blocking_endpoint
+def get_student_grades(
     student_id: str,
     db: Session = Depends(get_db),
 ) -> List[GradeToShowStudentResponseDTO]:
-    repo = GradeRepositoryImpl(db)
+    repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
     use_case = GetGradeUseCase(repo)
     students = use_case.execute_get_grades_by_student_id(student_id)
-    return [GradeToShowStudentResponseDTO.model_validate(grade) for grade in students]
+    return build_list_response(GRADE_TO_SHOW_STUDENT_LIST_SERIALIZER, students)
 
 @router.get("/subjects/{subject_id}", status_code=status.HTTP_200_OK, response_model=List[GradeToShowSubjectResponseDTO])
-async def get_subject_grades(
+@blocking_endpoint
+def get_subject_grades(
     subject_id: str,
     db: Session = Depends(get_db),
 ) -> List[GradeToShowSubjectResponseDTO]:
-    repo = GradeRepositoryImpl(db)
+    repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
     use_case = GetGradeUseCase(repo)
     subjects = use_case.execute_get_grades_by_subject_id(subject_id)
-    return [GradeToShowSubjectResponseDTO.model_validate(grade) for grade in subjects]
+    return build_list_response(GRADE_TO_SHOW_SUBJECT_LIST_SERIALIZER, subjects)
 
 @router.get("/{grade_id}", status_code=status.HTTP_200_OK, response_model=GradeResponseDTO)
-async def get_grade_by_id(
+@blocking_endpoint
+def get_grade_by_id(
     grade_id: int,
     db: Session = Depends(get_db)
 ) -> GradeResponseDTO:
@@ -154,7 +258,7 @@ async def get_grade_by_id(
     Get a grade by Id
     """
     try:
-        repo = GradeRepositoryImpl(db)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
         use_case = GetGradeUseCase(repo)
         grade = use_case.execute_by_id(grade_id)
         return GradeResponseDTO.model_validate(grade)
@@ -170,15 +274,16 @@ async def get_grade_by_id(
         )
     
 @router.get("/student/{student_id}", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
-async def get_grade_by_student_id(
+@blocking_endpoint
+def get_grade_by_student_id(
     student_id: str,
     db: Session = Depends(get_db)
 ) -> List[GradeResponseDTO]:
     try:
-        repo = GradeRepositoryImpl(db)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
         use_case = GetGradeUseCase(repo)
         grades = use_case.execute_by_student_id(student_id)
-        return [GradeResponseDTO.model_validate(grade) for grade in grades]
+        return build_list_response(GRADE_LIST_SERIALIZER, grades)
     except ResourceNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -191,15 +296,16 @@ async def get_grade_by_student_id(
         )
     
 @router.get("/subject/{subject_id}", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
-async def get_grade_by_subject_id(
+@blocking_endpoint
+def get_grade_by_subject_id(
     subject_id: str,
     db: Session = Depends(get_db)
 ) -> List[GradeResponseDTO]:
     try:
-        repo = GradeRepositoryImpl(db)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
         use_case = GetGradeUseCase(repo)
         grades = use_case.execute_by_subject_id(subject_id)
-        return [GradeResponseDTO.model_validate(grade) for grade in grades]
+        return build_list_response(GRADE_LIST_SERIALIZER, grades)
     except ResourceNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -213,23 +319,68 @@ async def get_grade_by_subject_id(
 
     
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[GradeResponseDTO])
-async def get_all_grade(
+@blocking_endpoint
+def get_all_grade(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
-    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER)
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
 ) -> List[GradeResponseDTO]:
     try:
-        repo = GradeRepositoryImpl(db)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
         use_case = GetGradeUseCase(repo)
         grades = use_case.execute_all(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, grades, page_size, ALLOWED_GRADES_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(GRADE_LIST_SERIALIZER, grades, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetGradesResponseDTO)
+@blocking_endpoint
+def get_grades_by_ids(
+    batch_data: BatchGetGradesDTO,
+    db: Session = Depends(get_db)
+) -> BatchGetGradesResponseDTO:
+    """
+    Get several grades by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the grades not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
+        use_case = GetGradeUseCase(repo)
+        grades = use_case.execute_by_ids(batch_data.ids)
+        return BatchGetGradesResponseDTO(
+            results=[
+                GradeResponseDTO.model_validate(grade) if grade is not None else None
+                for grade in grades
+            ],
+            missing_ids=[
+                grade_id for grade_id, grade in zip(batch_data.ids, grades) if grade is None
+            ]
         )
-        return [GradeResponseDTO.model_validate(grade) for grade in grades]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -237,19 +388,19 @@ async def get_all_grade(
         )
 
 @router.put("/{grade_id}", status_code=status.HTTP_200_OK, response_model=GradeResponseDTO)
-async def update_grade(
+@blocking_endpoint
+def update_grade(
     grade_id: int,
     grade_data: UpdateGradeDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> GradeResponseDTO:
     """
     Update a grade by Id
     """
     try:
-        grade_repo = GradeRepositoryImpl(db)
-        student_repo = StudentRepositoryImpl(db)
-        grade_service = GradeService()
-        use_case = UpdateGradeUseCase(grade_repo, student_repo, grade_service)
+        grade_repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = UpdateGradeUseCase(grade_repo, unit_of_work)
         grade = use_case.execute(
             map_update_grade_dto_to_entity(grade_id, grade_data)
         )
@@ -271,16 +422,18 @@ async def update_grade(
         )
     
 @router.delete("/{grade_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_grade(
+@blocking_endpoint
+def delete_grade(
     grade_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> None:
     """
     Delete a grade by Id
     """
     try:
-        repo = GradeRepositoryImpl(db)
-        use_case = DeleteGradeUseCase(repo)
+        repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = DeleteGradeUseCase(repo, unit_of_work)
         use_case.execute(grade_id)
     except ResourceNotFoundException as e:
         raise HTTPException(
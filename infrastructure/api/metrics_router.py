@@ -0,0 +1,75 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from typing import List
+
+from infrastructure.cache.entity_cache import entity_caches
+from infrastructure.db.database import engine, DATABASE_MODE
+from infrastructure.db.pool import get_pool_statistics
+from infrastructure.utils.metrics import PROMETHEUS_CONTENT_TYPE, format_metric, request_metrics
+
+router = APIRouter(tags=["Monitoring"])
+
+POOL_METRICS = [
+    ("sicei_db_pool_size", "gauge", "Connections kept open by the pool.", "size"),
+    ("sicei_db_pool_max_overflow", "gauge", "Connections the pool may open beyond its size.", "max_overflow"),
+    ("sicei_db_pool_checked_out", "gauge", "Connections in use.", "checked_out"),
+    ("sicei_db_pool_idle", "gauge", "Open connections waiting in the pool.", "idle"),
+    ("sicei_db_pool_overflow", "gauge", "Connections open beyond the pool size.", "overflow"),
+    ("sicei_db_pool_checkouts_total", "counter", "Connections checked out of the pool.", "checkouts"),
+    ("sicei_db_pool_checkout_timeouts_total", "counter", "Checkouts that timed out waiting for a connection.", "checkout_timeouts"),
+]
+
+def render_pool_metrics() -> List[str]:
+    pools = {"sync": get_pool_statistics(engine.pool)}
+
+    if DATABASE_MODE == "async":
+        from infrastructure.db.async_database import async_engine
+
+        pools["async"] = get_pool_statistics(async_engine.pool)
+
+    lines = []
+    for name, metric_type, help_text, field in POOL_METRICS:
+        lines += format_metric(
+            name, metric_type, help_text,
+            [((("pool", pool),), getattr(statistics, field)) for pool, statistics in pools.items()]
+        )
+
+    lines += format_metric(
+        "sicei_db_pool_checkout_wait_seconds_average", "gauge", "Average time checkouts waited for a connection.",
+        [((("pool", pool),), statistics.average_wait_ms / 1000) for pool, statistics in pools.items()]
+    )
+    lines += format_metric(
+        "sicei_db_pool_checkout_wait_seconds_max", "gauge", "Longest time a checkout waited for a connection.",
+        [((("pool", pool),), statistics.max_wait_ms / 1000) for pool, statistics in pools.items()]
+    )
+
+    return lines
+
+def render_cache_metrics() -> List[str]:
+    lines = []
+    lines += format_metric(
+        "sicei_cache_hits_total", "counter", "Lookups by ID served by the entity cache.",
+        [((("namespace", namespace),), cache.counters.hits) for namespace, cache in entity_caches.items()]
+    )
+    lines += format_metric(
+        "sicei_cache_misses_total", "counter", "Lookups by ID that missed the entity cache.",
+        [((("namespace", namespace),), cache.counters.misses) for namespace, cache in entity_caches.items()]
+    )
+
+    ratios = []
+    for namespace, cache in entity_caches.items():
+        lookups = cache.counters.hits + cache.counters.misses
+        ratios.append(((("namespace", namespace),), cache.counters.hits / lookups if lookups else 0.0))
+
+    lines += format_metric("sicei_cache_hit_ratio", "gauge", "Share of the lookups by ID served by the entity cache.", ratios)
+    return lines
+
+@router.get("/metrics", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Get the request latencies, requests in progress, exceptions, connection
+    pools and entity cache lookups of this process in the Prometheus text format.
+    """
+    lines = request_metrics.render() + render_pool_metrics() + render_cache_metrics()
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
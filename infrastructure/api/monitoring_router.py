@@ -0,0 +1,49 @@
+from fastapi import APIRouter, status
+
+from typing import List
+
+from infrastructure.cache.entity_cache import entity_caches
+from infrastructure.db.database import engine, DATABASE_MODE
+from infrastructure.db.pool import get_pool_statistics
+from infrastructure.schemas.monitoring_schema import CacheStatisticsResponseDTO, ConnectionPoolsResponseDTO, PoolStatisticsResponseDTO
+
+router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
+
+@router.get("/pool", status_code=status.HTTP_200_OK, response_model=ConnectionPoolsResponseDTO)
+async def get_connection_pools() -> ConnectionPoolsResponseDTO:
+    """
+    Get the connections checked out, idle and in overflow of the database pools
+    of this process, and how long checkouts have waited for a connection.
+    """
+    async_pool = None
+
+    if DATABASE_MODE == "async":
+        from infrastructure.db.async_database import async_engine
+
+        async_pool = PoolStatisticsResponseDTO.model_validate(
+            get_pool_statistics(async_engine.pool)
+        )
+
+    return ConnectionPoolsResponseDTO(
+        sync_pool=PoolStatisticsResponseDTO.model_validate(get_pool_statistics(engine.pool)),
+        async_pool=async_pool
+    )
+
+@router.get("/cache", status_code=status.HTTP_200_OK, response_model=List[CacheStatisticsResponseDTO])
+async def get_cache_statistics() -> List[CacheStatisticsResponseDTO]:
+    """
+    Get the hits and misses of the student, subject and grade lookups by ID
+    served by the cache of this process.
+    """
+    statistics = []
+
+    for namespace, cache in entity_caches.items():
+        lookups = cache.counters.hits + cache.counters.misses
+        statistics.append(CacheStatisticsResponseDTO(
+            namespace=namespace,
+            hits=cache.counters.hits,
+            misses=cache.counters.misses,
+            hit_ratio=cache.counters.hits / lookups if lookups else 0.0
+        ))
+
+    return statistics
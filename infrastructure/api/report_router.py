@@ -3,7 +3,9 @@ from fastapi import (
     Depends,
     HTTPException,
     status,
-    Query
+    Header,
+    Query,
+    Response
 )
 
 from typing import Annotated, Optional, List
@@ -13,29 +15,52 @@ from sqlalchemy.orm import Session
 from infrastructure.db.database import get_db
 from infrastructure.repositories.subject_repository_impl import SubjectRepositoryImpl
 from infrastructure.repositories.student_repository_impl import StudentRepositoryImpl
+from infrastructure.repositories.cached_student_repository_impl import CachedStudentRepositoryImpl
 from infrastructure.repositories.grade_repository_impl import GradeRepositoryImpl
-from infrastructure.schemas.report_schema import ReportStudentsResponseDTO, ReportSubjectsResponseDTO, StudentsDashboardResponseDTO
+from infrastructure.repositories.report_version_repository_impl import ReportVersionRepositoryImpl
+from infrastructure.repositories.cached_grade_repository_impl import CachedGradeRepositoryImpl
+from infrastructure.schemas.report_schema import ReportStudentsResponseDTO, ReportSubjectsResponseDTO, StudentsDashboardResponseDTO, STUDENTS_DASHBOARD_LIST_SERIALIZER
 from infrastructure.utils.constants import SORTERS_FIELD, SORTERS_ORDER
+from infrastructure.utils.http_caching import build_etag, etag_matches, not_modified_response, set_cache_headers
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+from infrastructure.utils.threadpool import blocking_endpoint
 
 from application.use_cases.reports.get_report import GetReportUseCase
 
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
 @router.get("/students/{student_id}/grades", status_code=status.HTTP_200_OK, response_model=ReportStudentsResponseDTO)
-async def get_student_subjects_grades(
+@blocking_endpoint
+def get_student_subjects_grades(
     student_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_db)
 ) -> ReportStudentsResponseDTO:
     """
     Get grades with average for a specific student by their ID.
+    Send the ETag of a previous response in If-None-Match to get a 304 while it is unchanged.
     """
     try:
-        student_repo = StudentRepositoryImpl(db)
-        grade_repo = GradeRepositoryImpl(db)
+        student_repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
+        grade_repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
+        report_version_repo = ReportVersionRepositoryImpl(db)
         use_case = GetReportUseCase(
             student_repository=student_repo,
-            grade_repository=grade_repo
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
         )
+        version = use_case.get_student_report_version(student_id)
+        if version is not None:
+            etag = build_etag(version)
+            if etag_matches(if_none_match, etag):
+                return not_modified_response(etag)
+            set_cache_headers(response, etag)
+
         grades, average = use_case.execute_by_student_id(student_id)
         return ReportStudentsResponseDTO(
             subjects=grades,
@@ -48,24 +73,43 @@ async def get_student_subjects_grades(
         )
 
 @router.get("/subjects/{subject_id}/grades", status_code=status.HTTP_200_OK, response_model=ReportSubjectsResponseDTO)
-async def get_subject_students_grades(
+@blocking_endpoint
+def get_subject_students_grades(
     subject_id: str,
+    response: Response,
+    include_students: Annotated[bool, Query(alias="includeStudents")] = True,
+    if_none_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_db)
 ) -> ReportSubjectsResponseDTO:
     """
-    Get students with grades for a specific subject by its ID.
+    Get students with grades for a specific subject by its ID, along with
+    the subject statistics. Use includeStudents=false to get only the statistics.
+    Send the ETag of a previous response in If-None-Match to get a 304 while it is unchanged.
     """
     try:
-        student_repo = StudentRepositoryImpl(db)
-        grade_repo = GradeRepositoryImpl(db)
+        student_repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
+        grade_repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
+        report_version_repo = ReportVersionRepositoryImpl(db)
         use_case = GetReportUseCase(
             student_repository=student_repo,
-            grade_repository=grade_repo
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
+        )
+        version = use_case.get_subject_report_version(subject_id)
+        if version is not None:
+            etag = build_etag(version, "students" if include_students else "statistics")
+            if etag_matches(if_none_match, etag):
+                return not_modified_response(etag)
+            set_cache_headers(response, etag)
+
+        students, statistics = use_case.execute_by_subject_id(
+            subject_id,
+            include_grades=include_students
         )
-        students, average = use_case.execute_by_subject_id(subject_id)
         return ReportSubjectsResponseDTO(
             students=students,
-            average=average
+            average=statistics.average,
+            statistics=statistics
         )
     except Exception as e:
         raise HTTPException(
@@ -74,31 +118,48 @@ async def get_subject_students_grades(
         )
     
 @router.get("/students", status_code=status.HTTP_200_OK, response_model=List[StudentsDashboardResponseDTO])
-async def get_all_students_for_dashboard(
+@blocking_endpoint
+def get_all_students_for_dashboard(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias=SORTERS_FIELD),
-    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER)
+    sort_order: Optional[str] = Query(default=None, alias=SORTERS_ORDER),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
 ) -> List[StudentsDashboardResponseDTO]:
     """
     Get all the students for the students dashboard
     """
 
     try:
-        student_repo = StudentRepositoryImpl(db)
-        grade_repo = GradeRepositoryImpl(db)
+        student_repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
+        grade_repo = CachedGradeRepositoryImpl(GradeRepositoryImpl(db))
+        report_version_repo = ReportVersionRepositoryImpl(db)
         use_case = GetReportUseCase(
             student_repository=student_repo,
-            grade_repository=grade_repo
+            grade_repository=grade_repo,
+            report_version_repository=report_version_repo
         )
         students = use_case.execute_all_students_dashboard(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENTS_DASHBOARD_LIST_SERIALIZER, students, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        return [StudentsDashboardResponseDTO.model_validate(student) for student in students]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
 
 from typing import Annotated, List, Optional
 
 from sqlalchemy.orm import Session
 
+from application.unit_of_work import UnitOfWork
 from application.use_cases.students.create_student import CreateStudentUseCase
+from application.use_cases.students.create_students_bulk import CreateStudentsBulkUseCase
 from application.use_cases.students.get_student import GetStudentUseCase
 from application.use_cases.students.update_student import UpdateStudentUseCase
 from application.use_cases.students.delete_student import DeleteStudentUseCase
@@ -13,23 +15,33 @@ from domain.exceptions.cannot_create_exception import CannotCreateException
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
 from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
 from domain.utils.constants import UNEXPECTED_ERROR
 
 from infrastructure.repositories.student_repository_impl import StudentRepositoryImpl
-from infrastructure.schemas.student_schema import CreateStudentDTO, UpdateStudentDTO, StudentResponseDTO
-from infrastructure.mappers.student_mappers import map_create_student_dto_to_entity, map_update_student_dto_to_entity
+from infrastructure.repositories.cached_student_repository_impl import CachedStudentRepositoryImpl
+from infrastructure.repositories.student_id_repository_impl import student_id_repository
+from infrastructure.schemas.student_schema import CreateStudentDTO, UpdateStudentDTO, StudentResponseDTO, BatchGetStudentsDTO, BatchGetStudentsResponseDTO, BulkStudentRowDTO, BulkStudentResponseDTO, STUDENT_LIST_SERIALIZER
+from infrastructure.mappers.student_mappers import map_create_student_dto_to_entity, map_update_student_dto_to_entity, map_bulk_student_rows_to_entities, map_students_csv_to_entities
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_SORT_FIELDS
+from infrastructure.utils.serialization import ResponseFormat, build_list_response
+from infrastructure.utils.threadpool import blocking_endpoint
 from infrastructure.db.database import get_db
+from infrastructure.db.unit_of_work_impl import get_unit_of_work
 
 router = APIRouter(prefix="/students", tags=["Students"])
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=StudentResponseDTO)
-async def create_student(
+@blocking_endpoint
+def create_student(
     student_data: CreateStudentDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> StudentResponseDTO:
     try:
-        repo = StudentRepositoryImpl(db)
-        use_case = CreateStudentUseCase(repo)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateStudentUseCase(repo, student_id_repository, unit_of_work)
         student = use_case.execute(
             map_create_student_dto_to_entity(student_data)
         )
@@ -45,13 +57,83 @@ async def create_student(
             detail=UNEXPECTED_ERROR + str(e)
         )
 
+@router.post("/bulk", status_code=status.HTTP_200_OK, response_model=BulkStudentResponseDTO)
+@blocking_endpoint
+def create_students_bulk(
+    students_data: List[BulkStudentRowDTO],
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
+) -> BulkStudentResponseDTO:
+    """
+    Enroll several students from a JSON array in a single transaction.
+    Returns the ID given to every row in input order; invalid rows are
+    skipped, get a null ID and are reported by their 1-based position.
+    """
+    try:
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateStudentsBulkUseCase(repo, student_id_repository, unit_of_work)
+        result = use_case.execute(
+            map_bulk_student_rows_to_entities(students_data)
+        )
+        return BulkStudentResponseDTO.model_validate(result)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/bulk/csv", status_code=status.HTTP_200_OK, response_model=BulkStudentResponseDTO)
+@blocking_endpoint
+def create_students_bulk_from_csv(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
+) -> BulkStudentResponseDTO:
+    """
+    Enroll several students from a CSV upload with a name,lastname,email,semester
+    header in a single transaction. Returns the ID given to every data row in
+    input order; invalid rows are skipped, get a null ID and are reported by
+    their 1-based position, not counting the header.
+    """
+    try:
+        content = file.file.read().decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateStudentsBulkUseCase(repo, student_id_repository, unit_of_work)
+        result = use_case.execute(
+            map_students_csv_to_entities(content)
+        )
+        return BulkStudentResponseDTO.model_validate(result)
+    except CannotCreateException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
 @router.get("/{student_id}", status_code=status.HTTP_200_OK, response_model=StudentResponseDTO)
-async def get_student_by_id(
+@blocking_endpoint
+def get_student_by_id(
     student_id: str,
     db: Session = Depends(get_db)
 ) -> StudentResponseDTO:
     try:
-        repo = StudentRepositoryImpl(db)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
         use_case = GetStudentUseCase(repo)
         student = use_case.execute_by_id(student_id)
         return StudentResponseDTO.model_validate(student)
@@ -67,15 +149,16 @@ async def get_student_by_id(
         )
     
 @router.get("/semester/{students_semester}", status_code=status.HTTP_200_OK, response_model=List[StudentResponseDTO])
-async def get_students_by_semester(
+@blocking_endpoint
+def get_students_by_semester(
     students_semester: int,
     db: Session = Depends(get_db)
 ) -> List[StudentResponseDTO]:
     try:
-        repo = StudentRepositoryImpl(db)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
         use_case = GetStudentUseCase(repo)
         students = use_case.execute_by_semester(students_semester)
-        return [StudentResponseDTO.model_validate(student) for student in students]
+        return build_list_response(STUDENT_LIST_SERIALIZER, students)
     except ResourceNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,23 +172,68 @@ async def get_students_by_semester(
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[StudentResponseDTO])
-async def get_all_students(
+@blocking_endpoint
+def get_all_students(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias="sorters[0][field]"),
-    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]")
+    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]"),
+    cursor: Optional[str] = Query(default=None),
+    response_format: ResponseFormat = Query(
+        default=ResponseFormat.ROWS,
+        alias="format",
+        description="columnar returns {columns, rows} instead of an array of objects"
+    )
 ) -> List[StudentResponseDTO]:
     try:
-        repo = StudentRepositoryImpl(db)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
         use_case = GetStudentUseCase(repo)
         students = use_case.execute_all(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, students, page_size, ALLOWED_STUDENT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(STUDENT_LIST_SERIALIZER, students, response, response_format)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetStudentsResponseDTO)
+@blocking_endpoint
+def get_students_by_ids(
+    batch_data: BatchGetStudentsDTO,
+    db: Session = Depends(get_db)
+) -> BatchGetStudentsResponseDTO:
+    """
+    Get several students by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the students not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db))
+        use_case = GetStudentUseCase(repo)
+        students = use_case.execute_by_ids(batch_data.ids)
+        return BatchGetStudentsResponseDTO(
+            results=[
+                StudentResponseDTO.model_validate(student) if student is not None else None
+                for student in students
+            ],
+            missing_ids=[
+                student_id for student_id, student in zip(batch_data.ids, students) if student is None
+            ]
         )
-        return [StudentResponseDTO.model_validate(student) for student in students]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -113,14 +241,16 @@ async def get_all_students(
         )
 
 @router.put("/{student_id}", status_code=status.HTTP_200_OK, response_model=StudentResponseDTO)
-async def update_student(
+@blocking_endpoint
+def update_student(
     student_id: str,
     student_data: UpdateStudentDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> StudentResponseDTO:
     try:
-        repo = StudentRepositoryImpl(db)
-        use_case = UpdateStudentUseCase(repo)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = UpdateStudentUseCase(repo, unit_of_work)
         updated_student = use_case.execute(
             map_update_student_dto_to_entity(student_id, student_data)
         )
@@ -142,13 +272,15 @@ async def update_student(
         )
 
 @router.delete("/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_student(
+@blocking_endpoint
+def delete_student(
     student_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     try:
-        repo = StudentRepositoryImpl(db)
-        use_case = DeleteStudentUseCase(repo)
+        repo = CachedStudentRepositoryImpl(StudentRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = DeleteStudentUseCase(repo, unit_of_work)
         use_case.execute(student_id)
     except ResourceNotFoundException as e:
         raise HTTPException(
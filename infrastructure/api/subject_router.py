@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 
 from typing import Annotated, List, Optional
 
 from sqlalchemy.orm import Session
 
+from application.unit_of_work import UnitOfWork
 from application.use_cases.subjects.create_subject import CreateSubjectUseCase
 from application.use_cases.subjects.get_subject import GetSubjectUseCase
 from application.use_cases.subjects.update_subject import UpdateSubjectUseCase
@@ -13,23 +14,32 @@ from domain.exceptions.cannot_create_exception import CannotCreateException
 from domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 from domain.exceptions.cannot_update_resource_exception import CannotUpdateResourceException
 from domain.exceptions.cannot_delete_resource_exception import CannotDeleteResourceException
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
 from domain.utils.constants import UNEXPECTED_ERROR
 
 from infrastructure.db.database import get_db
+from infrastructure.db.unit_of_work_impl import get_unit_of_work
 from infrastructure.repositories.subject_repository_impl import SubjectRepositoryImpl
-from infrastructure.schemas.subject_schema import CreateSubjectDTO, UpdateSubjectDTO, SubjectResponseDTO
+from infrastructure.repositories.cached_subject_repository_impl import CachedSubjectRepositoryImpl
+from infrastructure.schemas.subject_schema import CreateSubjectDTO, UpdateSubjectDTO, SubjectResponseDTO, BatchGetSubjectsDTO, BatchGetSubjectsResponseDTO, SUBJECT_LIST_SERIALIZER
 from infrastructure.mappers.subject_mappers import map_create_subject_dto_to_entity, map_update_subject_dto_to_entity
+from infrastructure.utils.pagination import set_next_cursor_header
+from infrastructure.utils.sort_fields import ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.serialization import build_list_response
+from infrastructure.utils.threadpool import blocking_endpoint
 
 router = APIRouter(prefix="/subjects", tags=["Subjects"])
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=SubjectResponseDTO)
-async def create_subject(
+@blocking_endpoint
+def create_subject(
     subject_data: CreateSubjectDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> SubjectResponseDTO:
     try:
-        repo = SubjectRepositoryImpl(db)
-        use_case = CreateSubjectUseCase(repo)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = CreateSubjectUseCase(repo, unit_of_work)
         subject = use_case.execute(
             map_create_subject_dto_to_entity(subject_data)
         )
@@ -46,12 +56,13 @@ async def create_subject(
         )
 
 @router.get("/{subject_id}", status_code=status.HTTP_200_OK, response_model=SubjectResponseDTO)
-async def get_subject_by_id(
+@blocking_endpoint
+def get_subject_by_id(
     subject_id: str,
     db: Session = Depends(get_db)
 ) -> SubjectResponseDTO:
     try:
-        repo = SubjectRepositoryImpl(db)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db))
         use_case = GetSubjectUseCase(repo)
         subject = use_case.execute_by_id(subject_id)
         return SubjectResponseDTO.model_validate(subject)
@@ -67,15 +78,16 @@ async def get_subject_by_id(
         )
 
 @router.get("/semester/{subjects_semester}", status_code=status.HTTP_200_OK, response_model=List[SubjectResponseDTO])
-async def get_subjects_by_semester(
+@blocking_endpoint
+def get_subjects_by_semester(
     subjects_semester: int,
     db: Session = Depends(get_db)
 ) -> List[SubjectResponseDTO]:
     try:
-        repo = SubjectRepositoryImpl(db)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db))
         use_case = GetSubjectUseCase(repo)
         subjects = use_case.execute_by_semester(subjects_semester)
-        return [SubjectResponseDTO.model_validate(subject) for subject in subjects]
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects)
     except ResourceNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -88,23 +100,63 @@ async def get_subjects_by_semester(
         )
             
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[SubjectResponseDTO])
-async def get_all_subjects(
+@blocking_endpoint
+def get_all_subjects(
+    response: Response,
     db: Session = Depends(get_db),
     page_size: Annotated[int, Query(alias="pageSize")] = 25,
     current: Annotated[int, Query(alias="current")] = 1,
     sort_field: Optional[str] = Query(default=None, alias="sorters[0][field]"),
-    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]")
+    sort_order: Optional[str] = Query(default=None, alias="sorters[0][order]"),
+    cursor: Optional[str] = Query(default=None)
 ) -> List[SubjectResponseDTO]:
     try:
-        repo = SubjectRepositoryImpl(db)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db))
         use_case = GetSubjectUseCase(repo)
         subjects = use_case.execute_all(
             page_size=page_size,
             page=current,
             sort_field=sort_field,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        set_next_cursor_header(response, subjects, page_size, ALLOWED_SUBJECT_SORT_FIELDS, sort_field, sort_order)
+        return build_list_response(SUBJECT_LIST_SERIALIZER, subjects, response)
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=UNEXPECTED_ERROR + str(e)
+        )
+
+@router.post("/batch-get", status_code=status.HTTP_200_OK, response_model=BatchGetSubjectsResponseDTO)
+@blocking_endpoint
+def get_subjects_by_ids(
+    batch_data: BatchGetSubjectsDTO,
+    db: Session = Depends(get_db)
+) -> BatchGetSubjectsResponseDTO:
+    """
+    Get several subjects by ID in a single query. Results follow the order of the
+    requested IDs, with null in place of the subjects not found, which are also
+    listed in missing_ids.
+    """
+    try:
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db))
+        use_case = GetSubjectUseCase(repo)
+        subjects = use_case.execute_by_ids(batch_data.ids)
+        return BatchGetSubjectsResponseDTO(
+            results=[
+                SubjectResponseDTO.model_validate(subject) if subject is not None else None
+                for subject in subjects
+            ],
+            missing_ids=[
+                subject_id for subject_id, subject in zip(batch_data.ids, subjects) if subject is None
+            ]
         )
-        return [SubjectResponseDTO.model_validate(subject) for subject in subjects]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -112,14 +164,16 @@ async def get_all_subjects(
         )
 
 @router.put("/{subject_id}", status_code=status.HTTP_200_OK, response_model=SubjectResponseDTO)
-async def update_subject(
+@blocking_endpoint
+def update_subject(
     subject_id: str,
     subject_data: UpdateSubjectDTO,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ) -> SubjectResponseDTO:
     try:
-        repo = SubjectRepositoryImpl(db)
-        use_case = UpdateSubjectUseCase(repo)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = UpdateSubjectUseCase(repo, unit_of_work)
         updated_subject = use_case.execute(
             map_update_subject_dto_to_entity(subject_id, subject_data)
         )
@@ -141,13 +195,15 @@ async def update_subject(
         )
 
 @router.delete("/{subject_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_subject(
+@blocking_endpoint
+def delete_subject(
     subject_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     try:
-        repo = SubjectRepositoryImpl(db)
-        use_case = DeleteSubjectUseCase(repo)
+        repo = CachedSubjectRepositoryImpl(SubjectRepositoryImpl(db), unit_of_work=unit_of_work)
+        use_case = DeleteSubjectUseCase(repo, unit_of_work)
         use_case.execute(subject_id)
     except ResourceNotFoundException as e:
         raise HTTPException(
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from typing import Any, Optional
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        To get the value stored under a key, or None if it is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """
+        To store a value under a key until it expires or is evicted.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """
+        To remove the values stored under the given keys.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        To remove every stored value.
+        """
+        pass
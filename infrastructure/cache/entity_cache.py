@@ -0,0 +1,80 @@
+import os
+
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from application.async_unit_of_work import AsyncUnitOfWork
+from application.unit_of_work import UnitOfWork
+
+from infrastructure.cache.cache_backend import CacheBackend
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+
+@dataclass
+class CacheCounters:
+    hits: int = 0
+    misses: int = 0
+
+class EntityCache:
+    """
+    Caches the entities of one kind by ID in a backend shared with the other
+    kinds, counting the hits and misses of the lookups.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend):
+        self.namespace = namespace
+        self.backend = backend
+        self.counters = CacheCounters()
+        self._lock = Lock()
+
+    def get(self, entity_id: Any) -> Optional[Any]:
+        entity = self.backend.get(self._key(entity_id))
+
+        with self._lock:
+            if entity is None:
+                self.counters.misses += 1
+            else:
+                self.counters.hits += 1
+
+        # Callers get their own copy, so changing it does not alter the cached entity
+        return replace(entity) if entity is not None else None
+
+    def contains(self, entity_id: Any) -> bool:
+        # An existence probe is not a lookup, so it leaves the hit ratio alone
+        return self.backend.get(self._key(entity_id)) is not None
+
+    def set(self, entity_id: Any, entity: Any) -> None:
+        self.backend.set(self._key(entity_id), replace(entity))
+
+    def invalidate(self, *entity_ids: Any) -> None:
+        self.backend.delete(*(self._key(entity_id) for entity_id in entity_ids))
+
+    def _key(self, entity_id: Any) -> str:
+        return f"{self.namespace}:{entity_id}"
+
+cache_backend: CacheBackend = InMemoryCacheBackend(
+    max_entries=CACHE_MAX_ENTRIES,
+    ttl_seconds=CACHE_TTL_SECONDS
+)
+
+def invalidate_entities(cache: EntityCache, unit_of_work: Optional[UnitOfWork | AsyncUnitOfWork], *entity_ids: Any) -> None:
+    """
+    Invalidates the entities right away, so the rest of the request reads the
+    changes, and again once unit_of_work commits, since a concurrent request may
+    have cached the old rows before the changes became visible to it.
+    """
+    cache.invalidate(*entity_ids)
+
+    if unit_of_work is not None:
+        unit_of_work.after_commit(lambda: cache.invalidate(*entity_ids))
+
+student_cache = EntityCache("students", cache_backend)
+subject_cache = EntityCache("subjects", cache_backend)
+grade_cache = EntityCache("grades", cache_backend)
+
+entity_caches: Dict[str, EntityCache] = {
+    cache.namespace: cache for cache in (student_cache, subject_cache, grade_cache)
+}
@@ -0,0 +1,52 @@
+import time
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from infrastructure.cache.cache_backend import CacheBackend
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local LRU cache whose entries expire after a fixed time to live.
+    Each API worker keeps its own copy, so a write served by another worker is
+    only seen here once the entry expires.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,120 @@
+"""
+Checks that the hot lookup queries are served by an index. Every query is
+explained with sequential scans disabled, so the planner only falls back to one
+when no index can serve the query, and the command exits with status 1 if any
+plan still contains a sequential scan:
+
+    python -m infrastructure.commands.check_query_plans
+
+Run it against a database migrated with `alembic upgrade head`.
+"""
+import sys
+
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import Executable, select, text
+from sqlalchemy.orm import Session
+
+from infrastructure.db.database import SessionLocal
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.db.queries import (
+    build_students_dashboard_query,
+    build_student_grades_to_show_query,
+    build_subject_grades_to_show_query,
+    build_subject_grade_statistics_query
+)
+
+SAMPLE_ID = "sample"
+SAMPLE_SEMESTER = 1
+
+def get_hot_queries() -> List[Tuple[str, Executable]]:
+    """
+    Builds the queries whose plans are checked, with sample arguments.
+
+    Returns:
+        List[Tuple[str, Executable]]: The name and statement of every hot query.
+    """
+    return [
+        ("grades by student", select(GradeModel).where(GradeModel.student_id == SAMPLE_ID)),
+        ("grades by subject", select(GradeModel).where(GradeModel.subject_id == SAMPLE_ID)),
+        (
+            "grade by student and subject",
+            select(GradeModel.id).where(
+                GradeModel.student_id == SAMPLE_ID,
+                GradeModel.subject_id == SAMPLE_ID
+            )
+        ),
+        ("student grades report", build_student_grades_to_show_query(SAMPLE_ID)),
+        ("subject grades report", build_subject_grades_to_show_query(SAMPLE_ID)),
+        ("subject grade statistics", build_subject_grade_statistics_query(SAMPLE_ID)),
+        ("students by semester", select(StudentModel).where(StudentModel.semester == SAMPLE_SEMESTER)),
+        ("subjects by semester", select(SubjectModel).where(SubjectModel.semester == SAMPLE_SEMESTER)),
+        (
+            "students dashboard sorted by average",
+            build_students_dashboard_query(page_size=25, page=1, sort_field="average", sort_order="desc")
+        ),
+        (
+            "students dashboard sorted by status",
+            build_students_dashboard_query(page_size=25, page=1, sort_field="status", sort_order="asc")
+        ),
+    ]
+
+def iter_plan_nodes(plan: dict) -> Iterator[dict]:
+    """
+    Walks a plan node and all of its children.
+
+    Args:
+        plan (dict): A node of an EXPLAIN (FORMAT JSON) plan.
+
+    Returns:
+        Iterator[dict]: The node followed by its descendants.
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+def find_sequential_scans(db: Session, statement: Executable) -> List[str]:
+    """
+    Explains a statement with sequential scans disabled.
+
+    Args:
+        db (Session): Session used to run EXPLAIN, rolled back afterwards.
+        statement (Executable): The statement to explain.
+
+    Returns:
+        List[str]: The tables that the plan still reads with a sequential scan.
+    """
+    compiled = statement.compile(bind=db.get_bind(), compile_kwargs={"literal_binds": True})
+
+    try:
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        (plan,) = db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()
+    finally:
+        db.rollback()
+
+    return [
+        node["Relation Name"]
+        for node in iter_plan_nodes(plan["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    ]
+
+def main():
+    db = SessionLocal()
+    failed = False
+
+    try:
+        for name, statement in get_hot_queries():
+            scanned_tables = find_sequential_scans(db, statement)
+
+            if scanned_tables:
+                failed = True
+                print(f"FAIL {name}: sequential scan on {', '.join(scanned_tables)}")
+            else:
+                print(f"ok   {name}")
+    finally:
+        db.close()
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Rebuilds the running grade totals and the average of every student from the
+grades table, and the students dashboard snapshot from them. Run it after
+restoring data or whenever the averages are suspected to have drifted:
+
+    python -m infrastructure.commands.rebuild_student_averages
+"""
+from infrastructure.db.database import SessionLocal
+from infrastructure.db.unit_of_work_impl import UnitOfWorkImpl
+from infrastructure.repositories.student_average_repository_impl import StudentAverageRepositoryImpl
+from infrastructure.repositories.student_dashboard_repository_impl import StudentDashboardRepositoryImpl
+from infrastructure.repositories.report_version_repository_impl import ReportVersionRepositoryImpl
+
+from application.use_cases.students.rebuild_student_averages import RebuildStudentAveragesUseCase
+
+def main():
+    db = SessionLocal()
+
+    try:
+        use_case = RebuildStudentAveragesUseCase(
+            StudentAverageRepositoryImpl(db),
+            StudentDashboardRepositoryImpl(db),
+            ReportVersionRepositoryImpl(db),
+            UnitOfWorkImpl(db)
+        )
+        students_updated = use_case.execute()
+        print(f"Rebuilt the average of {students_updated} students")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infrastructure.db.database import DB_USER, DB_PASSWORD, DB_NAME, DB_HOST, DB_PORT, POOL_OPTIONS
+from infrastructure.db.pool import TimedAsyncAdaptedQueuePool
+from infrastructure.db.query_stats import instrument_engine
+
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    **POOL_OPTIONS
+)
+instrument_engine(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+async def get_async_db():
+    db = AsyncSessionLocal()
+
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,22 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from infrastructure.db.async_database import get_async_db
+
+class AsyncUnitOfWorkImpl(AsyncUnitOfWork):
+    """Implementation of the AsyncUnitOfWork interface over the AsyncSession the repositories share."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__()
+        self.db = db
+
+    async def _commit(self) -> None:
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        await self.db.rollback()
+
+def get_async_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> AsyncUnitOfWork:
+    return AsyncUnitOfWorkImpl(db)
@@ -5,6 +5,9 @@ from sqlalchemy.orm import sessionmaker
 
 from dotenv import load_dotenv
 
+from infrastructure.db.pool import TimedQueuePool
+from infrastructure.db.query_stats import instrument_engine
+
 load_dotenv()
 
 DB_USER = os.getenv("POSTGRES_USER")
@@ -13,9 +16,22 @@ DB_NAME = os.getenv("POSTGRES_DB")
 DB_HOST = os.getenv("POSTGRES_HOST")
 DB_PORT = os.getenv("POSTGRES_PORT")
 
+# "sync" serves requests through Session/psycopg2, "async" through AsyncSession/asyncpg
+DATABASE_MODE = os.getenv("DATABASE_MODE", "sync").lower()
+
+# Shared by the sync and async engines, each process opens up to size + overflow connections per engine
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", "10")),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "-1")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
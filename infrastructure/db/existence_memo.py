@@ -0,0 +1,52 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# The memo lives in Session.info, so it is created and dropped with the session of each request
+EXISTENCE_MEMO_KEY = "existence_memo"
+
+def _get_existence_memo(info: Dict[Any, Any]) -> Dict[Tuple[str, Any], bool]:
+    return info.setdefault(EXISTENCE_MEMO_KEY, {})
+
+def get_memoized_existence(info: Dict[Any, Any], model: type, entity_id: Any) -> Optional[bool]:
+    """
+    Looks up whether a row was already found to exist during this session.
+
+    Args:
+        info (Dict[Any, Any]): The info dictionary of the Session or AsyncSession.
+        model (type): The mapped model of the row.
+        entity_id (Any): The primary key of the row.
+
+    Returns:
+        Optional[bool]: Whether the row exists, or None if it was not checked yet.
+    """
+    return _get_existence_memo(info).get((model.__tablename__, entity_id))
+
+def memoize_existence(info: Dict[Any, Any], model: type, entity_ids: Iterable[Any], exists: bool) -> None:
+    """
+    Remembers for the rest of the session whether the rows exist.
+
+    Args:
+        info (Dict[Any, Any]): The info dictionary of the Session or AsyncSession.
+        model (type): The mapped model of the rows.
+        entity_ids (Iterable[Any]): The primary keys of the rows.
+        exists (bool): Whether the rows exist.
+    """
+    memo = _get_existence_memo(info)
+    for entity_id in entity_ids:
+        memo[(model.__tablename__, entity_id)] = exists
+
+def forget_existence(info: Dict[Any, Any], model: type, entity_ids: Iterable[Any]) -> None:
+    """
+    Drops what is remembered about the rows, to be called by every write that
+    inserts or deletes them.
+
+    Args:
+        info (Dict[Any, Any]): The info dictionary of the Session or AsyncSession.
+        model (type): The mapped model of the rows.
+        entity_ids (Iterable[Any]): The primary keys of the rows.
+    """
+    memo = info.get(EXISTENCE_MEMO_KEY)
+    if not memo:
+        return
+
+    for entity_id in entity_ids:
+        memo.pop((model.__tablename__, entity_id), None)
@@ -0,0 +1,86 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+Creates the tables as they were built by Base.metadata.create_all before the
+schema was versioned. Tables that already exist are left untouched, so databases
+created by the API before migrations were introduced can be upgraded in place.
+
+Those databases did not keep students.average up to date on every grade change,
+so the running totals and every average are recomputed from the grades.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "students" not in existing_tables:
+        op.create_table(
+            "students",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("lastname", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("semester", sa.Integer(), nullable=False),
+            sa.Column("average", sa.Float(), nullable=False),
+        )
+
+    if "subjects" not in existing_tables:
+        op.create_table(
+            "subjects",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("credits", sa.Integer(), nullable=False),
+            sa.Column("semester", sa.Integer(), nullable=False),
+        )
+
+    if "grades" not in existing_tables:
+        op.create_table(
+            "grades",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("student_id", sa.String(), sa.ForeignKey("students.id"), nullable=False),
+            sa.Column("subject_id", sa.String(), sa.ForeignKey("subjects.id"), nullable=False),
+            sa.Column("value", sa.Float(), nullable=False),
+        )
+
+    if "student_grade_stats" not in existing_tables:
+        op.create_table(
+            "student_grade_stats",
+            sa.Column(
+                "student_id",
+                sa.String(),
+                sa.ForeignKey("students.id", ondelete="CASCADE"),
+                primary_key=True
+            ),
+            sa.Column("grades_sum", sa.Float(), nullable=False),
+            sa.Column("grades_count", sa.Integer(), nullable=False),
+        )
+
+    op.execute("DELETE FROM student_grade_stats")
+    op.execute(
+        "INSERT INTO student_grade_stats (student_id, grades_sum, grades_count) "
+        "SELECT student_id, sum(value), count(id) FROM grades GROUP BY student_id"
+    )
+    op.execute(
+        "UPDATE students SET average = coalesce(("
+        "SELECT grades_sum / grades_count FROM student_grade_stats "
+        "WHERE student_grade_stats.student_id = students.id AND grades_count > 0"
+        "), 0.0)"
+    )
+
+def downgrade() -> None:
+    op.drop_table("student_grade_stats")
+    op.drop_table("grades")
+    op.drop_table("subjects")
+    op.drop_table("students")
@@ -0,0 +1,50 @@
+"""indexes for the hot lookup columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:30:00.000000
+
+Grades are looked up by student (reports, averages) and by
+subject (subject reports and statistics), students and subjects by semester.
+A student has a single grade per subject, which is now enforced by a unique
+constraint on (student_id, subject_id); the constraint's index also serves the
+lookups by student_id, so that column gets no index of its own.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    duplicated_pairs = op.get_bind().execute(sa.text(
+        "SELECT count(*) FROM ("
+        "SELECT student_id, subject_id FROM grades "
+        "GROUP BY student_id, subject_id HAVING count(*) > 1"
+        ") AS duplicated"
+    )).scalar_one()
+
+    if duplicated_pairs:
+        raise RuntimeError(
+            f"{duplicated_pairs} student/subject pairs have more than one grade. "
+            "Remove the duplicated grades, rebuild the student averages and run the migration again."
+        )
+
+    op.create_unique_constraint(
+        "uq_grades_student_id_subject_id",
+        "grades",
+        ["student_id", "subject_id"]
+    )
+    op.create_index("ix_grades_subject_id", "grades", ["subject_id"])
+    op.create_index("ix_students_semester", "students", ["semester"])
+    op.create_index("ix_subjects_semester", "subjects", ["semester"])
+
+def downgrade() -> None:
+    op.drop_index("ix_subjects_semester", table_name="subjects")
+    op.drop_index("ix_students_semester", table_name="students")
+    op.drop_index("ix_grades_subject_id", table_name="grades")
+    op.drop_constraint("uq_grades_student_id_subject_id", "grades", type_="unique")
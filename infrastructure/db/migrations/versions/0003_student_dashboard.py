@@ -0,0 +1,61 @@
+"""students dashboard snapshot
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:00.000000
+
+Adds the precomputed table read by the students dashboard, one row per student,
+and fills it from the current students, grades and subjects. Averages are
+computed from the grades rather than copied from students.average.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SORTABLE_COLUMNS = ("name", "lastname", "email", "semester", "average", "status", "grades_count", "credits_attempted")
+
+def upgrade() -> None:
+    op.create_table(
+        "student_dashboard",
+        sa.Column(
+            "id",
+            sa.String(),
+            sa.ForeignKey("students.id", ondelete="CASCADE"),
+            primary_key=True
+        ),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("lastname", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("semester", sa.Integer(), nullable=False),
+        sa.Column("average", sa.Float(), nullable=False),
+        sa.Column("status", sa.Boolean(), nullable=False),
+        sa.Column("grades_count", sa.Integer(), nullable=False),
+        sa.Column("credits_attempted", sa.Integer(), nullable=False),
+    )
+
+    op.execute(
+        "INSERT INTO student_dashboard "
+        "(id, name, lastname, email, semester, average, status, grades_count, credits_attempted) "
+        "SELECT students.id, students.name, students.lastname, students.email, students.semester, "
+        "coalesce(avg(grades.value), 0.0), coalesce(bool_and(grades.value >= 70), false), count(grades.id), "
+        "coalesce(sum(subjects.credits), 0) "
+        "FROM students "
+        "LEFT OUTER JOIN grades ON grades.student_id = students.id "
+        "LEFT OUTER JOIN subjects ON subjects.id = grades.subject_id "
+        "GROUP BY students.id"
+    )
+
+    for column in SORTABLE_COLUMNS:
+        op.create_index(f"ix_student_dashboard_{column}_id", "student_dashboard", [column, "id"])
+
+def downgrade() -> None:
+    for column in SORTABLE_COLUMNS:
+        op.drop_index(f"ix_student_dashboard_{column}_id", table_name="student_dashboard")
+
+    op.drop_table("student_dashboard")
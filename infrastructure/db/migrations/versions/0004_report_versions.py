@@ -0,0 +1,38 @@
+"""report versions
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 14:00:00.000000
+
+Adds the version stamped on students and subjects whenever the reports built
+from them change, drawn from a sequence so a version is never reused.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("report_version_seq")))
+
+    for table in ("students", "subjects"):
+        op.add_column(
+            table,
+            sa.Column(
+                "version",
+                sa.BigInteger(),
+                nullable=False,
+                server_default=sa.text("nextval('report_version_seq')")
+            )
+        )
+
+def downgrade() -> None:
+    for table in ("subjects", "students"):
+        op.drop_column(table, "version")
+
+    op.execute(sa.schema.DropSequence(sa.Sequence("report_version_seq")))
@@ -0,0 +1,37 @@
+"""student id counters
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 16:00:00.000000
+
+Adds the counters student IDs are handed out from, one per year prefix, and
+starts each one after the highest ID already taken with that prefix.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table(
+        "student_id_counters",
+        sa.Column("prefix", sa.String(), primary_key=True),
+        sa.Column("last_value", sa.BigInteger(), nullable=False),
+    )
+
+    # IDs are the prefix, such as A25, followed by six digits
+    op.execute(
+        "INSERT INTO student_id_counters (prefix, last_value) "
+        "SELECT substr(id, 1, 3), max(substr(id, 4)::bigint) "
+        "FROM students "
+        "WHERE id ~ '^A[0-9]{8}$' "
+        "GROUP BY substr(id, 1, 3)"
+    )
+
+def downgrade() -> None:
+    op.drop_table("student_id_counters")
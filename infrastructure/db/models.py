@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import BigInteger, Boolean, Column, Integer, String, Float, ForeignKey, Index, Sequence, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -6,6 +6,10 @@ import uuid
 
 Base = declarative_base()
 
+# Stamps students and subjects with a new version whenever the reports built
+# from them change. Versions are never reused, so they make strong ETags.
+REPORT_VERSION_SEQUENCE = Sequence("report_version_seq", metadata=Base.metadata)
+
 class StudentModel(Base):
     __tablename__ = 'students'
 
@@ -13,8 +17,9 @@ class StudentModel(Base):
     name = Column(String, nullable=False)
     lastname = Column(String, nullable=False)
     email = Column(String, nullable=False)
-    semester = Column(Integer, nullable=False)
+    semester = Column(Integer, nullable=False, index=True)
     average = Column(Float, nullable=False, default=0.0)
+    version = Column(BigInteger, nullable=False, server_default=REPORT_VERSION_SEQUENCE.next_value())
 
 class SubjectModel(Base):
     __tablename__ = 'subjects'
@@ -23,15 +28,60 @@ class SubjectModel(Base):
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     credits = Column(Integer, nullable=False)
-    semester = Column(Integer, nullable=False)
+    semester = Column(Integer, nullable=False, index=True)
+    version = Column(BigInteger, nullable=False, server_default=REPORT_VERSION_SEQUENCE.next_value())
 
 class GradeModel(Base):
     __tablename__ = 'grades'
+    __table_args__ = (
+        # Also serves the lookups by student_id, so that column has no index of its own
+        UniqueConstraint("student_id", "subject_id", name="uq_grades_student_id_subject_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     student_id = Column(String, ForeignKey("students.id"), nullable=False)
-    subject_id = Column(String, ForeignKey("subjects.id"), nullable=False)
+    subject_id = Column(String, ForeignKey("subjects.id"), nullable=False, index=True)
     value = Column(Float, nullable=False)
 
     student = relationship("StudentModel", backref="grades")
-    subject = relationship("SubjectModel", backref="grades")
\ No newline at end of file
+    subject = relationship("SubjectModel", backref="grades")
+
+class StudentGradeStatsModel(Base):
+    __tablename__ = 'student_grade_stats'
+
+    student_id = Column(String, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    grades_sum = Column(Float, nullable=False, default=0.0)
+    grades_count = Column(Integer, nullable=False, default=0)
+
+
+class StudentDashboardModel(Base):
+    """
+    Snapshot of every student as shown by the students dashboard, refreshed in
+    the same transaction as the student, grade or subject credits change that
+    affects it. Every sortable column is indexed together with the id tiebreaker.
+    """
+    __tablename__ = 'student_dashboard'
+    __table_args__ = tuple(
+        Index(f"ix_student_dashboard_{column}_id", column, "id")
+        for column in ("name", "lastname", "email", "semester", "average", "status", "grades_count", "credits_attempted")
+    )
+
+    id = Column(String, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    name = Column(String, nullable=False)
+    lastname = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    semester = Column(Integer, nullable=False)
+    average = Column(Float, nullable=False)
+    status = Column(Boolean, nullable=False)
+    grades_count = Column(Integer, nullable=False)
+    credits_attempted = Column(Integer, nullable=False)
+
+class StudentIdCounterModel(Base):
+    """
+    Last number handed out for the student IDs of each year prefix, such as
+    "A25". Workers reserve blocks of numbers by moving it forward.
+    """
+    __tablename__ = 'student_id_counters'
+
+    prefix = Column(String, primary_key=True)
+    last_value = Column(BigInteger, nullable=False)
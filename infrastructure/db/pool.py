@@ -0,0 +1,92 @@
+import time
+
+from dataclasses import dataclass
+from threading import Lock
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+@dataclass
+class PoolStatistics:
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    average_wait_ms: float
+    max_wait_ms: float
+
+class CheckoutWaitRecorder:
+    """
+    Accumulates how long checkouts waited for a connection to be available.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool):
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+class TimedPoolMixin:
+    """
+    Times every checkout of a queue pool, including the time spent waiting
+    for a connection once the pool and its overflow are exhausted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_recorder = CheckoutWaitRecorder()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.wait_recorder.record(time.perf_counter() - started, timed_out)
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def get_pool_statistics(pool: TimedQueuePool | TimedAsyncAdaptedQueuePool) -> PoolStatistics:
+    """
+    Takes a snapshot of the connections and checkout wait times of a pool.
+
+    Args:
+        pool (TimedQueuePool | TimedAsyncAdaptedQueuePool): The pool of an engine.
+
+    Returns:
+        PoolStatistics: The current connection counts and the accumulated wait times.
+    """
+    recorder = pool.wait_recorder
+    average_wait = recorder.total_wait / recorder.checkouts if recorder.checkouts else 0.0
+
+    return PoolStatistics(
+        size=pool.size(),
+        max_overflow=pool._max_overflow,
+        checked_out=pool.checkedout(),
+        idle=pool.checkedin(),
+        # QueuePool counts the connections never opened as negative overflow
+        overflow=max(pool.overflow(), 0),
+        checkouts=recorder.checkouts,
+        checkout_timeouts=recorder.timeouts,
+        average_wait_ms=average_wait * 1000,
+        max_wait_ms=recorder.max_wait * 1000
+    )
@@ -0,0 +1,582 @@
+from sqlalchemy import Delete, Insert, Select, Update, delete, exists, false, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from infrastructure.db.models import StudentModel, SubjectModel, GradeModel, StudentGradeStatsModel, StudentDashboardModel, StudentIdCounterModel, REPORT_VERSION_SEQUENCE
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+
+PASSING_GRADE = 70
+
+def _in_ids(column, ids: Iterable[str] | Select):
+    """Filters column by a collection of IDs or by a query selecting them."""
+    return column.in_(ids if isinstance(ids, Select) else list(ids))
+
+def build_student_rows_query() -> Select:
+    """
+    Builds a column projection of the students. List reads use rows instead
+    of StudentModel instances, skipping the identity map and attribute
+    instrumentation that dominate the cost of large pages.
+
+    Returns:
+        Select: The statement returning id, name, lastname, email, semester and average.
+    """
+    return select(
+        StudentModel.id,
+        StudentModel.name,
+        StudentModel.lastname,
+        StudentModel.email,
+        StudentModel.semester,
+        StudentModel.average
+    )
+
+def build_subject_rows_query() -> Select:
+    """
+    Builds a column projection of the subjects for list reads.
+
+    Returns:
+        Select: The statement returning id, name, description, credits and semester.
+    """
+    return select(
+        SubjectModel.id,
+        SubjectModel.name,
+        SubjectModel.description,
+        SubjectModel.credits,
+        SubjectModel.semester
+    )
+
+def build_grade_rows_query() -> Select:
+    """
+    Builds a column projection of the grades for list reads.
+
+    Returns:
+        Select: The statement returning id, student_id, subject_id and value.
+    """
+    return select(
+        GradeModel.id,
+        GradeModel.student_id,
+        GradeModel.subject_id,
+        GradeModel.value
+    )
+
+def _locked_previous_row(id_column, entity_id, *columns):
+    """
+    Selects the current values of a row and locks it, as a subquery an UPDATE
+    of that same row can join to return the values it replaced. The lock makes
+    the subquery read the latest committed version, so concurrent updates
+    never see a stale value.
+    """
+    return (
+        select(id_column, *columns)
+        .where(id_column == entity_id)
+        .with_for_update()
+        .subquery("previous")
+    )
+
+def build_update_student_statement(student_id: str, values: Dict[str, Any]) -> Update:
+    """
+    Builds the statement that sets the given columns of a student and returns
+    the updated row, so the write needs no SELECT before or after it.
+
+    Args:
+        student_id (str): The student to update.
+        values (Dict[str, Any]): The new value of every column to change.
+
+    Returns:
+        Update: The statement returning the row as build_student_rows_query does,
+        or nothing when the student does not exist.
+    """
+    return (
+        update(StudentModel)
+        .where(StudentModel.id == student_id)
+        .values(values)
+        .returning(*build_student_rows_query().selected_columns)
+    )
+
+def build_update_subject_statement(subject_id: str, values: Dict[str, Any]) -> Update:
+    """
+    Builds the statement that sets the given columns of a subject and returns
+    the updated row along with the credits it had before.
+
+    Args:
+        subject_id (str): The subject to update.
+        values (Dict[str, Any]): The new value of every column to change.
+
+    Returns:
+        Update: The statement returning the row as build_subject_rows_query does
+        plus previous_credits, or nothing when the subject does not exist.
+    """
+    previous = _locked_previous_row(SubjectModel.id, subject_id, SubjectModel.credits)
+
+    return (
+        update(SubjectModel)
+        .where(SubjectModel.id == previous.c.id)
+        .values(values)
+        .returning(*build_subject_rows_query().selected_columns, previous.c.credits.label("previous_credits"))
+    )
+
+def build_update_grade_statement(grade_id: int, value: float) -> Update:
+    """
+    Builds the statement that sets the value of a grade and returns the updated
+    row along with the value it had before.
+
+    Args:
+        grade_id (int): The grade to update.
+        value (float): The new value.
+
+    Returns:
+        Update: The statement returning the row as build_grade_rows_query does
+        plus previous_value, or nothing when the grade does not exist.
+    """
+    previous = _locked_previous_row(GradeModel.id, grade_id, GradeModel.value)
+
+    return (
+        update(GradeModel)
+        .where(GradeModel.id == previous.c.id)
+        .values(value=value)
+        .returning(*build_grade_rows_query().selected_columns, previous.c.value.label("previous_value"))
+    )
+
+def build_exists_by_id_query(model: type, entity_id: Any) -> Select:
+    """
+    Builds the query telling whether a row exists, answered from the primary
+    key index without loading any of its columns.
+
+    Args:
+        model (type): The mapped model of the row.
+        entity_id (Any): The primary key of the row.
+
+    Returns:
+        Select: The statement returning a single boolean.
+    """
+    return select(exists().where(model.id == entity_id))
+
+def build_delete_student_statement(student_id: str) -> Delete:
+    return delete(StudentModel).where(StudentModel.id == student_id)
+
+def build_delete_subject_statement(subject_id: str) -> Delete:
+    return delete(SubjectModel).where(SubjectModel.id == subject_id)
+
+def build_delete_grade_statement(grade_id: int) -> Delete:
+    """
+    Builds the statement that deletes a grade and returns it, so the running
+    totals of its student can be adjusted without reading it first.
+
+    Args:
+        grade_id (int): The grade to delete.
+
+    Returns:
+        Delete: The statement returning the row as build_grade_rows_query does,
+        or nothing when the grade does not exist.
+    """
+    return (
+        delete(GradeModel)
+        .where(GradeModel.id == grade_id)
+        .returning(*build_grade_rows_query().selected_columns)
+    )
+
+def build_students_dashboard_query(
+    page_size: int,
+    page: int,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Select:
+    """
+    Builds the query for a page of the students dashboard, read from its
+    snapshot table so every sortable column is served by an index.
+
+    Args:
+        page_size (int): Number of students per page.
+        page (int): Page number, starting at 1.
+        sort_field (Optional[str]): Dashboard column to sort by.
+        sort_order (Optional[str]): "asc" or "desc".
+        cursor (Optional[str]): Keyset cursor of the page to fetch, replacing page.
+
+    Returns:
+        Select: The statement returning id, name, lastname, email, semester, average,
+        status, grades_count and credits_attempted.
+    """
+    return paginate(
+        select(StudentDashboardModel.__table__),
+        StudentDashboardModel,
+        ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS,
+        page_size=page_size,
+        page=page,
+        sort_field=sort_field,
+        sort_order=sort_order,
+        cursor=cursor
+    )
+
+def build_refresh_student_dashboard_statement(student_ids: Iterable[str] | Select | None = None) -> Insert:
+    """
+    Builds the statement that recomputes the dashboard snapshot of the given
+    students from their stored data, average and grades. A student without
+    grades is not regular.
+
+    Args:
+        student_ids (Iterable[str] | Select | None): The students to refresh, as IDs or as a
+            query selecting them. None refreshes every student.
+
+    Returns:
+        Insert: The statement creating or replacing the snapshot rows.
+    """
+    snapshots = (
+        select(
+            StudentModel.id,
+            StudentModel.name,
+            StudentModel.lastname,
+            StudentModel.email,
+            StudentModel.semester,
+            StudentModel.average,
+            func.coalesce(func.bool_and(GradeModel.value >= PASSING_GRADE), false()),
+            func.count(GradeModel.id),
+            func.coalesce(func.sum(SubjectModel.credits), 0)
+        )
+        .outerjoin(GradeModel, GradeModel.student_id == StudentModel.id)
+        .outerjoin(SubjectModel, SubjectModel.id == GradeModel.subject_id)
+        .group_by(StudentModel.id)
+    )
+
+    if student_ids is not None:
+        snapshots = snapshots.where(_in_ids(StudentModel.id, student_ids))
+
+    columns = ["id", "name", "lastname", "email", "semester", "average", "status", "grades_count", "credits_attempted"]
+    statement = insert(StudentDashboardModel).from_select(columns, snapshots)
+
+    return statement.on_conflict_do_update(
+        index_elements=[StudentDashboardModel.id],
+        set_={column: statement.excluded[column] for column in columns[1:]}
+    )
+
+def build_subject_student_ids_query(subject_id: str) -> Select:
+    """
+    Builds the query selecting the students graded in a subject.
+
+    Args:
+        subject_id (str): The subject.
+
+    Returns:
+        Select: The statement returning student_id.
+    """
+    return select(GradeModel.student_id).where(GradeModel.subject_id == subject_id)
+
+def build_student_subject_ids_query(student_id: str) -> Select:
+    """
+    Builds the query selecting the subjects a student is graded in.
+
+    Args:
+        student_id (str): The student.
+
+    Returns:
+        Select: The statement returning subject_id.
+    """
+    return select(GradeModel.subject_id).where(GradeModel.student_id == student_id)
+
+def build_bump_student_versions_statement(student_ids: Iterable[str] | Select | None = None) -> Update:
+    """
+    Builds the statement that stamps students with a new report version.
+
+    Args:
+        student_ids (Iterable[str] | Select | None): The students to stamp, as IDs or as a
+            query selecting them. None stamps every student.
+
+    Returns:
+        Update: The statement.
+    """
+    statement = update(StudentModel).values(version=REPORT_VERSION_SEQUENCE.next_value())
+
+    if student_ids is not None:
+        statement = statement.where(_in_ids(StudentModel.id, student_ids))
+
+    return statement
+
+def build_bump_subject_versions_statement(subject_ids: Iterable[str] | Select) -> Update:
+    """
+    Builds the statement that stamps subjects with a new report version.
+
+    Args:
+        subject_ids (Iterable[str] | Select): The subjects to stamp, as IDs or as a query selecting them.
+
+    Returns:
+        Update: The statement.
+    """
+    return (
+        update(SubjectModel)
+        .where(_in_ids(SubjectModel.id, subject_ids))
+        .values(version=REPORT_VERSION_SEQUENCE.next_value())
+    )
+
+def build_student_grades_to_show_query(student_id: str) -> Select:
+    """
+    Builds the query for the grades of a student with the subject name.
+
+    Only the displayed columns are projected and the subject is joined in the
+    same statement, so no ORM object or lazy load is involved.
+
+    Args:
+        student_id (str): The student whose grades are requested.
+
+    Returns:
+        Select: The statement returning id, subject and value.
+    """
+    return (
+        select(
+            GradeModel.id,
+            SubjectModel.name.label("subject"),
+            GradeModel.value
+        )
+        .join(SubjectModel, GradeModel.subject_id == SubjectModel.id)
+        .where(GradeModel.student_id == student_id)
+    )
+
+def build_subject_grades_to_show_query(subject_id: str) -> Select:
+    """
+    Builds the query for the grades of a subject with the student name.
+
+    Args:
+        subject_id (str): The subject whose grades are requested.
+
+    Returns:
+        Select: The statement returning id, student and value.
+    """
+    return (
+        select(
+            GradeModel.id,
+            StudentModel.name.label("student"),
+            GradeModel.value
+        )
+        .join(StudentModel, GradeModel.student_id == StudentModel.id)
+        .where(GradeModel.subject_id == subject_id)
+    )
+
+def build_subject_grade_statistics_query(subject_id: str) -> Select:
+    """
+    Builds the aggregate query for the grade statistics of a subject.
+
+    Args:
+        subject_id (str): The subject whose grades are aggregated.
+
+    Returns:
+        Select: The statement returning count, passed, average, minimum, maximum and standard_deviation.
+    """
+    return (
+        select(
+            func.count(GradeModel.id).label("count"),
+            func.count(GradeModel.id).filter(GradeModel.value >= PASSING_GRADE).label("passed"),
+            func.avg(GradeModel.value).label("average"),
+            func.min(GradeModel.value).label("minimum"),
+            func.max(GradeModel.value).label("maximum"),
+            func.stddev_pop(GradeModel.value).label("standard_deviation")
+        )
+        .where(GradeModel.subject_id == subject_id)
+    )
+
+def build_apply_grade_change_statement(student_id: str, value_delta: float, count_delta: int) -> Update:
+    """
+    Builds the statement that applies a grade mutation to the running sum and
+    count of a student.
+
+    Args:
+        student_id (str): The student whose grades changed.
+        value_delta (float): The amount to add to the sum of grades.
+        count_delta (int): The amount to add to the number of grades.
+
+    Returns:
+        Update: The statement returning the new grades_sum and grades_count, or no row
+        when the student has no running totals yet.
+    """
+    return (
+        update(StudentGradeStatsModel)
+        .where(StudentGradeStatsModel.student_id == student_id)
+        .values(
+            grades_sum=StudentGradeStatsModel.grades_sum + value_delta,
+            grades_count=StudentGradeStatsModel.grades_count + count_delta
+        )
+        .returning(StudentGradeStatsModel.grades_sum, StudentGradeStatsModel.grades_count)
+    )
+
+def build_initialize_grade_stats_statement(student_id: str, value_delta: float, count_delta: int) -> Insert:
+    """
+    Builds the statement that creates the running totals of a student from the
+    grades already stored, which must include the mutation being applied.
+
+    If another transaction created the totals in the meantime, the mutation is
+    applied on top of them instead.
+
+    Args:
+        student_id (str): The student whose grades changed.
+        value_delta (float): The amount to add to the sum of grades on conflict.
+        count_delta (int): The amount to add to the number of grades on conflict.
+
+    Returns:
+        Insert: The statement returning the new grades_sum and grades_count.
+    """
+    totals = (
+        select(
+            literal(student_id),
+            func.coalesce(func.sum(GradeModel.value), 0.0),
+            func.count(GradeModel.id)
+        )
+        .where(GradeModel.student_id == student_id)
+    )
+    statement = insert(StudentGradeStatsModel).from_select(
+        ["student_id", "grades_sum", "grades_count"],
+        totals
+    )
+
+    return statement.on_conflict_do_update(
+        index_elements=[StudentGradeStatsModel.student_id],
+        set_={
+            "grades_sum": StudentGradeStatsModel.grades_sum + value_delta,
+            "grades_count": StudentGradeStatsModel.grades_count + count_delta
+        }
+    ).returning(StudentGradeStatsModel.grades_sum, StudentGradeStatsModel.grades_count)
+
+def build_set_student_average_statement(student_id: str, average: float) -> Update:
+    """
+    Builds the statement that stores the average of a student.
+
+    Args:
+        student_id (str): The student to update.
+        average (float): The new average.
+
+    Returns:
+        Update: The statement.
+    """
+    return (
+        update(StudentModel)
+        .where(StudentModel.id == student_id)
+        .values(average=average)
+    )
+
+def _stored_average():
+    """Average of the student being updated, derived from its running totals."""
+    average = (
+        select(StudentGradeStatsModel.grades_sum / StudentGradeStatsModel.grades_count)
+        .where(StudentGradeStatsModel.student_id == StudentModel.id)
+        .where(StudentGradeStatsModel.grades_count > 0)
+        .correlate(StudentModel)
+        .scalar_subquery()
+    )
+    return func.coalesce(average, 0.0)
+
+def build_rebuild_grade_stats_statements() -> tuple[Delete, Insert, Update]:
+    """
+    Builds the statements that recompute every running total and average from
+    the grades table. They must run in this order in a single transaction.
+
+    Returns:
+        tuple[Delete, Insert, Update]: The statements clearing the totals, recomputing them
+        and storing every student average.
+    """
+    clear_totals = delete(StudentGradeStatsModel)
+
+    recompute_totals = insert(StudentGradeStatsModel).from_select(
+        ["student_id", "grades_sum", "grades_count"],
+        select(
+            GradeModel.student_id,
+            func.sum(GradeModel.value),
+            func.count(GradeModel.id)
+        )
+        .group_by(GradeModel.student_id)
+    )
+
+    store_averages = update(StudentModel).values(average=_stored_average())
+
+    return clear_totals, recompute_totals, store_averages
+
+def build_initialize_missing_grade_stats_statement(student_ids: Iterable[str]) -> Insert:
+    """
+    Builds the statement that creates, from the grades already stored, the
+    running totals of the given students that do not have them yet.
+
+    Args:
+        student_ids (Iterable[str]): The students whose grades changed.
+
+    Returns:
+        Insert: The statement returning the student_id of every initialized student.
+    """
+    missing_totals = (
+        select(
+            GradeModel.student_id,
+            func.sum(GradeModel.value),
+            func.count(GradeModel.id)
+        )
+        .where(GradeModel.student_id.in_(list(student_ids)))
+        .where(
+            ~select(StudentGradeStatsModel.student_id)
+            .where(StudentGradeStatsModel.student_id == GradeModel.student_id)
+            .exists()
+        )
+        .group_by(GradeModel.student_id)
+    )
+
+    return (
+        insert(StudentGradeStatsModel)
+        .from_select(["student_id", "grades_sum", "grades_count"], missing_totals)
+        .on_conflict_do_nothing(index_elements=[StudentGradeStatsModel.student_id])
+        .returning(StudentGradeStatsModel.student_id)
+    )
+
+def build_apply_grade_changes_statement(changes: Dict[str, Tuple[float, int]]) -> Insert:
+    """
+    Builds the statement that applies the grade mutations of several students
+    to their running totals in a single round trip.
+
+    Args:
+        changes (Dict[str, Tuple[float, int]]): The value and count deltas by student ID.
+
+    Returns:
+        Insert: The statement.
+    """
+    statement = insert(StudentGradeStatsModel).values([
+        {"student_id": student_id, "grades_sum": value_delta, "grades_count": count_delta}
+        for student_id, (value_delta, count_delta) in changes.items()
+    ])
+
+    return statement.on_conflict_do_update(
+        index_elements=[StudentGradeStatsModel.student_id],
+        set_={
+            "grades_sum": StudentGradeStatsModel.grades_sum + statement.excluded.grades_sum,
+            "grades_count": StudentGradeStatsModel.grades_count + statement.excluded.grades_count
+        }
+    )
+
+def build_store_student_averages_statement(student_ids: Iterable[str]) -> Update:
+    """
+    Builds the statement that stores the average of the given students from
+    their running totals.
+
+    Args:
+        student_ids (Iterable[str]): The students to update.
+
+    Returns:
+        Update: The statement.
+    """
+    return (
+        update(StudentModel)
+        .where(StudentModel.id.in_(list(student_ids)))
+        .values(average=_stored_average())
+    )
+
+def build_reserve_student_ids_statement(prefix: str, count: int) -> Insert:
+    """
+    Builds the statement that reserves the next count numbers of a student ID
+    prefix, starting the counter of a new prefix at zero. The counter row is
+    locked until the transaction ends, so concurrent reservations never overlap.
+
+    Args:
+        prefix (str): The year prefix of the IDs, such as "A25".
+        count (int): The amount of numbers to reserve.
+
+    Returns:
+        Insert: The statement returning the last number reserved.
+    """
+    statement = insert(StudentIdCounterModel).values(prefix=prefix, last_value=count)
+
+    return statement.on_conflict_do_update(
+        index_elements=[StudentIdCounterModel.prefix],
+        set_={"last_value": StudentIdCounterModel.last_value + count}
+    ).returning(StudentIdCounterModel.last_value)
@@ -0,0 +1,95 @@
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Statements are truncated in logs and errors, the parameters are never recorded
+MAX_STATEMENT_LENGTH = 500
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised when a block of code issues more statements than its budget allows"""
+
+    def __init__(self, stats: QueryStats, max_queries: int, label: str = "Block"):
+        self.stats = stats
+        self.max_queries = max_queries
+        super().__init__(
+            f"{label} issued {stats.count} queries, over its budget of {max_queries}. "
+            f"Slowest ({stats.slowest_time * 1000:.2f} ms): {stats.slowest_statement}"
+        )
+
+# Every task or thread started while serving a request inherits the same QueryStats
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """
+    Counts and times the statements executed inside the block, on any
+    instrumented engine, and yields the stats being collected.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+@contextmanager
+def query_budget(max_queries: int, label: str = "Block") -> Iterator[QueryStats]:
+    """
+    Like collect_query_stats, but raises QueryBudgetExceededError when the block
+    issues more than max_queries statements. Meant for tests and scripts that
+    call repositories or use cases directly.
+    """
+    with collect_query_stats() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        raise QueryBudgetExceededError(stats, max_queries, label)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_times"].pop()
+    stats = _current_stats.get()
+
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    start_times = exception_context.connection.info.get("query_start_times") if exception_context.connection else None
+    if start_times:
+        start_times.pop()
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Records every statement executed by engine into the stats of the current
+    request. Pass the sync_engine of an AsyncEngine to instrument it.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,23 @@
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from application.unit_of_work import UnitOfWork
+
+from infrastructure.db.database import get_db
+
+class UnitOfWorkImpl(UnitOfWork):
+    """Implementation of the UnitOfWork interface over the SQLAlchemy Session the repositories share."""
+
+    def __init__(self, db: Session):
+        super().__init__()
+        self.db = db
+
+    def _commit(self) -> None:
+        self.db.commit()
+
+    def rollback(self) -> None:
+        self.db.rollback()
+
+def get_unit_of_work(db: Session = Depends(get_db)) -> UnitOfWork:
+    # FastAPI resolves get_db once per request, so this wraps the same session the route builds its repositories on
+    return UnitOfWorkImpl(db)
@@ -11,4 +11,12 @@ openapi_tags = [
         "name": "Grades",
         "description": "Module for managing grades. Includes features for assigning, viewing, updating, and deleting student grades in different subjects.",
     },
+    {
+        "name": "Exports",
+        "description": "Streaming exports of the full grades, students, and subjects datasets as CSV or NDJSON.",
+    },
+    {
+        "name": "Monitoring",
+        "description": "Runtime statistics of the API process, such as the usage of the database connection pools and the hit ratio of the entity cache.",
+    },
 ]
\ No newline at end of file
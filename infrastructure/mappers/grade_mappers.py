@@ -1,6 +1,11 @@
-from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject
+import csv
+import io
 
-from infrastructure.schemas.grades_schema import CreateGradeDTO, UpdateGradeDTO
+from typing import List
+
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics
+
+from infrastructure.schemas.grades_schema import CreateGradeDTO, UpdateGradeDTO, BulkGradeRowDTO
 from infrastructure.db.models import GradeModel
 
 def map_create_grade_dto_to_entity(grade_dto: CreateGradeDTO) -> Grade:
@@ -65,34 +70,101 @@ def map_update_grade_dto_to_entity(grade_id: str, grade_dto: UpdateGradeDTO) ->
         value=grade_dto.value
     )
 
-def map_grade_model_to_grade_to_show_student_dto(grade_model: GradeModel) -> GradeToShowStudent:
+def map_grade_to_show_student_row_to_entity(grade_row) -> GradeToShowStudent:
     """
-    Maps a GradeModel to a GradeToShow entity.
+    Maps a projected grade row to a GradeToShowStudent entity.
     
     Args:
-        grade_model (GradeModel): The model to map.
+        grade_row: A row with the grade id, the subject name and the value.
         
     Returns:
-        GradeToShow: The mapped entity.
+        GradeToShowStudent: The mapped entity.
     """
     return GradeToShowStudent(
-        id=grade_model.id,
-        subject=grade_model.subject.name,
-        value=grade_model.value
+        id=grade_row.id,
+        subject=grade_row.subject,
+        value=grade_row.value
     )
 
-def map_grade_model_to_grade_to_show_subject_dto(grade_model: GradeModel) -> GradeToShowSubject:
+def map_grade_to_show_subject_row_to_entity(grade_row) -> GradeToShowSubject:
     """
-    Maps a GradeModel to a GradeToShow entity for subject display.
+    Maps a projected grade row to a GradeToShowSubject entity.
     
     Args:
-        grade_model (GradeModel): The model to map.
+        grade_row: A row with the grade id, the student name and the value.
         
     Returns:
-        GradeToShow: The mapped entity.
+        GradeToShowSubject: The mapped entity.
     """
     return GradeToShowSubject(
-        id=grade_model.id,
-        student=grade_model.student.name,
-        value=grade_model.value
-    )
\ No newline at end of file
+        id=grade_row.id,
+        student=grade_row.student,
+        value=grade_row.value
+    )
+
+def map_subject_grade_statistics_row_to_entity(statistics_row) -> SubjectGradeStatistics:
+    """
+    Maps an aggregate statistics row to a SubjectGradeStatistics entity.
+    
+    Args:
+        statistics_row: A row with count, passed, average, minimum, maximum and standard_deviation.
+        
+    Returns:
+        SubjectGradeStatistics: The mapped entity.
+    """
+    return SubjectGradeStatistics(
+        count=statistics_row.count,
+        average=statistics_row.average,
+        minimum=statistics_row.minimum,
+        maximum=statistics_row.maximum,
+        standard_deviation=statistics_row.standard_deviation,
+        pass_rate=statistics_row.passed / statistics_row.count
+    )
+
+def map_bulk_grade_rows_to_entities(grade_rows: List[BulkGradeRowDTO]) -> List[Grade]:
+    """
+    Maps the rows of a bulk grade import to Grade entities.
+    
+    Args:
+        grade_rows (List[BulkGradeRowDTO]): The rows to map.
+        
+    Returns:
+        List[Grade]: The mapped entities, in the same order.
+    """
+    return [
+        Grade(
+            id=None,
+            student_id=grade_row.student_id,
+            subject_id=grade_row.subject_id,
+            value=grade_row.value
+        )
+        for grade_row in grade_rows
+    ]
+
+def map_grades_csv_to_entities(content: str) -> List[Grade]:
+    """
+    Maps a CSV document with a student_id,subject_id,value header to Grade entities.
+    Values that are not numbers are mapped to None so they are reported per row.
+    
+    Args:
+        content (str): The CSV document.
+        
+    Returns:
+        List[Grade]: The mapped entities, in the same order as the data rows.
+    """
+    grades: List[Grade] = []
+
+    for csv_row in csv.DictReader(io.StringIO(content)):
+        try:
+            value = float(csv_row.get("value") or "")
+        except ValueError:
+            value = None
+
+        grades.append(Grade(
+            id=None,
+            student_id=(csv_row.get("student_id") or "").strip(),
+            subject_id=(csv_row.get("subject_id") or "").strip(),
+            value=value
+        ))
+
+    return grades
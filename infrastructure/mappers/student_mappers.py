@@ -1,6 +1,11 @@
-from domain.entities.student import Student
+import csv
+import io
 
-from infrastructure.schemas.student_schema import CreateStudentDTO, UpdateStudentDTO
+from typing import List
+
+from domain.entities.student import Student, StudentReportDashboard
+
+from infrastructure.schemas.student_schema import CreateStudentDTO, UpdateStudentDTO, BulkStudentRowDTO
 from infrastructure.db.models import StudentModel
 
 def map_create_student_dto_to_entity(student_dto: CreateStudentDTO) -> Student:
@@ -48,7 +53,8 @@ def map_student_model_to_entity(student_model: StudentModel) -> Student:
         name=student_model.name,
         lastname=student_model.lastname,
         email=student_model.email,
-        semester=student_model.semester
+        semester=student_model.semester,
+        average=student_model.average
     )
 
 def map_update_student_dto_to_entity(student_id: str, student_dto: UpdateStudentDTO) -> Student:
@@ -68,3 +74,75 @@ def map_update_student_dto_to_entity(student_id: str, student_dto: UpdateStudent
         email=student_dto.email,
         semester=student_dto.semester
     )
+
+def map_student_dashboard_row_to_entity(student_row) -> StudentReportDashboard:
+    """
+    Maps a dashboard query row to a StudentReportDashboard entity.
+
+    Args:
+        student_row: A row of the students dashboard snapshot.
+
+    Returns:
+        StudentReportDashboard: The mapped entity.
+    """
+    return StudentReportDashboard(
+        id=student_row.id,
+        name=student_row.name,
+        lastname=student_row.lastname,
+        email=student_row.email,
+        semester=student_row.semester,
+        average=student_row.average,
+        status=student_row.status,
+        grades_count=student_row.grades_count,
+        credits_attempted=student_row.credits_attempted
+    )
+
+def map_bulk_student_rows_to_entities(student_rows: List[BulkStudentRowDTO]) -> List[Student]:
+    """
+    Maps the rows of a bulk student enrollment to Student entities.
+
+    Args:
+        student_rows (List[BulkStudentRowDTO]): The rows to map.
+
+    Returns:
+        List[Student]: The mapped entities, in the same order.
+    """
+    return [
+        Student(
+            id=None,
+            name=student_row.name,
+            lastname=student_row.lastname,
+            email=student_row.email.strip() if student_row.email else student_row.email,
+            semester=student_row.semester
+        )
+        for student_row in student_rows
+    ]
+
+def map_students_csv_to_entities(content: str) -> List[Student]:
+    """
+    Maps a CSV document with a name,lastname,email,semester header to Student entities.
+    Semesters that are not whole numbers are mapped to None so they are reported per row.
+
+    Args:
+        content (str): The CSV document.
+
+    Returns:
+        List[Student]: The mapped entities, in the same order as the data rows.
+    """
+    students: List[Student] = []
+
+    for csv_row in csv.DictReader(io.StringIO(content)):
+        try:
+            semester = int(csv_row.get("semester") or "")
+        except ValueError:
+            semester = None
+
+        students.append(Student(
+            id=None,
+            name=(csv_row.get("name") or "").strip(),
+            lastname=(csv_row.get("lastname") or "").strip(),
+            email=(csv_row.get("email") or "").strip(),
+            semester=semester
+        ))
+
+    return students
@@ -0,0 +1,189 @@
+import os
+import zlib
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_CONTENT_TYPES = tuple(
+    content_type.strip()
+    for content_type in os.getenv(
+        "COMPRESSION_CONTENT_TYPES",
+        "application/json,application/x-ndjson,text/csv"
+    ).split(",")
+    if content_type.strip()
+)
+
+class Compressor(ABC):
+    """Incremental encoder for one response body"""
+    encoding: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses a chunk and flushes it, so streamed chunks reach the client right away"""
+        pass
+
+    @abstractmethod
+    def finish(self, data: bytes) -> bytes:
+        """Compresses the last chunk and closes the stream"""
+        pass
+
+class GzipCompressor(Compressor):
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(zlib.Z_FINISH)
+
+class BrotliCompressor(Compressor):
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.finish()
+
+def parse_accept_encoding(accept_encoding: str) -> dict:
+    """
+    Parses an Accept-Encoding header into the quality of every coding it lists.
+    """
+    qualities = {}
+
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.lower()] = quality
+
+    return qualities
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli, when the brotli package is installed, or
+    gzip, following the Accept-Encoding of the request.
+
+    Only responses whose content type is in the allowlist are compressed, and
+    complete bodies smaller than minimum_size are sent as they are. Streaming
+    responses are compressed chunk by chunk, flushing each one. Strong ETags of
+    compressed responses are sent as weak, since the bytes depend on the coding.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        level: int = COMPRESSION_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+        content_types: Iterable[str] = COMPRESSION_CONTENT_TYPES
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.brotli_quality = brotli_quality
+        self.content_types = tuple(content_types)
+
+    def select_compressor(self, accept_encoding: str) -> Optional[Compressor]:
+        qualities = parse_accept_encoding(accept_encoding)
+        wildcard = qualities.get("*", 0.0)
+
+        if brotli is not None and qualities.get("br", wildcard) > 0:
+            return BrotliCompressor(self.brotli_quality)
+        if qualities.get("gzip", wildcard) > 0:
+            return GzipCompressor(self.level)
+
+        return None
+
+    def is_compressible(self, headers: Headers) -> bool:
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types and "content-encoding" not in headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        compressor = self.select_compressor(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Optional[Message] = None
+        started = False
+        compressing = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, started, compressing
+
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk tells whether to compress
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if not started:
+                started = True
+                headers = MutableHeaders(raw=start_message["headers"])
+
+                if self.is_compressible(headers):
+                    headers.add_vary_header("Accept-Encoding")
+                    compressing = compressor is not None and (more_body or len(body) >= self.minimum_size)
+
+                if compressing:
+                    headers["Content-Encoding"] = compressor.encoding
+                    etag = headers.get("etag")
+                    if etag is not None and not etag.startswith("W/"):
+                        headers["ETag"] = f"W/{etag}"
+                    if more_body:
+                        body = compressor.compress(body)
+                        del headers["Content-Length"]
+                    else:
+                        body = compressor.finish(body)
+                        headers["Content-Length"] = str(len(body))
+
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                    return
+
+                await send(start_message)
+                await send(message)
+                return
+
+            if compressing:
+                body = compressor.compress(body) if more_body else compressor.finish(body)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,65 @@
+import time
+
+from fastapi import Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import Response
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.utils.metrics import RequestMetrics, request_metrics
+
+# Requests that matched no route share one label, so unknown paths cannot grow the series
+UNMATCHED_ROUTE = "unmatched"
+
+class MetricsMiddleware:
+    """
+    Records the latency, status code and route of every request, the requests
+    in progress, and the exceptions that escape the application.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        self.metrics.in_progress += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as e:
+            status_code = 500
+            self.metrics.record_exception(e)
+            raise
+        finally:
+            self.metrics.in_progress -= 1
+            route = scope.get("route")
+            self.metrics.observe_request(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                status_code,
+                time.perf_counter() - started
+            )
+
+async def counting_http_exception_handler(request: Request, exc: HTTPException) -> Response:
+    """
+    Counts the exception a router mapped to exc, such as a
+    ResourceNotFoundException behind a 404, then answers as FastAPI does.
+    """
+    if exc.__context__ is not None:
+        request_metrics.record_exception(exc.__context__)
+
+    return await http_exception_handler(request, exc)
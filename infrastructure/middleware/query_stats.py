@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+
+from typing import Dict, FrozenSet, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.db.query_stats import QueryBudgetExceededError, QueryStats, collect_query_stats
+from infrastructure.utils.query_budgets import QUERY_BUDGETS, UNBUDGETED_ROUTES
+
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "0")) or None
+# Meant for test and staging runs: reads over budget fail with a 500 instead of only being logged
+QUERY_BUDGET_ENFORCE = os.getenv("QUERY_BUDGET_ENFORCE", "false").lower() == "true"
+
+# Only these are failed when enforcing. A write over budget has already committed
+# by the time its response starts, so a 500 would make clients retry a stored change.
+ENFORCED_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+logger = logging.getLogger("sicei.db")
+
+def get_route_key(scope: Scope) -> Optional[str]:
+    """
+    Names the endpoint that served the request as "METHOD /path/{param}", or
+    None when no route matched.
+    """
+    route = scope.get("route")
+    if route is None:
+        return None
+
+    return f"{scope['method']} {route.path}"
+
+def build_server_timing(stats: QueryStats) -> str:
+    return (
+        f'db;dur={stats.total_time * 1000:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_time * 1000:.2f}"
+    )
+
+class QueryStatsMiddleware:
+    """
+    Counts and times the SQL statements issued while serving each request.
+
+    The figures collected until the response starts are sent in a Server-Timing
+    header, and the ones of the whole request, streamed bodies included, are
+    logged as a JSON line on the "sicei.db" logger. Requests over the query
+    budget of their endpoint are logged as warnings, and reads over budget fail
+    with a 500 when enforce is set.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budgets: Dict[str, int] = QUERY_BUDGETS,
+        default_budget: Optional[int] = QUERY_BUDGET_DEFAULT,
+        enforce: bool = QUERY_BUDGET_ENFORCE,
+        unbudgeted_routes: FrozenSet[str] = UNBUDGETED_ROUTES
+    ):
+        self.app = app
+        self.budgets = budgets
+        self.default_budget = default_budget
+        self.enforce = enforce
+        self.unbudgeted_routes = unbudgeted_routes
+
+    def get_budget(self, route_key: Optional[str]) -> Optional[int]:
+        if route_key is None or route_key in self.unbudgeted_routes:
+            return None
+
+        return self.budgets.get(route_key, self.default_budget)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        rejected = False
+
+        with collect_query_stats() as stats:
+            async def send_with_stats(message: Message) -> None:
+                nonlocal status_code, rejected
+
+                if rejected:
+                    return
+
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    budget = self.get_budget(get_route_key(scope))
+
+                    enforced = self.enforce and scope["method"] in ENFORCED_METHODS
+                    if enforced and budget is not None and stats.count > budget:
+                        rejected = True
+                        status_code = 500
+                        error = QueryBudgetExceededError(stats, budget, get_route_key(scope))
+                        body = json.dumps({"detail": str(error)}).encode()
+                        await send({
+                            "type": "http.response.start",
+                            "status": status_code,
+                            "headers": [
+                                (b"content-type", b"application/json"),
+                                (b"content-length", str(len(body)).encode()),
+                                (b"server-timing", build_server_timing(stats).encode())
+                            ]
+                        })
+                        await send({"type": "http.response.body", "body": body})
+                        return
+
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", build_server_timing(stats))
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self.log(scope, status_code, stats)
+
+    def log(self, scope: Scope, status_code: int, stats: QueryStats) -> None:
+        route_key = get_route_key(scope)
+        budget = self.get_budget(route_key)
+        over_budget = budget is not None and stats.count > budget
+
+        record = {
+            "event": "request_db_stats",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route_key,
+            "status": status_code,
+            "queries": stats.count,
+            "db_time_ms": round(stats.total_time * 1000, 3),
+            "slowest_query_ms": round(stats.slowest_time * 1000, 3),
+            "slowest_query": stats.slowest_statement,
+            "query_budget": budget,
+            "over_budget": over_budget,
+        }
+
+        logger.log(logging.WARNING if over_budget else logging.INFO, json.dumps(record))
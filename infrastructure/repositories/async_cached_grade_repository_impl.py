@@ -0,0 +1,113 @@
+from typing import List, Optional
+
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from infrastructure.cache.entity_cache import EntityCache, invalidate_entities, grade_cache, student_cache
+
+class AsyncCachedGradeRepositoryImpl(AsyncGradeRepository):
+    """
+    Read-through cache of the grades looked up by ID, wrapping another AsyncGradeRepository.
+    Grade writes also invalidate the cached student, whose average they change. See CachedGradeRepositoryImpl.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncGradeRepository,
+        cache: EntityCache = grade_cache,
+        student_cache: EntityCache = student_cache,
+        unit_of_work: Optional[AsyncUnitOfWork] = None
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.student_cache = student_cache
+        self.unit_of_work = unit_of_work
+
+    async def create(self, grade: Grade) -> Grade:
+        created_grade = await self.repository.create(grade)
+        invalidate_entities(self.student_cache, self.unit_of_work, grade.student_id)
+        return created_grade
+
+    async def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        result = await self.repository.create_many(grades)
+        invalidate_entities(self.student_cache, self.unit_of_work, *{grade.student_id for grade in grades})
+        return result
+
+    async def get_by_id(self, grade_id: int) -> Grade | None:
+        grade = self.cache.get(grade_id)
+
+        if grade is None:
+            grade = await self.repository.get_by_id(grade_id)
+            if grade is not None:
+                self.cache.set(grade_id, grade)
+
+        return grade
+
+    async def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        grades: List[Grade] = []
+        missing_ids: List[int] = []
+
+        for grade_id in dict.fromkeys(grade_ids):
+            grade = self.cache.get(grade_id)
+            if grade is None:
+                missing_ids.append(grade_id)
+            else:
+                grades.append(grade)
+
+        if missing_ids:
+            for grade in await self.repository.get_many(missing_ids):
+                self.cache.set(grade.id, grade)
+                grades.append(grade)
+
+        return grades
+
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Grade]:
+        return await self.repository.get_all(page_size, page, sort_field, sort_order, cursor)
+
+    async def update(self, grade: Grade) -> Grade | None:
+        updated_grade = await self.repository.update(grade)
+        invalidate_entities(self.cache, self.unit_of_work, grade.id)
+
+        if updated_grade is not None:
+            invalidate_entities(self.student_cache, self.unit_of_work, updated_grade.student_id)
+
+        return updated_grade
+
+    async def delete(self, grade_id: int) -> Grade | None:
+        deleted_grade = await self.repository.delete(grade_id)
+        invalidate_entities(self.cache, self.unit_of_work, grade_id)
+
+        if deleted_grade is not None:
+            invalidate_entities(self.student_cache, self.unit_of_work, deleted_grade.student_id)
+
+        return deleted_grade
+
+    async def exists(self, grade_id: int) -> bool:
+        return self.cache.contains(grade_id) or await self.repository.exists(grade_id)
+
+    async def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        return await self.repository.exists_for_student_and_subject(student_id, subject_id)
+
+    async def get_by_student_id(self, student_id: str) -> List[Grade] | None:
+        return await self.repository.get_by_student_id(student_id)
+
+    async def get_by_subject_id(self, subject_id: str) -> List[Grade] | None:
+        return await self.repository.get_by_subject_id(subject_id)
+
+    async def get_student_grades_to_show(self, student_id: str) -> List[GradeToShowStudent] | None:
+        return await self.repository.get_student_grades_to_show(student_id)
+
+    async def get_subject_grades_to_show(self, subject_id: str) -> List[GradeToShowSubject] | None:
+        return await self.repository.get_subject_grades_to_show(subject_id)
+
+    async def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        return await self.repository.get_subject_grade_statistics(subject_id)
@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+from domain.entities.student import Student, StudentReportDashboard
+from domain.repositories.async_student_repository import AsyncStudentRepository
+
+from application.async_unit_of_work import AsyncUnitOfWork
+
+from infrastructure.cache.entity_cache import EntityCache, invalidate_entities, student_cache
+
+class AsyncCachedStudentRepositoryImpl(AsyncStudentRepository):
+    """Read-through cache of the students looked up by ID, wrapping another AsyncStudentRepository. See CachedStudentRepositoryImpl."""
+
+    def __init__(
+        self,
+        repository: AsyncStudentRepository,
+        cache: EntityCache = student_cache,
+        unit_of_work: Optional[AsyncUnitOfWork] = None
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    async def create(self, student: Student) -> Student:
+        created_student = await self.repository.create(student)
+        invalidate_entities(self.cache, self.unit_of_work, created_student.id)
+        return created_student
+
+    async def create_many(self, students: List[Student]) -> None:
+        await self.repository.create_many(students)
+        invalidate_entities(self.cache, self.unit_of_work, *(student.id for student in students))
+
+    async def get_by_id(self, student_id: str) -> Student | None:
+        student = self.cache.get(student_id)
+
+        if student is None:
+            student = await self.repository.get_by_id(student_id)
+            if student is not None:
+                self.cache.set(student_id, student)
+
+        return student
+
+    async def get_many(self, student_ids: List[str]) -> List[Student]:
+        students: List[Student] = []
+        missing_ids: List[str] = []
+
+        for student_id in dict.fromkeys(student_ids):
+            student = self.cache.get(student_id)
+            if student is None:
+                missing_ids.append(student_id)
+            else:
+                students.append(student)
+
+        if missing_ids:
+            for student in await self.repository.get_many(missing_ids):
+                self.cache.set(student.id, student)
+                students.append(student)
+
+        return students
+
+    async def get_by_semester(self, students_semester: int) -> List[Student]:
+        return await self.repository.get_by_semester(students_semester)
+
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Student]:
+        return await self.repository.get_all(page_size, page, sort_field, sort_order, cursor)
+
+    async def update(self, student: Student) -> Student:
+        updated_student = await self.repository.update(student)
+        invalidate_entities(self.cache, self.unit_of_work, student.id)
+        return updated_student
+
+    async def delete(self, student_id: str) -> bool:
+        deleted = await self.repository.delete(student_id)
+        invalidate_entities(self.cache, self.unit_of_work, student_id)
+        return deleted
+
+    async def exists(self, student_id: str) -> bool:
+        # A miss asks the repository with an EXISTS query instead of loading the whole row
+        return self.cache.contains(student_id) or await self.repository.exists(student_id)
+
+    async def get_average_by_student_id(self, student_id: str) -> float:
+        return await self.repository.get_average_by_student_id(student_id)
+
+    async def get_all_for_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        return await self.repository.get_all_for_dashboard(page_size, page, sort_field, sort_order, cursor)
@@ -0,0 +1,248 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult, GradeRowError
+from domain.repositories.async_grade_repository import AsyncGradeRepository
+
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.repositories.async_student_average_repository_impl import AsyncStudentAverageRepositoryImpl
+from infrastructure.repositories.async_student_dashboard_repository_impl import AsyncStudentDashboardRepositoryImpl
+from infrastructure.repositories.async_report_version_repository_impl import AsyncReportVersionRepositoryImpl
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import (
+    build_delete_grade_statement,
+    build_exists_by_id_query,
+    build_grade_rows_query,
+    build_student_grades_to_show_query,
+    build_subject_grades_to_show_query,
+    build_subject_grade_statistics_query,
+    build_update_grade_statement
+)
+from infrastructure.utils.constants import BULK_INSERT_BATCH_SIZE
+from infrastructure.utils.sort_fields import ALLOWED_GRADES_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+from infrastructure.mappers.grade_mappers import map_grade_entity_to_model, map_grade_model_to_entity, map_grade_to_show_student_row_to_entity, map_grade_to_show_subject_row_to_entity, map_subject_grade_statistics_row_to_entity
+
+class AsyncGradeRepositoryImpl(AsyncGradeRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.student_average_repository = AsyncStudentAverageRepositoryImpl(db)
+        self.student_dashboard_repository = AsyncStudentDashboardRepositoryImpl(db)
+        self.report_version_repository = AsyncReportVersionRepositoryImpl(db)
+
+    async def create(self, grade: Grade) -> Grade:
+        grade_model = map_grade_entity_to_model(grade)
+        self.db.add(grade_model)
+        await self.student_average_repository.apply_grade_change(
+            grade_model.student_id,
+            value_delta=grade_model.value,
+            count_delta=1
+        )
+        await self.student_dashboard_repository.refresh_students([grade_model.student_id])
+        await self.report_version_repository.bump_grade_changes([grade_model.student_id], [grade_model.subject_id])
+        forget_existence(self.db.info, GradeModel, [grade_model.id])
+
+        return Grade(
+            id=grade_model.id,
+            student_id=grade_model.student_id,
+            subject_id=grade_model.subject_id,
+            value=grade_model.value
+        )
+
+    async def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        student_ids = {grade.student_id for grade in grades}
+        subject_ids = {grade.subject_id for grade in grades}
+
+        existing_student_ids = set((await self.db.scalars(
+            select(StudentModel.id).where(StudentModel.id.in_(student_ids))
+        )).all())
+        existing_subject_ids = set((await self.db.scalars(
+            select(SubjectModel.id).where(SubjectModel.id.in_(subject_ids))
+        )).all())
+        graded_pairs = set((await self.db.execute(
+            select(GradeModel.student_id, GradeModel.subject_id).where(GradeModel.student_id.in_(student_ids))
+        )).tuples().all())
+
+        errors: List[GradeRowError] = []
+        grade_rows: List[dict] = []
+        changes: Dict[str, Tuple[float, int]] = {}
+
+        for row, grade in enumerate(grades, start=1):
+            if grade.student_id not in existing_student_ids:
+                errors.append(GradeRowError(row=row, message=f"Student with ID {grade.student_id} not found."))
+                continue
+            if grade.subject_id not in existing_subject_ids:
+                errors.append(GradeRowError(row=row, message=f"Course with ID {grade.subject_id} not found."))
+                continue
+            if (grade.student_id, grade.subject_id) in graded_pairs:
+                errors.append(GradeRowError(
+                    row=row,
+                    message=f"Student with ID {grade.student_id} already has a grade for course with ID {grade.subject_id}."
+                ))
+                continue
+
+            graded_pairs.add((grade.student_id, grade.subject_id))
+
+            grade_rows.append({
+                "student_id": grade.student_id,
+                "subject_id": grade.subject_id,
+                "value": grade.value
+            })
+            value_sum, count = changes.get(grade.student_id, (0.0, 0))
+            changes[grade.student_id] = (value_sum + grade.value, count + 1)
+
+        for start in range(0, len(grade_rows), BULK_INSERT_BATCH_SIZE):
+            await self.db.execute(insert(GradeModel), grade_rows[start:start + BULK_INSERT_BATCH_SIZE])
+
+        await self.student_average_repository.apply_grade_changes(changes)
+        await self.student_dashboard_repository.refresh_students(changes.keys())
+        await self.report_version_repository.bump_grade_changes(
+            changes.keys(),
+            {grade_row["subject_id"] for grade_row in grade_rows}
+        )
+
+        return GradeBulkResult(created=len(grade_rows), errors=errors)
+
+    async def get_by_id(self, grade_id: int) -> Grade | None:
+        grade_model = await self.db.get(GradeModel, grade_id)
+
+        if not grade_model:
+            return None
+
+        return map_grade_model_to_entity(grade_model)
+
+    async def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        result = await self.db.execute(
+            build_grade_rows_query().where(GradeModel.id.in_(set(grade_ids)))
+        )
+
+        return [map_grade_model_to_entity(grade_row) for grade_row in result.all()]
+
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Grade]:
+        query = paginate(
+            build_grade_rows_query(),
+            GradeModel,
+            ALLOWED_GRADES_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        result = await self.db.execute(query)
+
+        return [map_grade_model_to_entity(grade_row) for grade_row in result.all()]
+
+    async def update(self, grade: Grade) -> Grade | None:
+        if grade.value is None:
+            grade_row = (await self.db.execute(build_grade_rows_query().where(GradeModel.id == grade.id))).first()
+            return map_grade_model_to_entity(grade_row) if grade_row else None
+
+        grade_row = (await self.db.execute(build_update_grade_statement(grade.id, grade.value))).first()
+
+        if not grade_row:
+            return None
+
+        if grade_row.value != grade_row.previous_value:
+            await self.student_average_repository.apply_grade_change(
+                grade_row.student_id,
+                value_delta=grade_row.value - grade_row.previous_value,
+                count_delta=0
+            )
+            await self.student_dashboard_repository.refresh_students([grade_row.student_id])
+            await self.report_version_repository.bump_grade_changes([grade_row.student_id], [grade_row.subject_id])
+
+        return map_grade_model_to_entity(grade_row)
+
+    async def delete(self, grade_id: int) -> Grade | None:
+        grade_row = (await self.db.execute(build_delete_grade_statement(grade_id))).first()
+
+        if not grade_row:
+            return None
+
+        await self.student_average_repository.apply_grade_change(
+            grade_row.student_id,
+            value_delta=-grade_row.value,
+            count_delta=-1
+        )
+        await self.student_dashboard_repository.refresh_students([grade_row.student_id])
+        await self.report_version_repository.bump_grade_changes([grade_row.student_id], [grade_row.subject_id])
+        forget_existence(self.db.info, GradeModel, [grade_id])
+
+        return map_grade_model_to_entity(grade_row)
+
+    async def exists(self, grade_id: int) -> bool:
+        found = get_memoized_existence(self.db.info, GradeModel, grade_id)
+
+        if found is None:
+            found = await self.db.scalar(build_exists_by_id_query(GradeModel, grade_id))
+            memoize_existence(self.db.info, GradeModel, [grade_id], found)
+
+        return found
+
+    async def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        grade_id = await self.db.scalar(
+            select(GradeModel.id).where(
+                GradeModel.student_id == student_id,
+                GradeModel.subject_id == subject_id
+            )
+        )
+        return grade_id is not None
+
+    async def get_by_student_id(self, student_id: str) -> List[Grade] | None:
+        result = await self.db.execute(
+            build_grade_rows_query().where(GradeModel.student_id == student_id)
+        )
+        grade_rows = result.all()
+
+        if not grade_rows:
+            return None
+
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
+
+    async def get_by_subject_id(self, subject_id: str) -> List[Grade] | None:
+        result = await self.db.execute(
+            build_grade_rows_query().where(GradeModel.subject_id == subject_id)
+        )
+        grade_rows = result.all()
+
+        if not grade_rows:
+            return None
+
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
+
+    async def get_student_grades_to_show(self, student_id: str) -> List[GradeToShowStudent] | None:
+        result = await self.db.execute(build_student_grades_to_show_query(student_id))
+        grade_rows = result.all()
+
+        if not grade_rows:
+            return None
+
+        return [map_grade_to_show_student_row_to_entity(grade_row) for grade_row in grade_rows]
+
+    async def get_subject_grades_to_show(self, subject_id: str) -> List[GradeToShowSubject] | None:
+        result = await self.db.execute(build_subject_grades_to_show_query(subject_id))
+        grade_rows = result.all()
+
+        if not grade_rows:
+            return None
+
+        return [map_grade_to_show_subject_row_to_entity(grade_row) for grade_row in grade_rows]
+
+    async def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        result = await self.db.execute(build_subject_grade_statistics_query(subject_id))
+        statistics_row = result.one()
+
+        if not statistics_row.count:
+            return None
+
+        return map_subject_grade_statistics_row_to_entity(statistics_row)
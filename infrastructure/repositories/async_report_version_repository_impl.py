@@ -0,0 +1,50 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from typing import Iterable
+
+from domain.repositories.async_report_version_repository import AsyncReportVersionRepository
+
+from infrastructure.db.models import StudentModel, SubjectModel
+from infrastructure.db.queries import (
+    build_bump_student_versions_statement,
+    build_bump_subject_versions_statement,
+    build_student_subject_ids_query,
+    build_subject_student_ids_query
+)
+
+class AsyncReportVersionRepositoryImpl(AsyncReportVersionRepository):
+    """
+    Stamps students and subjects with the version of their reports using SQLAlchemy's AsyncSession.
+
+    The bump methods do not commit, so they join the transaction of the change
+    that triggered them.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_student_version(self, student_id: str) -> int | None:
+        return await self.db.scalar(select(StudentModel.version).where(StudentModel.id == student_id))
+
+    async def get_subject_version(self, subject_id: str) -> int | None:
+        return await self.db.scalar(select(SubjectModel.version).where(SubjectModel.id == subject_id))
+
+    async def bump_grade_changes(self, student_ids: Iterable[str], subject_ids: Iterable[str]) -> None:
+        student_ids, subject_ids = sorted(set(student_ids)), sorted(set(subject_ids))
+
+        if student_ids:
+            await self.db.execute(build_bump_student_versions_statement(student_ids))
+        if subject_ids:
+            await self.db.execute(build_bump_subject_versions_statement(subject_ids))
+
+    async def bump_student(self, student_id: str) -> None:
+        await self.db.execute(build_bump_student_versions_statement([student_id]))
+        await self.db.execute(build_bump_subject_versions_statement(build_student_subject_ids_query(student_id)))
+
+    async def bump_subject(self, subject_id: str) -> None:
+        await self.db.execute(build_bump_student_versions_statement(build_subject_student_ids_query(subject_id)))
+        await self.db.execute(build_bump_subject_versions_statement([subject_id]))
+
+    async def bump_all_students(self) -> None:
+        await self.db.execute(build_bump_student_versions_statement())
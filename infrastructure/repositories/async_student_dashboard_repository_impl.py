@@ -0,0 +1,36 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from typing import Iterable
+
+from domain.repositories.async_student_dashboard_repository import AsyncStudentDashboardRepository
+
+from infrastructure.db.queries import build_refresh_student_dashboard_statement, build_subject_student_ids_query
+
+class AsyncStudentDashboardRepositoryImpl(AsyncStudentDashboardRepository):
+    """
+    Keeps the students dashboard snapshot table in sync using SQLAlchemy's AsyncSession.
+
+    The refresh methods do not commit, so they join the transaction of the
+    change that triggered them, and must run after it is applied.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def refresh_students(self, student_ids: Iterable[str]) -> None:
+        student_ids = list(student_ids)
+
+        if not student_ids:
+            return
+
+        await self.db.flush()
+        await self.db.execute(build_refresh_student_dashboard_statement(student_ids))
+
+    async def refresh_subject_students(self, subject_id: str) -> None:
+        await self.db.flush()
+        await self.db.execute(build_refresh_student_dashboard_statement(build_subject_student_ids_query(subject_id)))
+
+    async def rebuild(self) -> int:
+        result = await self.db.execute(build_refresh_student_dashboard_statement())
+
+        return result.rowcount
@@ -0,0 +1,50 @@
+import asyncio
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domain.repositories.async_student_id_repository import AsyncStudentIdRepository
+
+from infrastructure.db.async_database import async_engine
+from infrastructure.db.queries import build_reserve_student_ids_statement
+from infrastructure.repositories.student_id_repository_impl import STUDENT_ID_BLOCK_SIZE, format_student_ids, get_student_id_prefix
+
+class AsyncStudentIdRepositoryImpl(AsyncStudentIdRepository):
+    """
+    Hands out student IDs from blocks of numbers reserved on the
+    student_id_counters table using SQLAlchemy's AsyncEngine. See
+    StudentIdRepositoryImpl.
+    """
+
+    def __init__(self, engine: AsyncEngine, block_size: int = STUDENT_ID_BLOCK_SIZE):
+        self.engine = engine
+        self.block_size = block_size
+        # Next and last number of the block being handed out, by prefix
+        self.blocks: Dict[str, Tuple[int, int]] = {}
+        self._lock = asyncio.Lock()
+
+    async def next_ids(self, year: int, count: int = 1) -> List[str]:
+        prefix = get_student_id_prefix(year)
+        ids = []
+
+        async with self._lock:
+            while len(ids) < count:
+                next_number, last_number = self.blocks.get(prefix, (1, 0))
+
+                if next_number > last_number:
+                    size = max(self.block_size, count - len(ids))
+                    last_number = await self.reserve(prefix, size)
+                    next_number = last_number - size + 1
+
+                taken = min(count - len(ids), last_number - next_number + 1)
+                ids += format_student_ids(prefix, next_number, next_number + taken - 1)
+                self.blocks[prefix] = (next_number + taken, last_number)
+
+        return ids
+
+    async def reserve(self, prefix: str, size: int) -> int:
+        async with self.engine.begin() as connection:
+            return await connection.scalar(build_reserve_student_ids_statement(prefix, size))
+
+async_student_id_repository = AsyncStudentIdRepositoryImpl(async_engine)
@@ -0,0 +1,172 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from typing import List, Optional
+
+from domain.entities.student import Student, StudentReportDashboard
+from domain.repositories.async_student_repository import AsyncStudentRepository
+
+from infrastructure.db.models import StudentModel
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import (
+    build_delete_student_statement,
+    build_exists_by_id_query,
+    build_student_rows_query,
+    build_students_dashboard_query,
+    build_update_student_statement
+)
+from infrastructure.utils.constants import BULK_INSERT_BATCH_SIZE
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+from infrastructure.mappers.student_mappers import map_student_entity_to_model, map_student_model_to_entity, map_student_dashboard_row_to_entity
+from infrastructure.repositories.async_student_dashboard_repository_impl import AsyncStudentDashboardRepositoryImpl
+from infrastructure.repositories.async_report_version_repository_impl import AsyncReportVersionRepositoryImpl
+
+class AsyncStudentRepositoryImpl(AsyncStudentRepository):
+    """Implementation of the AsyncStudentRepository interface using SQLAlchemy's AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.student_dashboard_repository = AsyncStudentDashboardRepositoryImpl(db)
+        self.report_version_repository = AsyncReportVersionRepositoryImpl(db)
+
+    async def create(self, student: Student) -> Student:
+        student_model = map_student_entity_to_model(student)
+        self.db.add(student_model)
+        await self.student_dashboard_repository.refresh_students([student_model.id])
+        forget_existence(self.db.info, StudentModel, [student_model.id])
+
+        return Student(
+            id=student_model.id,
+            name=student_model.name,
+            lastname=student_model.lastname,
+            email=student_model.email,
+            semester=student_model.semester
+        )
+
+    async def create_many(self, students: List[Student]) -> None:
+        student_rows = [
+            {
+                "id": student.id,
+                "name": student.name,
+                "lastname": student.lastname,
+                "email": student.email,
+                "semester": student.semester,
+                "average": 0.0
+            }
+            for student in students
+        ]
+
+        for start in range(0, len(student_rows), BULK_INSERT_BATCH_SIZE):
+            await self.db.execute(insert(StudentModel), student_rows[start:start + BULK_INSERT_BATCH_SIZE])
+
+        await self.student_dashboard_repository.refresh_students([student.id for student in students])
+        forget_existence(self.db.info, StudentModel, [student.id for student in students])
+
+    async def get_by_id(self, student_id: str) -> Student | None:
+        student_model = await self.db.get(StudentModel, student_id)
+
+        if not student_model:
+            return None
+
+        return map_student_model_to_entity(student_model)
+
+    async def get_many(self, student_ids: List[str]) -> List[Student]:
+        result = await self.db.execute(
+            build_student_rows_query().where(StudentModel.id.in_(set(student_ids)))
+        )
+
+        return [map_student_model_to_entity(student_row) for student_row in result.all()]
+
+    async def get_by_semester(self, students_semester: int) -> List[Student]:
+        result = await self.db.execute(
+            build_student_rows_query().where(StudentModel.semester == students_semester)
+        )
+        return [map_student_model_to_entity(student_row) for student_row in result.all()]
+
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Student]:
+        query = paginate(
+            build_student_rows_query(),
+            StudentModel,
+            ALLOWED_STUDENT_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        result = await self.db.execute(query)
+
+        return [map_student_model_to_entity(student_row) for student_row in result.all()]
+
+    async def update(self, student: Student) -> Student | None:
+        values = {
+            column: value
+            for column, value in (
+                ("name", student.name),
+                ("lastname", student.lastname),
+                ("email", student.email),
+                ("semester", student.semester)
+            )
+            if value is not None
+        }
+
+        if values:
+            student_row = (await self.db.execute(build_update_student_statement(student.id, values))).first()
+        else:
+            student_row = (await self.db.execute(build_student_rows_query().where(StudentModel.id == student.id))).first()
+
+        if not student_row:
+            return None
+
+        await self.student_dashboard_repository.refresh_students([student_row.id])
+        await self.report_version_repository.bump_student(student_row.id)
+
+        return map_student_model_to_entity(student_row)
+
+    async def delete(self, student_id: str) -> bool:
+        result = await self.db.execute(build_delete_student_statement(student_id))
+        forget_existence(self.db.info, StudentModel, [student_id])
+
+        return result.rowcount > 0
+
+    async def exists(self, student_id: str) -> bool:
+        found = get_memoized_existence(self.db.info, StudentModel, student_id)
+
+        if found is None:
+            found = await self.db.scalar(build_exists_by_id_query(StudentModel, student_id))
+            memoize_existence(self.db.info, StudentModel, [student_id], found)
+
+        return found
+
+    async def get_average_by_student_id(self, student_id: str) -> float | None:
+        """To get the average grade of a student by their ID. Implementation"""
+        return await self.db.scalar(
+            select(StudentModel.average).where(StudentModel.id == student_id)
+        )
+
+    async def get_all_for_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        query = build_students_dashboard_query(
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        result = await self.db.execute(query)
+
+        return [map_student_dashboard_row_to_entity(student_row) for student_row in result.all()]
@@ -0,0 +1,122 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from typing import List, Optional
+
+from domain.entities.subject import Subject
+from domain.repositories.async_subject_repository import AsyncSubjectRepository
+
+from infrastructure.db.models import SubjectModel
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import build_delete_subject_statement, build_exists_by_id_query, build_subject_rows_query, build_update_subject_statement
+from infrastructure.utils.sort_fields import ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+from infrastructure.mappers.subject_mappers import map_subject_entity_to_model, map_subject_model_to_entity
+from infrastructure.repositories.async_student_dashboard_repository_impl import AsyncStudentDashboardRepositoryImpl
+from infrastructure.repositories.async_report_version_repository_impl import AsyncReportVersionRepositoryImpl
+
+class AsyncSubjectRepositoryImpl(AsyncSubjectRepository):
+    """Implementation of the AsyncSubjectRepository interface using SQLAlchemy's AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.student_dashboard_repository = AsyncStudentDashboardRepositoryImpl(db)
+        self.report_version_repository = AsyncReportVersionRepositoryImpl(db)
+
+    async def create(self, subject: Subject) -> Subject:
+        subject_model = map_subject_entity_to_model(subject)
+        self.db.add(subject_model)
+        await self.db.flush()
+        forget_existence(self.db.info, SubjectModel, [subject_model.id])
+
+        return Subject(
+            id=subject_model.id,
+            name=subject_model.name,
+            description=subject_model.description,
+            credits=subject_model.credits,
+            semester=subject_model.semester
+        )
+
+    async def get_by_id(self, subject_id: str) -> Subject | None:
+        subject_model = await self.db.get(SubjectModel, subject_id)
+
+        if not subject_model:
+            return None
+
+        return map_subject_model_to_entity(subject_model)
+
+    async def get_many(self, subject_ids: List[str]) -> List[Subject]:
+        result = await self.db.execute(
+            build_subject_rows_query().where(SubjectModel.id.in_(set(subject_ids)))
+        )
+
+        return [map_subject_model_to_entity(subject_row) for subject_row in result.all()]
+
+    async def get_by_semester(self, subjects_semester: int) -> List[Subject]:
+        result = await self.db.execute(
+            build_subject_rows_query().where(SubjectModel.semester == subjects_semester)
+        )
+        return [map_subject_model_to_entity(subject_row) for subject_row in result.all()]
+
+    async def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Subject]:
+        query = paginate(
+            build_subject_rows_query(),
+            SubjectModel,
+            ALLOWED_SUBJECT_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        result = await self.db.execute(query)
+
+        return [map_subject_model_to_entity(subject_row) for subject_row in result.all()]
+
+    async def update(self, subject: Subject) -> Subject | None:
+        values = {
+            column: value
+            for column, value in (
+                ("name", subject.name),
+                ("description", subject.description),
+                ("credits", subject.credits),
+                ("semester", subject.semester)
+            )
+            if value is not None
+        }
+
+        if values:
+            subject_row = (await self.db.execute(build_update_subject_statement(subject.id, values))).first()
+        else:
+            subject_row = (await self.db.execute(build_subject_rows_query().where(SubjectModel.id == subject.id))).first()
+
+        if not subject_row:
+            return None
+
+        if values and subject_row.credits != subject_row.previous_credits:
+            await self.student_dashboard_repository.refresh_subject_students(subject_row.id)
+
+        await self.report_version_repository.bump_subject(subject_row.id)
+
+        return map_subject_model_to_entity(subject_row)
+
+    async def delete(self, subject_id: str) -> bool:
+        result = await self.db.execute(build_delete_subject_statement(subject_id))
+        forget_existence(self.db.info, SubjectModel, [subject_id])
+
+        return result.rowcount > 0
+
+    async def exists(self, subject_id: str) -> bool:
+        found = get_memoized_existence(self.db.info, SubjectModel, subject_id)
+
+        if found is None:
+            found = await self.db.scalar(build_exists_by_id_query(SubjectModel, subject_id))
+            memoize_existence(self.db.info, SubjectModel, [subject_id], found)
+
+        return found
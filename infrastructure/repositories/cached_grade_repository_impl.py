@@ -0,0 +1,116 @@
+from typing import Iterator, List, Optional
+
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult
+from domain.repositories.grade_repository import GradeRepository
+
+from application.unit_of_work import UnitOfWork
+
+from infrastructure.cache.entity_cache import EntityCache, invalidate_entities, grade_cache, student_cache
+
+class CachedGradeRepositoryImpl(GradeRepository):
+    """
+    Read-through cache of the grades looked up by ID, wrapping another GradeRepository.
+    Grade writes also invalidate the cached student, whose average they change.
+    """
+
+    def __init__(
+        self,
+        repository: GradeRepository,
+        cache: EntityCache = grade_cache,
+        student_cache: EntityCache = student_cache,
+        unit_of_work: Optional[UnitOfWork] = None
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.student_cache = student_cache
+        self.unit_of_work = unit_of_work
+
+    def create(self, grade: Grade) -> Grade:
+        created_grade = self.repository.create(grade)
+        invalidate_entities(self.student_cache, self.unit_of_work, grade.student_id)
+        return created_grade
+
+    def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        result = self.repository.create_many(grades)
+        invalidate_entities(self.student_cache, self.unit_of_work, *{grade.student_id for grade in grades})
+        return result
+
+    def get_by_id(self, grade_id: int) -> Grade | None:
+        grade = self.cache.get(grade_id)
+
+        if grade is None:
+            grade = self.repository.get_by_id(grade_id)
+            if grade is not None:
+                self.cache.set(grade_id, grade)
+
+        return grade
+
+    def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        grades: List[Grade] = []
+        missing_ids: List[int] = []
+
+        for grade_id in dict.fromkeys(grade_ids):
+            grade = self.cache.get(grade_id)
+            if grade is None:
+                missing_ids.append(grade_id)
+            else:
+                grades.append(grade)
+
+        if missing_ids:
+            for grade in self.repository.get_many(missing_ids):
+                self.cache.set(grade.id, grade)
+                grades.append(grade)
+
+        return grades
+
+    def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Grade]:
+        return self.repository.get_all(page_size, page, sort_field, sort_order, cursor)
+
+    def update(self, grade: Grade) -> Grade | None:
+        updated_grade = self.repository.update(grade)
+        invalidate_entities(self.cache, self.unit_of_work, grade.id)
+
+        if updated_grade is not None:
+            invalidate_entities(self.student_cache, self.unit_of_work, updated_grade.student_id)
+
+        return updated_grade
+
+    def delete(self, grade_id: int) -> Grade | None:
+        deleted_grade = self.repository.delete(grade_id)
+        invalidate_entities(self.cache, self.unit_of_work, grade_id)
+
+        if deleted_grade is not None:
+            invalidate_entities(self.student_cache, self.unit_of_work, deleted_grade.student_id)
+
+        return deleted_grade
+
+    def exists(self, grade_id: int) -> bool:
+        return self.cache.contains(grade_id) or self.repository.exists(grade_id)
+
+    def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        return self.repository.exists_for_student_and_subject(student_id, subject_id)
+
+    def get_by_student_id(self, student_id: str) -> List[Grade] | None:
+        return self.repository.get_by_student_id(student_id)
+
+    def get_by_subject_id(self, subject_id: str) -> List[Grade] | None:
+        return self.repository.get_by_subject_id(subject_id)
+
+    def get_student_grades_to_show(self, student_id: str) -> List[GradeToShowStudent] | None:
+        return self.repository.get_student_grades_to_show(student_id)
+
+    def get_subject_grades_to_show(self, subject_id: str) -> List[GradeToShowSubject] | None:
+        return self.repository.get_subject_grades_to_show(subject_id)
+
+    def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        return self.repository.get_subject_grade_statistics(subject_id)
+
+    def stream_all(self, batch_size: int) -> Iterator[Grade]:
+        return self.repository.stream_all(batch_size)
@@ -0,0 +1,83 @@
+from typing import Iterator, List, Optional
+
+from domain.entities.subject import Subject
+from domain.repositories.subject_repository import SubjectRepository
+
+from application.unit_of_work import UnitOfWork
+
+from infrastructure.cache.entity_cache import EntityCache, invalidate_entities, subject_cache
+
+class CachedSubjectRepositoryImpl(SubjectRepository):
+    """Read-through cache of the subjects looked up by ID, wrapping another SubjectRepository."""
+
+    def __init__(
+        self,
+        repository: SubjectRepository,
+        cache: EntityCache = subject_cache,
+        unit_of_work: Optional[UnitOfWork] = None
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    def create(self, subject: Subject) -> Subject:
+        created_subject = self.repository.create(subject)
+        invalidate_entities(self.cache, self.unit_of_work, created_subject.id)
+        return created_subject
+
+    def get_by_id(self, subject_id: str) -> Subject | None:
+        subject = self.cache.get(subject_id)
+
+        if subject is None:
+            subject = self.repository.get_by_id(subject_id)
+            if subject is not None:
+                self.cache.set(subject_id, subject)
+
+        return subject
+
+    def get_many(self, subject_ids: List[str]) -> List[Subject]:
+        subjects: List[Subject] = []
+        missing_ids: List[str] = []
+
+        for subject_id in dict.fromkeys(subject_ids):
+            subject = self.cache.get(subject_id)
+            if subject is None:
+                missing_ids.append(subject_id)
+            else:
+                subjects.append(subject)
+
+        if missing_ids:
+            for subject in self.repository.get_many(missing_ids):
+                self.cache.set(subject.id, subject)
+                subjects.append(subject)
+
+        return subjects
+
+    def get_by_semester(self, subjects_semester: int) -> List[Subject]:
+        return self.repository.get_by_semester(subjects_semester)
+
+    def get_all(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[Subject]:
+        return self.repository.get_all(page_size, page, sort_field, sort_order, cursor)
+
+    def update(self, subject: Subject) -> Subject:
+        updated_subject = self.repository.update(subject)
+        invalidate_entities(self.cache, self.unit_of_work, subject.id)
+        return updated_subject
+
+    def delete(self, subject_id: str) -> bool:
+        deleted = self.repository.delete(subject_id)
+        invalidate_entities(self.cache, self.unit_of_work, subject_id)
+        return deleted
+
+    def exists(self, subject_id: str) -> bool:
+        return self.cache.contains(subject_id) or self.repository.exists(subject_id)
+
+    def stream_all(self, batch_size: int) -> Iterator[Subject]:
+        return self.repository.stream_all(batch_size)
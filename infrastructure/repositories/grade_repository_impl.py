@@ -1,23 +1,48 @@
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject
+from domain.entities.grade import Grade, GradeToShowStudent, GradeToShowSubject, SubjectGradeStatistics, GradeBulkResult, GradeRowError
 from domain.repositories.grade_repository import GradeRepository
 
-from infrastructure.db.models import GradeModel
-from infrastructure.utils.sort_fields import ALLOWED_GRADES_SORT_FIELDS, ALLOWED_SORT_ORDERS
-from infrastructure.mappers.grade_mappers import map_grade_entity_to_model, map_grade_model_to_entity, map_grade_model_to_grade_to_show_student_dto, map_grade_model_to_grade_to_show_subject_dto
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.repositories.student_average_repository_impl import StudentAverageRepositoryImpl
+from infrastructure.repositories.student_dashboard_repository_impl import StudentDashboardRepositoryImpl
+from infrastructure.repositories.report_version_repository_impl import ReportVersionRepositoryImpl
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import (
+    build_delete_grade_statement,
+    build_exists_by_id_query,
+    build_grade_rows_query,
+    build_student_grades_to_show_query,
+    build_subject_grades_to_show_query,
+    build_subject_grade_statistics_query,
+    build_update_grade_statement
+)
+from infrastructure.utils.constants import BULK_INSERT_BATCH_SIZE
+from infrastructure.utils.sort_fields import ALLOWED_GRADES_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+from infrastructure.mappers.grade_mappers import map_grade_entity_to_model, map_grade_model_to_entity, map_grade_to_show_student_row_to_entity, map_grade_to_show_subject_row_to_entity, map_subject_grade_statistics_row_to_entity
 
 class GradeRepositoryImpl(GradeRepository):
     def __init__(self, db: Session):
         self.db = db
+        self.student_average_repository = StudentAverageRepositoryImpl(db)
+        self.student_dashboard_repository = StudentDashboardRepositoryImpl(db)
+        self.report_version_repository = ReportVersionRepositoryImpl(db)
 
     def create(self, grade: Grade) -> Grade:
         grade_model = map_grade_entity_to_model(grade)
         self.db.add(grade_model)
-        self.db.commit()
-        self.db.refresh(grade_model)
+        self.student_average_repository.apply_grade_change(
+            grade_model.student_id,
+            value_delta=grade_model.value,
+            count_delta=1
+        )
+        self.student_dashboard_repository.refresh_students([grade_model.student_id])
+        self.report_version_repository.bump_grade_changes([grade_model.student_id], [grade_model.subject_id])
+        forget_existence(self.db.info, GradeModel, [grade_model.id])
 
         return Grade(
             id=grade_model.id,
@@ -26,6 +51,60 @@ class GradeRepositoryImpl(GradeRepository):
             value=grade_model.value
         )
     
+    def create_many(self, grades: List[Grade]) -> GradeBulkResult:
+        student_ids = {grade.student_id for grade in grades}
+        subject_ids = {grade.subject_id for grade in grades}
+
+        existing_student_ids = set(self.db.scalars(
+            select(StudentModel.id).where(StudentModel.id.in_(student_ids))
+        ).all())
+        existing_subject_ids = set(self.db.scalars(
+            select(SubjectModel.id).where(SubjectModel.id.in_(subject_ids))
+        ).all())
+        graded_pairs = set(self.db.execute(
+            select(GradeModel.student_id, GradeModel.subject_id).where(GradeModel.student_id.in_(student_ids))
+        ).tuples().all())
+
+        errors: List[GradeRowError] = []
+        grade_rows: List[dict] = []
+        changes: Dict[str, Tuple[float, int]] = {}
+
+        for row, grade in enumerate(grades, start=1):
+            if grade.student_id not in existing_student_ids:
+                errors.append(GradeRowError(row=row, message=f"Student with ID {grade.student_id} not found."))
+                continue
+            if grade.subject_id not in existing_subject_ids:
+                errors.append(GradeRowError(row=row, message=f"Course with ID {grade.subject_id} not found."))
+                continue
+            if (grade.student_id, grade.subject_id) in graded_pairs:
+                errors.append(GradeRowError(
+                    row=row,
+                    message=f"Student with ID {grade.student_id} already has a grade for course with ID {grade.subject_id}."
+                ))
+                continue
+
+            graded_pairs.add((grade.student_id, grade.subject_id))
+
+            grade_rows.append({
+                "student_id": grade.student_id,
+                "subject_id": grade.subject_id,
+                "value": grade.value
+            })
+            value_sum, count = changes.get(grade.student_id, (0.0, 0))
+            changes[grade.student_id] = (value_sum + grade.value, count + 1)
+
+        for start in range(0, len(grade_rows), BULK_INSERT_BATCH_SIZE):
+            self.db.execute(insert(GradeModel), grade_rows[start:start + BULK_INSERT_BATCH_SIZE])
+
+        self.student_average_repository.apply_grade_changes(changes)
+        self.student_dashboard_repository.refresh_students(changes.keys())
+        self.report_version_repository.bump_grade_changes(
+            changes.keys(),
+            {grade_row["subject_id"] for grade_row in grade_rows}
+        )
+
+        return GradeBulkResult(created=len(grade_rows), errors=errors)
+
     def get_by_id(self, grade_id: int) -> Grade | None:
         grade_model = self.db.query(GradeModel).filter(GradeModel.id == grade_id).first()
 
@@ -34,106 +113,142 @@ class GradeRepositoryImpl(GradeRepository):
         
         return map_grade_model_to_entity(grade_model)
 
+    def get_many(self, grade_ids: List[int]) -> List[Grade]:
+        grade_rows = self.db.execute(
+            build_grade_rows_query().where(GradeModel.id.in_(set(grade_ids)))
+        ).all()
+
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
+
     def get_all(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Grade]:
-        query = self.db.query(GradeModel)
-
-        if sort_field in ALLOWED_GRADES_SORT_FIELDS:
-            if sort_order in ALLOWED_SORT_ORDERS and sort_order == "asc":
-                query = query.order_by(getattr(GradeModel, sort_field).asc())
-            elif sort_order in ALLOWED_SORT_ORDERS and sort_order == "desc":
-                query = query.order_by(getattr(GradeModel, sort_field).desc())
-                
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        students_model = query.all()
+        query = paginate(
+            build_grade_rows_query(),
+            GradeModel,
+            ALLOWED_GRADES_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        grade_rows = self.db.execute(query).all()
 
-        return [map_grade_model_to_entity(grade_model) for grade_model in students_model]
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
 
     def update(self, grade: Grade) -> Grade | None:
-        grade_model = self.db.query(GradeModel).filter(GradeModel.id == grade.id).first()
+        if grade.value is None:
+            grade_row = self.db.execute(build_grade_rows_query().where(GradeModel.id == grade.id)).first()
+            return map_grade_model_to_entity(grade_row) if grade_row else None
 
-        if not grade_model:
+        grade_row = self.db.execute(build_update_grade_statement(grade.id, grade.value)).first()
+
+        if not grade_row:
             return None
-        
-        if grade.value is not None:
-            grade_model.value = grade.value
 
-        self.db.commit()
-        self.db.refresh(grade_model)
+        if grade_row.value != grade_row.previous_value:
+            self.student_average_repository.apply_grade_change(
+                grade_row.student_id,
+                value_delta=grade_row.value - grade_row.previous_value,
+                count_delta=0
+            )
+            self.student_dashboard_repository.refresh_students([grade_row.student_id])
+            self.report_version_repository.bump_grade_changes([grade_row.student_id], [grade_row.subject_id])
 
-        return Grade(
-            id=grade_model.id,
-            student_id=grade_model.student_id,
-            subject_id=grade_model.subject_id,
-            value=grade_model.value
-        )
+        return map_grade_model_to_entity(grade_row)
 
-    def delete(self, grade_id: int) -> bool:
-        grade_model = self.db.query(GradeModel).filter(GradeModel.id == grade_id).first()
+    def delete(self, grade_id: int) -> Grade | None:
+        grade_row = self.db.execute(build_delete_grade_statement(grade_id)).first()
 
-        if not grade_model:
-            return False
-        
-        self.db.delete(grade_model)
-        self.db.commit()
+        if not grade_row:
+            return None
+
+        self.student_average_repository.apply_grade_change(
+            grade_row.student_id,
+            value_delta=-grade_row.value,
+            count_delta=-1
+        )
+        self.student_dashboard_repository.refresh_students([grade_row.student_id])
+        self.report_version_repository.bump_grade_changes([grade_row.student_id], [grade_row.subject_id])
+        forget_existence(self.db.info, GradeModel, [grade_id])
 
-        return True
+        return map_grade_model_to_entity(grade_row)
 
     def exists(self, grade_id: int) -> bool:
-        student_model = self.db.query(GradeModel).filter(GradeModel.id == grade_id).first()
-        return student_model is not None
+        found = get_memoized_existence(self.db.info, GradeModel, grade_id)
+
+        if found is None:
+            found = self.db.scalar(build_exists_by_id_query(GradeModel, grade_id))
+            memoize_existence(self.db.info, GradeModel, [grade_id], found)
+
+        return found
+
+    def exists_for_student_and_subject(self, student_id: str, subject_id: str) -> bool:
+        grade_id = self.db.scalar(
+            select(GradeModel.id).where(
+                GradeModel.student_id == student_id,
+                GradeModel.subject_id == subject_id
+            )
+        )
+        return grade_id is not None
     
     def get_by_student_id(self, student_id: str) -> List[Grade] | None:
-        grade_models = self.db.query(GradeModel).filter(GradeModel.student_id == student_id).all()
+        grade_rows = self.db.execute(
+            build_grade_rows_query().where(GradeModel.student_id == student_id)
+        ).all()
 
-        if not grade_models:
+        if not grade_rows:
             return None
         
-        return [map_grade_model_to_entity(grade_model) for grade_model in grade_models]
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
     
     def get_by_subject_id(self, subject_id) -> List[Grade] | None:
-        grade_models = self.db.query(GradeModel).filter(GradeModel.subject_id == subject_id).all()
+        grade_rows = self.db.execute(
+            build_grade_rows_query().where(GradeModel.subject_id == subject_id)
+        ).all()
 
-        if not grade_models:
+        if not grade_rows:
             return None
         
-        return [map_grade_model_to_entity(grade_model) for grade_model in grade_models]
+        return [map_grade_model_to_entity(grade_row) for grade_row in grade_rows]
     
     def get_student_grades_to_show(self, student_id: str) -> List[GradeToShowStudent] | None:
-        grade_models = (
-            self.db.query(GradeModel)
-            .filter(GradeModel.student_id == student_id)
-            .all())
+        grade_rows = self.db.execute(build_student_grades_to_show_query(student_id)).all()
 
-        if not grade_models:
+        if not grade_rows:
             return None
         
-        return [map_grade_model_to_grade_to_show_student_dto(grade) for grade in grade_models]
+        return [map_grade_to_show_student_row_to_entity(grade_row) for grade_row in grade_rows]
     
     def get_subject_grades_to_show(self, subject_id: str) -> List[GradeToShowSubject] | None:
-        grade_models = (
-            self.db.query(GradeModel)
-            .filter(GradeModel.subject_id == subject_id)
-            .all())
+        grade_rows = self.db.execute(build_subject_grades_to_show_query(subject_id)).all()
 
-        if not grade_models:
+        if not grade_rows:
             return None
         
-        return [map_grade_model_to_grade_to_show_subject_dto(grade) for grade in grade_models]
+        return [map_grade_to_show_subject_row_to_entity(grade_row) for grade_row in grade_rows]
     
-    def is_regular_student(self, student_id: str) -> bool:
-        grades = self.db.query(GradeModel.value).filter(GradeModel.student_id == student_id).all()
+    def get_subject_grade_statistics(self, subject_id: str) -> SubjectGradeStatistics | None:
+        statistics_row = self.db.execute(build_subject_grade_statistics_query(subject_id)).one()
 
-        if not grades:
-            return False
+        if not statistics_row.count:
+            return None
         
-        for (value,) in grades:
-            if value < 70:
-                return False
-            
-        return True
\ No newline at end of file
+        return map_subject_grade_statistics_row_to_entity(statistics_row)
+
+    def stream_all(self, batch_size: int) -> Iterator[Grade]:
+        # Column projection plus a server-side cursor keeps memory constant on large tables
+        query = (
+            build_grade_rows_query()
+            .order_by(GradeModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        for grade_row in self.db.execute(query):
+            yield map_grade_model_to_entity(grade_row)
@@ -0,0 +1,50 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from typing import Iterable
+
+from domain.repositories.report_version_repository import ReportVersionRepository
+
+from infrastructure.db.models import StudentModel, SubjectModel
+from infrastructure.db.queries import (
+    build_bump_student_versions_statement,
+    build_bump_subject_versions_statement,
+    build_student_subject_ids_query,
+    build_subject_student_ids_query
+)
+
+class ReportVersionRepositoryImpl(ReportVersionRepository):
+    """
+    Stamps students and subjects with the version of their reports using SQLAlchemy.
+
+    The bump methods do not commit, so they join the transaction of the change
+    that triggered them.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_student_version(self, student_id: str) -> int | None:
+        return self.db.scalar(select(StudentModel.version).where(StudentModel.id == student_id))
+
+    def get_subject_version(self, subject_id: str) -> int | None:
+        return self.db.scalar(select(SubjectModel.version).where(SubjectModel.id == subject_id))
+
+    def bump_grade_changes(self, student_ids: Iterable[str], subject_ids: Iterable[str]) -> None:
+        student_ids, subject_ids = sorted(set(student_ids)), sorted(set(subject_ids))
+
+        if student_ids:
+            self.db.execute(build_bump_student_versions_statement(student_ids))
+        if subject_ids:
+            self.db.execute(build_bump_subject_versions_statement(subject_ids))
+
+    def bump_student(self, student_id: str) -> None:
+        self.db.execute(build_bump_student_versions_statement([student_id]))
+        self.db.execute(build_bump_subject_versions_statement(build_student_subject_ids_query(student_id)))
+
+    def bump_subject(self, subject_id: str) -> None:
+        self.db.execute(build_bump_student_versions_statement(build_subject_student_ids_query(subject_id)))
+        self.db.execute(build_bump_subject_versions_statement([subject_id]))
+
+    def bump_all_students(self) -> None:
+        self.db.execute(build_bump_student_versions_statement())
@@ -0,0 +1,78 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from typing import Dict, Tuple
+
+from domain.repositories.student_average_repository import StudentAverageRepository
+
+from infrastructure.db.queries import (
+    build_apply_grade_change_statement,
+    build_initialize_grade_stats_statement,
+    build_set_student_average_statement,
+    build_initialize_missing_grade_stats_statement,
+    build_apply_grade_changes_statement,
+    build_store_student_averages_statement,
+    build_rebuild_grade_stats_statements
+)
+
+class StudentAverageRepositoryImpl(StudentAverageRepository):
+    """
+    Keeps the running sum and count of grades of every student, and the
+    average derived from them, using SQLAlchemy.
+
+    apply_grade_change does not commit, so it joins the transaction of the
+    grade mutation that triggered it.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_grade_change(self, student_id: str, value_delta: float, count_delta: int) -> float:
+        self.db.flush()
+
+        totals = self.db.execute(
+            build_apply_grade_change_statement(student_id, value_delta, count_delta)
+        ).first()
+
+        if totals is None:
+            totals = self.db.execute(
+                build_initialize_grade_stats_statement(student_id, value_delta, count_delta)
+            ).one()
+
+        grades_sum, grades_count = totals
+        average = grades_sum / grades_count if grades_count > 0 else 0.0
+
+        self.db.execute(build_set_student_average_statement(student_id, average))
+
+        return average
+
+    def apply_grade_changes(self, changes: Dict[str, Tuple[float, int]]) -> None:
+        if not changes:
+            return
+
+        self.db.flush()
+
+        initialized_ids = set(self.db.scalars(
+            build_initialize_missing_grade_stats_statement(changes.keys())
+        ).all())
+        pending_changes = {
+            student_id: change
+            for student_id, change in changes.items()
+            if student_id not in initialized_ids
+        }
+
+        if pending_changes:
+            self.db.execute(build_apply_grade_changes_statement(pending_changes))
+
+        self.db.execute(build_store_student_averages_statement(changes.keys()))
+
+    def rebuild(self) -> int:
+        clear_totals, recompute_totals, store_averages = build_rebuild_grade_stats_statements()
+
+        # Blocks grade writes until the rebuild commits so no mutation is lost
+        self.db.execute(text("LOCK TABLE grades IN SHARE MODE"))
+        self.db.execute(clear_totals)
+        self.db.execute(recompute_totals)
+        students_updated = self.db.execute(store_averages).rowcount
+
+        return students_updated
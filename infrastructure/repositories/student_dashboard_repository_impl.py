@@ -0,0 +1,36 @@
+from sqlalchemy.orm import Session
+
+from typing import Iterable
+
+from domain.repositories.student_dashboard_repository import StudentDashboardRepository
+
+from infrastructure.db.queries import build_refresh_student_dashboard_statement, build_subject_student_ids_query
+
+class StudentDashboardRepositoryImpl(StudentDashboardRepository):
+    """
+    Keeps the students dashboard snapshot table in sync using SQLAlchemy.
+
+    The refresh methods do not commit, so they join the transaction of the
+    change that triggered them, and must run after it is applied.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_students(self, student_ids: Iterable[str]) -> None:
+        student_ids = list(student_ids)
+
+        if not student_ids:
+            return
+
+        self.db.flush()
+        self.db.execute(build_refresh_student_dashboard_statement(student_ids))
+
+    def refresh_subject_students(self, subject_id: str) -> None:
+        self.db.flush()
+        self.db.execute(build_refresh_student_dashboard_statement(build_subject_student_ids_query(subject_id)))
+
+    def rebuild(self) -> int:
+        students_refreshed = self.db.execute(build_refresh_student_dashboard_statement()).rowcount
+
+        return students_refreshed
@@ -0,0 +1,81 @@
+import os
+
+from threading import Lock
+from typing import Dict, List, Tuple
+
+from sqlalchemy.engine import Engine
+
+from domain.exceptions.cannot_create_exception import CannotCreateException
+from domain.repositories.student_id_repository import StudentIdRepository
+
+from infrastructure.db.database import engine
+from infrastructure.db.queries import build_reserve_student_ids_statement
+
+# Numbers reserved per round trip, a larger block saves round trips but leaves
+# a larger gap in the IDs when the process stops
+STUDENT_ID_BLOCK_SIZE = int(os.getenv("STUDENT_ID_BLOCK_SIZE", "50"))
+STUDENT_ID_DIGITS = 6
+STUDENT_ID_MAX_NUMBER = 10 ** STUDENT_ID_DIGITS - 1
+
+def get_student_id_prefix(year: int) -> str:
+    return f"A{str(year)[-2:]}"
+
+def format_student_ids(prefix: str, first: int, last: int) -> List[str]:
+    """
+    Formats the IDs of a range of reserved numbers.
+
+    Args:
+        prefix (str): The year prefix of the IDs.
+        first (int): The first number of the range.
+        last (int): The last number of the range, included.
+
+    Returns:
+        List[str]: The IDs, such as "A25000042".
+    """
+    if last > STUDENT_ID_MAX_NUMBER:
+        raise CannotCreateException(f"No student IDs left with the prefix {prefix}")
+
+    return [f"{prefix}{number:0{STUDENT_ID_DIGITS}d}" for number in range(first, last + 1)]
+
+class StudentIdRepositoryImpl(StudentIdRepository):
+    """
+    Hands out student IDs from blocks of numbers reserved on the
+    student_id_counters table, so most IDs need no round trip at all.
+
+    Every reservation moves the counter of the prefix forward in its own short
+    transaction, releasing the row lock right away instead of holding it until
+    the student is stored. Workers and pods never share a block, and numbers
+    of blocks not used up, or of failed inserts, are skipped.
+    """
+
+    def __init__(self, engine: Engine, block_size: int = STUDENT_ID_BLOCK_SIZE):
+        self.engine = engine
+        self.block_size = block_size
+        # Next and last number of the block being handed out, by prefix
+        self.blocks: Dict[str, Tuple[int, int]] = {}
+        self._lock = Lock()
+
+    def next_ids(self, year: int, count: int = 1) -> List[str]:
+        prefix = get_student_id_prefix(year)
+        ids = []
+
+        with self._lock:
+            while len(ids) < count:
+                next_number, last_number = self.blocks.get(prefix, (1, 0))
+
+                if next_number > last_number:
+                    size = max(self.block_size, count - len(ids))
+                    last_number = self.reserve(prefix, size)
+                    next_number = last_number - size + 1
+
+                taken = min(count - len(ids), last_number - next_number + 1)
+                ids += format_student_ids(prefix, next_number, next_number + taken - 1)
+                self.blocks[prefix] = (next_number + taken, last_number)
+
+        return ids
+
+    def reserve(self, prefix: str, size: int) -> int:
+        with self.engine.begin() as connection:
+            return connection.scalar(build_reserve_student_ids_statement(prefix, size))
+
+student_id_repository = StudentIdRepositoryImpl(engine)
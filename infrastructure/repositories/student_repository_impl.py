@@ -1,25 +1,40 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from domain.entities.student import Student
+from domain.entities.student import Student, StudentReportDashboard
 from domain.repositories.student_repository import StudentRepository
 
 from infrastructure.db.models import StudentModel
-from infrastructure.utils.sort_fields import ALLOWED_STUDENT_SORT_FIELDS, ALLOWED_SORT_ORDERS
-from infrastructure.mappers.student_mappers import map_student_entity_to_model, map_student_model_to_entity
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import (
+    build_delete_student_statement,
+    build_exists_by_id_query,
+    build_student_rows_query,
+    build_students_dashboard_query,
+    build_update_student_statement
+)
+from infrastructure.utils.constants import BULK_INSERT_BATCH_SIZE
+from infrastructure.utils.sort_fields import ALLOWED_STUDENT_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
+from infrastructure.mappers.student_mappers import map_student_entity_to_model, map_student_model_to_entity, map_student_dashboard_row_to_entity
+from infrastructure.repositories.student_dashboard_repository_impl import StudentDashboardRepositoryImpl
+from infrastructure.repositories.report_version_repository_impl import ReportVersionRepositoryImpl
 
 class StudentRepositoryImpl(StudentRepository):
     """Implementation of the StudentRepository interface using SQLAlchemy."""
     
     def __init__(self, db: Session):
         self.db = db
+        self.student_dashboard_repository = StudentDashboardRepositoryImpl(db)
+        self.report_version_repository = ReportVersionRepositoryImpl(db)
 
     def create(self, student: Student) -> Student:
         student_model = map_student_entity_to_model(student)
         self.db.add(student_model)
-        self.db.commit()
-        self.db.refresh(student_model)
+        self.student_dashboard_repository.refresh_students([student_model.id])
+        forget_existence(self.db.info, StudentModel, [student_model.id])
         
         return Student(
             id=student_model.id,
@@ -29,6 +44,25 @@ class StudentRepositoryImpl(StudentRepository):
             semester=student_model.semester
         )
     
+    def create_many(self, students: List[Student]) -> None:
+        student_rows = [
+            {
+                "id": student.id,
+                "name": student.name,
+                "lastname": student.lastname,
+                "email": student.email,
+                "semester": student.semester,
+                "average": 0.0
+            }
+            for student in students
+        ]
+
+        for start in range(0, len(student_rows), BULK_INSERT_BATCH_SIZE):
+            self.db.execute(insert(StudentModel), student_rows[start:start + BULK_INSERT_BATCH_SIZE])
+
+        self.student_dashboard_repository.refresh_students([student.id for student in students])
+        forget_existence(self.db.info, StudentModel, [student.id for student in students])
+
     def get_by_id(self, student_id: str) -> Student | None:
         student_model = self.db.query(StudentModel).filter(StudentModel.id == student_id).first()
 
@@ -37,73 +71,80 @@ class StudentRepositoryImpl(StudentRepository):
         
         return map_student_model_to_entity(student_model)
 
+    def get_many(self, student_ids: List[str]) -> List[Student]:
+        student_rows = self.db.execute(
+            build_student_rows_query().where(StudentModel.id.in_(set(student_ids)))
+        ).all()
+
+        return [map_student_model_to_entity(student_row) for student_row in student_rows]
+
     def get_by_semester(self, students_semester: int) -> List[Student]:
-        students_model = self.db.query(StudentModel).filter(StudentModel.semester == students_semester).all()
-        return [map_student_model_to_entity(student_model) for student_model in students_model]
+        student_rows = self.db.execute(
+            build_student_rows_query().where(StudentModel.semester == students_semester)
+        ).all()
+        return [map_student_model_to_entity(student_row) for student_row in student_rows]
 
     def get_all(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Student]:
-        query = self.db.query(StudentModel)
-
-        if sort_field in ALLOWED_STUDENT_SORT_FIELDS:
-            if sort_order in ALLOWED_SORT_ORDERS and sort_order == "asc":
-                query = query.order_by(getattr(StudentModel, sort_field).asc())
-            elif sort_order in ALLOWED_SORT_ORDERS and sort_order == "desc":
-                query = query.order_by(getattr(StudentModel, sort_field).desc())
-        
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        students_model = query.all()
+        query = paginate(
+            build_student_rows_query(),
+            StudentModel,
+            ALLOWED_STUDENT_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        student_rows = self.db.execute(query).all()
 
-        return [map_student_model_to_entity(student_model) for student_model in students_model]
+        return [map_student_model_to_entity(student_row) for student_row in student_rows]
 
     def update(self, student: Student) -> Student | None:
-        student_model = self.db.query(StudentModel).filter(StudentModel.id == student.id).first()
-        
-        if not student_model:
+        values = {
+            column: value
+            for column, value in (
+                ("name", student.name),
+                ("lastname", student.lastname),
+                ("email", student.email),
+                ("semester", student.semester)
+            )
+            if value is not None
+        }
+
+        if values:
+            student_row = self.db.execute(build_update_student_statement(student.id, values)).first()
+        else:
+            student_row = self.db.execute(build_student_rows_query().where(StudentModel.id == student.id)).first()
+
+        if not student_row:
             return None
-        
-        if student.name is not None:
-            student_model.name = student.name
-        if student.lastname is not None:
-            student_model.lastname = student.lastname
-        if student.email is not None:
-            student_model.email = student.email
-        if student.semester is not None:
-            student_model.semester = student.semester
-        if student.average is not None:
-            student_model.average = student.average
-
-        self.db.commit()
-        self.db.refresh(student_model)
 
-        return Student(
-            id=student_model.id,
-            name=student_model.name,
-            lastname=student_model.lastname,
-            email=student_model.email,
-            semester=student_model.semester,
-            average=student_model.average,
-        )
+        self.student_dashboard_repository.refresh_students([student_row.id])
+        self.report_version_repository.bump_student(student_row.id)
+
+        return map_student_model_to_entity(student_row)
 
     def delete(self, student_id: str) -> bool:
-        student_model = self.db.query(StudentModel).filter(StudentModel.id == student_id).first()
+        result = self.db.execute(build_delete_student_statement(student_id))
+        forget_existence(self.db.info, StudentModel, [student_id])
+
+        return result.rowcount > 0
 
-        if not student_model:
-            return False
-        
-        self.db.delete(student_model)
-        self.db.commit()
-        
-        return True
-    
     def exists(self, student_id: str) -> bool:
-        student_obtained = self.db.query(StudentModel).filter(StudentModel.id == student_id).first()
-        return student_obtained is not None
+        found = get_memoized_existence(self.db.info, StudentModel, student_id)
+
+        if found is None:
+            found = self.db.scalar(build_exists_by_id_query(StudentModel, student_id))
+            memoize_existence(self.db.info, StudentModel, [student_id], found)
+
+        return found
     
     def get_average_by_student_id(self, student_id: str) -> float | None:
         """To get the average grade of a student by their ID. Implementation"""
@@ -111,4 +152,34 @@ class StudentRepositoryImpl(StudentRepository):
             self.db.query(StudentModel.average)
             .filter(StudentModel.id == student_id)
             .scalar()
-        )
\ No newline at end of file
+        )
+
+    def get_all_for_dashboard(
+        self,
+        page_size: int,
+        page: int,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> List[StudentReportDashboard]:
+        query = build_students_dashboard_query(
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        student_rows = self.db.execute(query).all()
+
+        return [map_student_dashboard_row_to_entity(student_row) for student_row in student_rows]
+
+    def stream_all(self, batch_size: int) -> Iterator[Student]:
+        # Column projection plus a server-side cursor keeps memory constant on large tables
+        query = (
+            build_student_rows_query()
+            .order_by(StudentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        for student_row in self.db.execute(query):
+            yield map_student_model_to_entity(student_row)
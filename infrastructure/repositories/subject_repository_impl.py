@@ -1,25 +1,32 @@
 from sqlalchemy.orm import Session
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from domain.entities.subject import Subject
 from domain.repositories.subject_repository import SubjectRepository
 
 from infrastructure.db.models import SubjectModel
-from infrastructure.utils.sort_fields import ALLOWED_SUBJECT_SORT_FIELDS, ALLOWED_SORT_ORDERS
+from infrastructure.db.existence_memo import forget_existence, get_memoized_existence, memoize_existence
+from infrastructure.db.queries import build_delete_subject_statement, build_exists_by_id_query, build_subject_rows_query, build_update_subject_statement
+from infrastructure.utils.sort_fields import ALLOWED_SUBJECT_SORT_FIELDS
+from infrastructure.utils.pagination import paginate
 from infrastructure.mappers.subject_mappers import map_subject_entity_to_model, map_subject_model_to_entity
+from infrastructure.repositories.student_dashboard_repository_impl import StudentDashboardRepositoryImpl
+from infrastructure.repositories.report_version_repository_impl import ReportVersionRepositoryImpl
 
 class SubjectRepositoryImpl(SubjectRepository):
     """Implementation of the SubjectRepository interface using SQLAlchemy."""
     
     def __init__(self, db: Session):
         self.db = db
+        self.student_dashboard_repository = StudentDashboardRepositoryImpl(db)
+        self.report_version_repository = ReportVersionRepositoryImpl(db)
 
     def create(self, subject: Subject) -> Subject:
         subject_model = map_subject_entity_to_model(subject)
         self.db.add(subject_model)
-        self.db.commit()
-        self.db.refresh(subject_model)
+        self.db.flush()
+        forget_existence(self.db.info, SubjectModel, [subject_model.id])
 
         return Subject(
             id=subject_model.id,
@@ -37,67 +44,90 @@ class SubjectRepositoryImpl(SubjectRepository):
         
         return map_subject_model_to_entity(subject_model)
 
+    def get_many(self, subject_ids: List[str]) -> List[Subject]:
+        subject_rows = self.db.execute(
+            build_subject_rows_query().where(SubjectModel.id.in_(set(subject_ids)))
+        ).all()
+
+        return [map_subject_model_to_entity(subject_row) for subject_row in subject_rows]
+
     def get_by_semester(self, subjects_semester: int) -> List[Subject]:
-        subjects_model = self.db.query(SubjectModel).filter(SubjectModel.semester == subjects_semester).all()
-        return [map_subject_model_to_entity(subject_model) for subject_model in subjects_model]
+        subject_rows = self.db.execute(
+            build_subject_rows_query().where(SubjectModel.semester == subjects_semester)
+        ).all()
+        return [map_subject_model_to_entity(subject_row) for subject_row in subject_rows]
 
     def get_all(
         self,
         page_size: int,
         page: int,
         sort_field: Optional[str] = None,
-        sort_order: Optional[str] = None
+        sort_order: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Subject]:
-        query = self.db.query(SubjectModel)
-
-        if sort_field in ALLOWED_SUBJECT_SORT_FIELDS:
-            if sort_order in ALLOWED_SORT_ORDERS and sort_order == "asc":
-                query = query.order_by(getattr(SubjectModel, sort_field).asc())
-            elif sort_order in ALLOWED_SORT_ORDERS and sort_order == "desc":
-                query = query.order_by(getattr(SubjectModel, sort_field).desc())
-
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        subjects_model = query.all()
+        query = paginate(
+            build_subject_rows_query(),
+            SubjectModel,
+            ALLOWED_SUBJECT_SORT_FIELDS,
+            page_size=page_size,
+            page=page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            cursor=cursor
+        )
+        subject_rows = self.db.execute(query).all()
 
-        return [map_subject_model_to_entity(subject_model) for subject_model in subjects_model]
+        return [map_subject_model_to_entity(subject_row) for subject_row in subject_rows]
 
     def update(self, subject: Subject) -> Subject | None:
-        subject_model = self.db.query(SubjectModel).filter(SubjectModel.id == subject.id).first()
-            
-        if not subject_model:
+        values = {
+            column: value
+            for column, value in (
+                ("name", subject.name),
+                ("description", subject.description),
+                ("credits", subject.credits),
+                ("semester", subject.semester)
+            )
+            if value is not None
+        }
+
+        if values:
+            subject_row = self.db.execute(build_update_subject_statement(subject.id, values)).first()
+        else:
+            subject_row = self.db.execute(build_subject_rows_query().where(SubjectModel.id == subject.id)).first()
+
+        if not subject_row:
             return None
-        
-        if subject.name is not None:
-            subject_model.name = subject.name
-        if subject.description is not None:
-            subject_model.description = subject.description
-        if subject.credits is not None:
-            subject_model.credits = subject.credits
-        if subject.semester is not None:
-            subject_model.semester = subject.semester
-
-        self.db.commit()
-        self.db.refresh(subject_model)
 
-        return Subject(
-            id=subject_model.id,
-            name=subject_model.name,
-            description=subject_model.description,
-            credits=subject_model.credits,
-            semester=subject_model.semester
-        )
+        if values and subject_row.credits != subject_row.previous_credits:
+            self.student_dashboard_repository.refresh_subject_students(subject_row.id)
 
-    def delete(self, subject_id: str) -> bool:
-        subject_model = self.db.query(SubjectModel).filter(SubjectModel.id == subject_id).first()
+        self.report_version_repository.bump_subject(subject_row.id)
 
-        if not subject_model:
-            return False
-        
-        self.db.delete(subject_model)
-        self.db.commit()
+        return map_subject_model_to_entity(subject_row)
+
+    def delete(self, subject_id: str) -> bool:
+        result = self.db.execute(build_delete_subject_statement(subject_id))
+        forget_existence(self.db.info, SubjectModel, [subject_id])
 
-        return True
+        return result.rowcount > 0
 
     def exists(self, subject_id: str) -> bool:
-        subject_obtained = self.db.query(SubjectModel).filter(SubjectModel.id == subject_id).first()
-        return subject_obtained is not None
\ No newline at end of file
+        found = get_memoized_existence(self.db.info, SubjectModel, subject_id)
+
+        if found is None:
+            found = self.db.scalar(build_exists_by_id_query(SubjectModel, subject_id))
+            memoize_existence(self.db.info, SubjectModel, [subject_id], found)
+
+        return found
+
+    def stream_all(self, batch_size: int) -> Iterator[Subject]:
+        # Column projection plus a server-side cursor keeps memory constant on large tables
+        query = (
+            build_subject_rows_query()
+            .order_by(SubjectModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        for subject_row in self.db.execute(query):
+            yield map_subject_model_to_entity(subject_row)
@@ -1,5 +1,10 @@
 from pydantic import BaseModel, Field
 
+from typing import List, Optional
+
+from infrastructure.utils.constants import BATCH_GET_MAX_IDS
+from infrastructure.utils.serialization import ListSerializer
+
 class GradeBaseDTO(BaseModel):
     """Base DTO for grade data transfer objects"""
     student_id: str
@@ -42,4 +47,40 @@ class GradeToShowSubjectResponseDTO(BaseModel):
 
     class Config:
         from_attributes = True
-    
\ No newline at end of file
+    
+
+class BulkGradeRowDTO(BaseModel):
+    """DTO for a row of a bulk grade import. Rows are validated one by one"""
+    student_id: Optional[str] = None
+    subject_id: Optional[str] = None
+    value: Optional[float] = None
+
+class GradeRowErrorDTO(BaseModel):
+    """DTO for a row rejected by a bulk grade import"""
+    row: int
+    message: str
+
+    class Config:
+        from_attributes = True
+
+class BulkGradeResponseDTO(BaseModel):
+    """DTO returned by a bulk grade import"""
+    created: int
+    errors: List[GradeRowErrorDTO]
+
+    class Config:
+        from_attributes = True
+
+class BatchGetGradesDTO(BaseModel):
+    """DTO for getting several grades by ID"""
+    ids: List[int] = Field(..., min_length=1, max_length=BATCH_GET_MAX_IDS)
+
+class BatchGetGradesResponseDTO(BaseModel):
+    """DTO for the grades found by ID, in request order with null for the missing ones"""
+    results: List[Optional[GradeResponseDTO]]
+    missing_ids: List[int]
+
+# Pre-built serializers for list responses
+GRADE_LIST_SERIALIZER = ListSerializer(GradeResponseDTO)
+GRADE_TO_SHOW_STUDENT_LIST_SERIALIZER = ListSerializer(GradeToShowStudentResponseDTO)
+GRADE_TO_SHOW_SUBJECT_LIST_SERIALIZER = ListSerializer(GradeToShowSubjectResponseDTO)
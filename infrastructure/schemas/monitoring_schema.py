@@ -0,0 +1,29 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class PoolStatisticsResponseDTO(BaseModel):
+    """DTO for the connections and checkout wait times of a connection pool"""
+    size: int
+    max_overflow: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    average_wait_ms: float
+    max_wait_ms: float
+
+    class Config:
+        from_attributes = True
+
+class ConnectionPoolsResponseDTO(BaseModel):
+    """DTO for the pools of the sync engine and, in async mode, the async engine"""
+    sync_pool: PoolStatisticsResponseDTO
+    async_pool: Optional[PoolStatisticsResponseDTO] = None
+
+class CacheStatisticsResponseDTO(BaseModel):
+    """DTO for the lookups served by the entity cache of one kind of resource"""
+    namespace: str
+    hits: int
+    misses: int
+    hit_ratio: float
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 
 from infrastructure.schemas.student_schema import StudentResponseDTO
 from infrastructure.schemas.grades_schema import GradeToShowStudentResponseDTO, GradeToShowSubjectResponseDTO
+from infrastructure.utils.serialization import ListSerializer
 
 class StudentWithAverageResponseDTO(StudentResponseDTO):
     """DTO for student average response"""
@@ -18,9 +19,22 @@ class ReportStudentsResponseDTO(BaseModel):
     class Config:
         from_attributes = True
 
+class SubjectGradeStatisticsResponseDTO(BaseModel):
+    """DTO for the aggregated grade statistics of a subject"""
+    count: int
+    average: float
+    minimum: float
+    maximum: float
+    standard_deviation: float
+    pass_rate: float
+
+    class Config:
+        from_attributes = True
+
 class ReportSubjectsResponseDTO(BaseModel):
     students: List[GradeToShowSubjectResponseDTO]
     average: float
+    statistics: SubjectGradeStatisticsResponseDTO
 
     class Config:
         from_attributes = True
@@ -28,6 +42,11 @@ class ReportSubjectsResponseDTO(BaseModel):
 class StudentsDashboardResponseDTO(StudentWithAverageResponseDTO):
     """DTO for student dashboard response"""
     status: bool
+    grades_count: int
+    credits_attempted: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Pre-built serializers for list responses
+STUDENTS_DASHBOARD_LIST_SERIALIZER = ListSerializer(StudentsDashboardResponseDTO)
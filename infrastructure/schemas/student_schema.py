@@ -1,6 +1,9 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, Field, EmailStr
 
-from typing import Optional
+from typing import List, Optional
+
+from infrastructure.utils.constants import BATCH_GET_MAX_IDS
+from infrastructure.utils.serialization import ListSerializer
 
 class StudentBaseDTO(BaseModel):
     """Base DTO for student data transfer objects"""
@@ -36,4 +39,40 @@ class StudentWithAverageResponseDTO(StudentResponseDTO):
     average: float
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class BatchGetStudentsDTO(BaseModel):
+    """DTO for getting several students by ID"""
+    ids: List[str] = Field(..., min_length=1, max_length=BATCH_GET_MAX_IDS)
+
+class BatchGetStudentsResponseDTO(BaseModel):
+    """DTO for the students found by ID, in request order with null for the missing ones"""
+    results: List[Optional[StudentResponseDTO]]
+    missing_ids: List[str]
+
+class BulkStudentRowDTO(BaseModel):
+    """DTO for a row of a bulk student enrollment. Rows are validated one by one"""
+    name: Optional[str] = None
+    lastname: Optional[str] = None
+    email: Optional[str] = None
+    semester: Optional[int] = None
+
+class StudentRowErrorDTO(BaseModel):
+    """DTO for a row rejected by a bulk student enrollment"""
+    row: int
+    message: str
+
+    class Config:
+        from_attributes = True
+
+class BulkStudentResponseDTO(BaseModel):
+    """DTO returned by a bulk student enrollment, with the ID of every row in input order and null for the rejected ones"""
+    created: int
+    ids: List[Optional[str]]
+    errors: List[StudentRowErrorDTO]
+
+    class Config:
+        from_attributes = True
+
+# Pre-built serializers for list responses
+STUDENT_LIST_SERIALIZER = ListSerializer(StudentResponseDTO)
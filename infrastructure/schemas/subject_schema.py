@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from typing import Optional
+from typing import List, Optional
+
+from infrastructure.utils.constants import BATCH_GET_MAX_IDS
+from infrastructure.utils.serialization import ListSerializer
 
 class SubjectBaseDTO(BaseModel):
     """Base DTO for subject data transfer objects"""
@@ -29,4 +32,16 @@ class SubjectResponseDTO(SubjectBaseDTO):
     id: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class BatchGetSubjectsDTO(BaseModel):
+    """DTO for getting several subjects by ID"""
+    ids: List[str] = Field(..., min_length=1, max_length=BATCH_GET_MAX_IDS)
+
+class BatchGetSubjectsResponseDTO(BaseModel):
+    """DTO for the subjects found by ID, in request order with null for the missing ones"""
+    results: List[Optional[SubjectResponseDTO]]
+    missing_ids: List[str]
+
+# Pre-built serializers for list responses
+SUBJECT_LIST_SERIALIZER = ListSerializer(SubjectResponseDTO)
@@ -1,2 +1,9 @@
 SORTERS_FIELD = "sorters[0][field]"
-SORTERS_ORDER = "sorters[0][order]"
\ No newline at end of file
+SORTERS_ORDER = "sorters[0][order]"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+BULK_INSERT_BATCH_SIZE = 1000
+EXPORT_BATCH_SIZE = 1000
+
+REPORT_CACHE_CONTROL = "private, no-cache"
+BATCH_GET_MAX_IDS = 500
@@ -0,0 +1,52 @@
+import csv
+import io
+import orjson
+
+from dataclasses import astuple, fields
+from enum import Enum
+from typing import Iterable, Iterator
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+def stream_csv(entities: Iterable, entity_type: type, chunk_size: int) -> Iterator[str]:
+    """
+    Encodes dataclass entities as CSV, with a header taken from the dataclass
+    fields, yielding one chunk of text every chunk_size rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([field.name for field in fields(entity_type)])
+
+    for row_number, entity in enumerate(entities, start=1):
+        writer.writerow(astuple(entity))
+
+        if row_number % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+def stream_ndjson(entities: Iterable, chunk_size: int) -> Iterator[bytes]:
+    """
+    Encodes dataclass entities as newline-delimited JSON, yielding one chunk
+    of bytes every chunk_size rows. orjson serializes the dataclasses natively.
+    """
+    lines = []
+
+    for entity in entities:
+        lines.append(orjson.dumps(entity) + b"\n")
+
+        if len(lines) == chunk_size:
+            yield b"".join(lines)
+            lines = []
+
+    if lines:
+        yield b"".join(lines)
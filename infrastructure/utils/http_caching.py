@@ -0,0 +1,33 @@
+from typing import Optional
+
+from fastapi import Response, status
+
+from infrastructure.utils.constants import REPORT_CACHE_CONTROL
+
+def build_etag(*parts) -> str:
+    """
+    Builds a strong ETag from the parts identifying a representation.
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag. As the header requires,
+    the comparison is weak, so W/ prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+
+    return "*" in candidates or etag in candidates
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REPORT_CACHE_CONTROL
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag)
+
+    return response
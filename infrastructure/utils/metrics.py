@@ -0,0 +1,120 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds, in seconds, of the request latency buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{escape_label_value(str(value))}"' for name, value in labels) + "}"
+
+def format_metric(name: str, metric_type: str, help_text: str, samples: Iterable[Tuple[Labels, float]]) -> List[str]:
+    """
+    Formats one metric family in the Prometheus text exposition format.
+
+    Args:
+        name (str): The name of the metric.
+        metric_type (str): counter, gauge or histogram.
+        help_text (str): The description sent in the HELP line.
+        samples (Iterable[Tuple[Labels, float]]): The labels and value of every sample.
+
+    Returns:
+        List[str]: The HELP, TYPE and sample lines.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+class Histogram:
+    """
+    Counts observations in fixed buckets. Each observation only increments the
+    count of its own bucket, the cumulative counts are computed when exported.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        # The last count is the +Inf bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+    def samples(self, name: str, labels: Labels) -> List[str]:
+        lines = []
+        cumulative = 0
+
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{format_labels(labels + (('le', le),))} {cumulative}")
+
+        lines.append(f"{name}_sum{format_labels(labels)} {self.total}")
+        lines.append(f"{name}_count{format_labels(labels)} {cumulative}")
+        return lines
+
+class RequestMetrics:
+    """
+    Aggregates the requests served by this process in memory.
+
+    Requests and exceptions are recorded from middleware and exception
+    handlers, which all run on the event loop, so no locking is needed.
+    """
+
+    def __init__(self):
+        self.in_progress = 0
+        self.latencies: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = defaultdict(int)
+        self.exceptions: Dict[str, int] = defaultdict(int)
+
+    def observe_request(self, method: str, route: str, status_code: int, elapsed: float) -> None:
+        histogram = self.latencies.get((method, route))
+        if histogram is None:
+            histogram = self.latencies[(method, route)] = Histogram()
+
+        histogram.observe(elapsed)
+        self.responses[(method, route, status_code)] += 1
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions[type(exception).__name__] += 1
+
+    def render(self) -> List[str]:
+        name = "sicei_http_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Time to serve a request, streamed bodies included.",
+            f"# TYPE {name} histogram",
+        ]
+        for (method, route), histogram in sorted(self.latencies.items()):
+            lines.extend(histogram.samples(name, (("method", method), ("route", route))))
+
+        lines += format_metric(
+            "sicei_http_requests_total", "counter", "Responses sent, by route and status code.",
+            (
+                ((("method", method), ("route", route), ("status", str(status_code))), count)
+                for (method, route, status_code), count in sorted(self.responses.items())
+            )
+        )
+        lines += format_metric(
+            "sicei_http_requests_in_progress", "gauge", "Requests being served.",
+            [((), self.in_progress)]
+        )
+        lines += format_metric(
+            "sicei_exceptions_total", "counter",
+            "Exceptions raised while serving requests, by type. Includes the domain exceptions mapped to HTTP errors.",
+            (((("type", exception_type),), count) for exception_type, count in sorted(self.exceptions.items()))
+        )
+
+        return lines
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,151 @@
+import base64
+import binascii
+import json
+import sys
+
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from fastapi import Response
+from sqlalchemy import BigInteger, tuple_
+
+from domain.exceptions.invalid_cursor_exception import InvalidCursorException
+
+from infrastructure.utils.constants import NEXT_CURSOR_HEADER
+from infrastructure.utils.sort_fields import ALLOWED_SORT_ORDERS
+
+@dataclass
+class SortSpec:
+    field: str
+    descending: bool
+
+def resolve_sort(
+    allowed_sort_fields: set,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = None
+) -> SortSpec:
+    """
+    Resolves the requested sorting. Unknown fields or orders fall back to
+    sorting by id, so every page has a deterministic order.
+    """
+    if sort_field in allowed_sort_fields and sort_order in ALLOWED_SORT_ORDERS:
+        return SortSpec(field=sort_field, descending=sort_order == "desc")
+
+    return SortSpec(field="id", descending=False)
+
+def encode_cursor(sort: SortSpec, value: Any, last_id: Any) -> str:
+    payload = {"field": sort.field, "desc": sort.descending, "value": value, "id": last_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def matches_column_type(key: Any, column) -> bool:
+    """
+    Checks that a key decoded from a cursor is a scalar of the column's type
+    that the database can compare against. Integers are accepted for float
+    columns, booleans only for boolean ones.
+    """
+    python_type = column.type.python_type
+
+    if isinstance(key, bool) or python_type is bool:
+        return isinstance(key, bool) and python_type is bool
+
+    if python_type is float:
+        return isinstance(key, float) or (isinstance(key, int) and abs(key) <= sys.float_info.max)
+
+    if python_type is int:
+        bits = 64 if isinstance(column.type, BigInteger) else 32
+        return isinstance(key, int) and -2 ** (bits - 1) <= key < 2 ** (bits - 1)
+
+    return isinstance(key, python_type)
+
+def decode_cursor(cursor: str, sort: SortSpec, sort_column, id_column) -> tuple[Any, Any]:
+    """
+    Decodes a cursor built by encode_cursor. Cursors that are malformed, were
+    issued for another sorting or carry keys of the wrong type raise
+    InvalidCursorException, so a tampered cursor never reaches the query.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        field, descending, value, last_id = payload["field"], payload["desc"], payload["value"], payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorException()
+
+    if field != sort.field or descending != sort.descending:
+        raise InvalidCursorException("The pagination cursor was issued for a different sorting.")
+
+    if not matches_column_type(value, sort_column) or not matches_column_type(last_id, id_column):
+        raise InvalidCursorException()
+
+    return value, last_id
+
+def paginate(
+    query,
+    model,
+    allowed_sort_fields: set,
+    page_size: int,
+    page: int,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    cursor: Optional[str] = None
+):
+    """
+    Orders a Query or Select by the requested field with the primary key as a
+    tiebreaker and restricts it to one page.
+
+    With a cursor the page starts right after the row the cursor points to
+    (keyset pagination) and page is ignored, so deep pages cost the same as
+    the first one. Without it, the page is selected with OFFSET.
+    """
+    sort = resolve_sort(allowed_sort_fields, sort_field, sort_order)
+    sort_columns = [model.id] if sort.field == "id" else [getattr(model, sort.field), model.id]
+
+    query = query.order_by(*[
+        column.desc() if sort.descending else column.asc()
+        for column in sort_columns
+    ])
+
+    if cursor is None:
+        return query.offset((page - 1) * page_size).limit(page_size)
+
+    value, last_id = decode_cursor(cursor, sort, sort_columns[0], model.id)
+    if sort.field == "id":
+        keys, last_keys = model.id, last_id
+    else:
+        keys, last_keys = tuple_(*sort_columns), tuple_(value, last_id)
+
+    query = query.where(keys < last_keys if sort.descending else keys > last_keys)
+
+    return query.limit(page_size)
+
+def build_next_cursor(
+    items: Sequence,
+    page_size: int,
+    allowed_sort_fields: set,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = None
+) -> Optional[str]:
+    """
+    Builds the cursor of the page following items, or None when items is the last page.
+    """
+    if not items or len(items) < page_size:
+        return None
+
+    sort = resolve_sort(allowed_sort_fields, sort_field, sort_order)
+    last_item = items[-1]
+
+    return encode_cursor(sort, getattr(last_item, sort.field), last_item.id)
+
+def set_next_cursor_header(
+    response: Response,
+    items: Sequence,
+    page_size: int,
+    allowed_sort_fields: set,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = None
+) -> None:
+    """
+    Sets the header carrying the cursor of the next page, unless items is the last page.
+    """
+    next_cursor = build_next_cursor(items, page_size, allowed_sort_fields, sort_field, sort_order)
+
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,56 @@
+from typing import Dict, FrozenSet
+
+# Most statements each endpoint may issue per request, as measured with cold
+# caches. Keyed by "METHOD /route/{param}", the same key the query stats logs use.
+# Raise a budget only together with the change that needs the extra queries.
+QUERY_BUDGETS: Dict[str, int] = {
+    "GET /students/": 1,
+    "GET /students/{student_id}": 1,
+    "GET /students/semester/{students_semester}": 1,
+    "POST /students/batch-get": 1,
+    "POST /students/": 3,
+    "PUT /students/{student_id}": 4,
+    "DELETE /students/{student_id}": 1,
+
+    "GET /subjects/": 1,
+    "GET /subjects/{subject_id}": 1,
+    "GET /subjects/semester/{subjects_semester}": 1,
+    "POST /subjects/batch-get": 1,
+    "POST /subjects/": 2,
+    "PUT /subjects/{subject_id}": 4,
+    "DELETE /subjects/{subject_id}": 1,
+
+    "GET /grades/": 1,
+    "GET /grades/{grade_id}": 1,
+    "GET /grades/student/{student_id}": 1,
+    "GET /grades/subject/{subject_id}": 1,
+    "GET /grades/students": 1,
+    "GET /grades/students/{student_id}": 1,
+    "GET /grades/subjects": 1,
+    "GET /grades/subjects/{subject_id}": 1,
+    "POST /grades/batch-get": 1,
+    "POST /grades/": 10,
+    "PUT /grades/{grade_id}": 6,
+    "DELETE /grades/{grade_id}": 6,
+
+    "GET /reports/students": 1,
+    "GET /reports/students/{student_id}/grades": 3,
+    "GET /reports/subjects/{subject_id}/grades": 3,
+
+    "GET /exports/students.{export_format}": 1,
+    "GET /exports/subjects.{export_format}": 1,
+    "GET /exports/grades.{export_format}": 1,
+
+    "GET /monitoring/pool": 0,
+    "GET /monitoring/cache": 0,
+}
+
+# Bulk imports issue one INSERT per BULK_INSERT_BATCH_SIZE rows plus their follow-up
+# statements, so their count grows with the upload. They are never budgeted,
+# not even by QUERY_BUDGET_DEFAULT.
+UNBUDGETED_ROUTES: FrozenSet[str] = frozenset({
+    "POST /students/bulk",
+    "POST /students/bulk/csv",
+    "POST /grades/bulk",
+    "POST /grades/bulk/csv",
+})
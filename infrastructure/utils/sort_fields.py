@@ -1,5 +1,6 @@
 ALLOWED_STUDENT_SORT_FIELDS = {"id", "name", "lastname", "email", "semester"}
+ALLOWED_STUDENT_DASHBOARD_SORT_FIELDS = ALLOWED_STUDENT_SORT_FIELDS | {"average", "status", "grades_count", "credits_attempted"}
 ALLOWED_SUBJECT_SORT_FIELDS = {"id", "name", "credits", "semester"}
-ALLOWED_GRADES_SORT_FIELDS = {"id", "student_id", "subject_id", "grade"}
+ALLOWED_GRADES_SORT_FIELDS = {"id", "student_id", "subject_id", "value"}
 
 ALLOWED_SORT_ORDERS = {"asc", "desc"}
\ No newline at end of file
@@ -0,0 +1,29 @@
+import functools
+
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+def blocking_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Serves an endpoint that uses the synchronous Session from the threadpool,
+    so waiting for a pooled connection never blocks the event loop.
+
+    A plain def endpoint would also run there, but FastAPI then validates its
+    response in a second threadpool call while the session still holds its
+    connection. Once every thread waits for a connection, the requests holding
+    them can no longer finish and all of them stall until the pool times out.
+    Running the whole body in one call lets the response be validated on the
+    event loop, and the session is closed without waiting for a free thread.
+
+    Args:
+        endpoint (Callable[..., Any]): The def endpoint, placed below the route decorator.
+
+    Returns:
+        Callable[..., Any]: An async endpoint with the same signature.
+    """
+    @functools.wraps(endpoint)
+    async def run_endpoint(*args, **kwargs):
+        return await run_in_threadpool(endpoint, *args, **kwargs)
+
+    return run_endpoint
@@ -1,24 +1,48 @@
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException
 
-from infrastructure.api.student_router import router as student_router
-from infrastructure.api.subject_router import router as subject_router
-from infrastructure.api.grade_router import router as grade_router
-from infrastructure.api.report_router import router as report_router
-from infrastructure.db.database import engine
-from infrastructure.db.models import Base
+from infrastructure.api.export_router import router as export_router
+from infrastructure.api.metrics_router import router as metrics_router
+from infrastructure.api.monitoring_router import router as monitoring_router
+from infrastructure.db.database import DATABASE_MODE
 from infrastructure.docs.openapi_tags import openapi_tags
 from infrastructure.docs.api_description import description
+from infrastructure.middleware.compression import CompressionMiddleware
+from infrastructure.middleware.metrics import MetricsMiddleware, counting_http_exception_handler
+from infrastructure.middleware.query_stats import QueryStatsMiddleware
+from infrastructure.utils.constants import NEXT_CURSOR_HEADER
+
+if DATABASE_MODE == "async":
+    from infrastructure.api.async_student_router import router as student_router
+    from infrastructure.api.async_subject_router import router as subject_router
+    from infrastructure.api.async_grade_router import router as grade_router
+    from infrastructure.api.async_report_router import router as report_router
+else:
+    from infrastructure.api.student_router import router as student_router
+    from infrastructure.api.subject_router import router as subject_router
+    from infrastructure.api.grade_router import router as grade_router
+    from infrastructure.api.report_router import router as report_router
 
-app = FastAPI()
+# The query stats of every request are logged as one JSON line each
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s")
 
-Base.metadata.create_all(bind=engine)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.include_router(student_router)
 app.include_router(subject_router)
 app.include_router(grade_router)
 app.include_router(report_router)
+app.include_router(export_router)
+app.include_router(monitoring_router)
+app.include_router(metrics_router)
+
+app.add_exception_handler(HTTPException, counting_http_exception_handler)
 
 def custom_openapi():
     if app.openapi_schema:
@@ -56,4 +80,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Server-Timing"],
 )
+
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
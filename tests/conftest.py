@@ -0,0 +1,41 @@
+"""
+The tests run against the database configured by the ENV file, migrated with
+`alembic upgrade head`. They seed their own rows and remove them afterwards,
+and are skipped when the database cannot be reached.
+"""
+from typing import Iterator
+
+import pytest
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from infrastructure.db.database import SessionLocal, engine
+
+@pytest.fixture(scope="session")
+def database_available() -> None:
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except OperationalError as e:
+        pytest.skip(f"Database not available: {e}")
+
+@pytest.fixture
+def db(database_available) -> Iterator[Session]:
+    db = SessionLocal()
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture(scope="session")
+def client(database_available) -> Iterator[TestClient]:
+    from main import app
+
+    # A single client, and so a single event loop, serves the whole run, since
+    # the connections pooled by the async engine belong to the loop that opened them
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,125 @@
+"""
+The bulk imports are served in both database modes, creating the valid rows
+and reporting the others by their 1-based position.
+"""
+import uuid
+
+from typing import Iterator, List
+
+import pytest
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from infrastructure.db.models import GradeModel, StudentGradeStatsModel, StudentModel, SubjectModel
+
+BULK_ID_PREFIX = "TEST-bulk"
+
+class BulkData:
+    def __init__(self):
+        self.student_ids: List[str] = []
+        self.subject_ids: List[str] = []
+
+    def add_student(self, db: Session) -> str:
+        student_id = f"{BULK_ID_PREFIX}-{uuid.uuid4().hex[:12]}"
+        db.execute(insert(StudentModel).values(
+            id=student_id, name="Bulk", lastname="Student", email="bulk@example.com", semester=1, average=0.0
+        ))
+        db.commit()
+        self.student_ids.append(student_id)
+        return student_id
+
+    def add_subject(self, db: Session) -> str:
+        subject_id = f"{BULK_ID_PREFIX}-{uuid.uuid4().hex[:12]}"
+        db.execute(insert(SubjectModel).values(
+            id=subject_id, name="Bulk subject", description="Bulk subject", credits=5, semester=1
+        ))
+        db.commit()
+        self.subject_ids.append(subject_id)
+        return subject_id
+
+    def remove(self, db: Session) -> None:
+        """Deletes the seeded rows, students cascade to their stats and dashboard rows."""
+        db.rollback()
+        db.execute(delete(GradeModel).where(
+            GradeModel.student_id.in_(self.student_ids) | GradeModel.subject_id.in_(self.subject_ids)
+        ))
+        db.execute(delete(StudentModel).where(StudentModel.id.in_(self.student_ids)))
+        db.execute(delete(SubjectModel).where(SubjectModel.id.in_(self.subject_ids)))
+        db.commit()
+
+@pytest.fixture
+def bulk_data(db: Session) -> Iterator[BulkData]:
+    data = BulkData()
+
+    try:
+        yield data
+    finally:
+        data.remove(db)
+
+def test_grades_bulk_creates_valid_rows(db, client, bulk_data):
+    student_id = bulk_data.add_student(db)
+    subject_ids = [bulk_data.add_subject(db) for _ in range(2)]
+
+    response = client.post("/grades/bulk", json=[
+        {"student_id": student_id, "subject_id": subject_ids[0], "value": 90},
+        {"student_id": student_id, "subject_id": subject_ids[1], "value": 101},
+        {"student_id": f"{BULK_ID_PREFIX}-missing", "subject_id": subject_ids[1], "value": 80},
+        {"student_id": student_id, "subject_id": subject_ids[0], "value": 70},
+        {"student_id": student_id, "subject_id": subject_ids[1], "value": 60},
+    ])
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["created"] == 2
+    assert [error["row"] for error in body["errors"]] == [2, 3, 4]
+
+    db.expire_all()
+    stats = db.get(StudentGradeStatsModel, student_id)
+    assert (stats.grades_sum, stats.grades_count) == (150.0, 2)
+    assert db.scalar(select(StudentModel.average).where(StudentModel.id == student_id)) == 75.0
+
+def test_grades_bulk_csv_creates_valid_rows(db, client, bulk_data):
+    student_id = bulk_data.add_student(db)
+    subject_id = bulk_data.add_subject(db)
+    content = f"student_id,subject_id,value\n{student_id},{subject_id},85\n{student_id},,70\n"
+
+    response = client.post("/grades/bulk/csv", files={"file": ("grades.csv", content, "text/csv")})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["created"] == 1
+    assert [error["row"] for error in body["errors"]] == [2]
+
+def test_students_bulk_creates_valid_rows(db, client, bulk_data):
+    response = client.post("/students/bulk", json=[
+        {"name": "Bulk", "lastname": "First", "email": "bulk.first@example.com", "semester": 1},
+        {"name": "Bulk", "lastname": "Second", "email": "not an email", "semester": 1},
+        {"name": "", "lastname": "Third", "email": "bulk.third@example.com", "semester": 2},
+        {"name": "Bulk", "lastname": "Fourth", "email": "bulk.fourth@example.com", "semester": 3},
+    ])
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    bulk_data.student_ids += [student_id for student_id in body["ids"] if student_id]
+    assert body["created"] == 2
+    assert [error["row"] for error in body["errors"]] == [2, 3]
+    assert body["ids"][1] is None and body["ids"][2] is None
+
+    db.expire_all()
+    stored = dict(db.execute(
+        select(StudentModel.id, StudentModel.lastname).where(StudentModel.id.in_(bulk_data.student_ids))
+    ).tuples().all())
+    assert stored == {body["ids"][0]: "First", body["ids"][3]: "Fourth"}
+
+def test_students_bulk_csv_creates_valid_rows(db, client, bulk_data):
+    content = "name,lastname,email,semester\nBulk,Csv,bulk.csv@example.com,4\nBulk,Csv,bulk.csv@example.com,fourth\n"
+
+    response = client.post("/students/bulk/csv", files={"file": ("students.csv", content, "text/csv")})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    bulk_data.student_ids += [student_id for student_id in body["ids"] if student_id]
+    assert body["created"] == 1
+    assert [error["row"] for error in body["errors"]] == [2]
+    assert db.get(StudentModel, body["ids"][0]).semester == 4
@@ -0,0 +1,59 @@
+"""
+Students, subjects and grades looked up by ID are cached in both database
+modes, the writes invalidate them, and only lookups count as hits or misses.
+"""
+import uuid
+
+from dataclasses import dataclass
+from typing import Iterator
+
+import pytest
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from infrastructure.cache.entity_cache import EntityCache, student_cache
+from infrastructure.cache.in_memory_cache_backend import InMemoryCacheBackend
+from infrastructure.db.models import StudentModel
+
+@dataclass
+class CachedEntity:
+    id: str
+
+def test_existence_probes_are_not_counted():
+    cache = EntityCache("entities", InMemoryCacheBackend(max_entries=10, ttl_seconds=30))
+    cache.set("cached", CachedEntity(id="cached"))
+
+    assert cache.contains("cached")
+    assert not cache.contains("missing")
+    assert (cache.counters.hits, cache.counters.misses) == (0, 0)
+
+    assert cache.get("cached") == CachedEntity(id="cached")
+    assert cache.get("missing") is None
+    assert (cache.counters.hits, cache.counters.misses) == (1, 1)
+
+@pytest.fixture
+def student_id(db: Session) -> Iterator[str]:
+    student_id = f"TEST-cache-{uuid.uuid4().hex[:12]}"
+    db.execute(insert(StudentModel).values(
+        id=student_id, name="Cached", lastname="Student", email="cached@example.com", semester=1, average=0.0
+    ))
+    db.commit()
+
+    try:
+        yield student_id
+    finally:
+        db.execute(delete(StudentModel).where(StudentModel.id == student_id))
+        db.commit()
+
+def test_student_lookups_are_cached_until_updated(client, student_id):
+    hits = student_cache.counters.hits
+
+    assert client.get(f"/students/{student_id}").json()["name"] == "Cached"
+    assert client.get(f"/students/{student_id}").json()["name"] == "Cached"
+    assert student_cache.counters.hits == hits + 1
+
+    response = client.put(f"/students/{student_id}", json={"name": "Renamed"})
+    assert response.status_code == 200, response.text
+
+    assert client.get(f"/students/{student_id}").json()["name"] == "Renamed"
@@ -0,0 +1,52 @@
+"""
+Tampered pagination cursors are rejected with a 400 instead of reaching the
+query, while the cursors the API issues keep paging.
+"""
+import base64
+import json
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+def build_cursor(field: str, value, last_id, descending: bool = False) -> str:
+    payload = {"field": field, "desc": descending, "value": value, "id": last_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+@pytest.mark.parametrize("path, field, value, last_id", [
+    ("/students/", "name", ["Ana"], "A25000001"),
+    ("/students/", "name", {"$gt": ""}, "A25000001"),
+    ("/students/", "name", "Ana", 1),
+    ("/students/", "semester", "3", "A25000001"),
+    ("/students/", "semester", True, "A25000001"),
+    ("/students/", "id", None, None),
+    ("/grades/", "value", "high", 1),
+    ("/grades/", "value", 90.5, "1"),
+    ("/grades/", "id", [1], [1]),
+    ("/grades/", "id", 2 ** 70, 2 ** 70),
+    ("/grades/", "value", 10 ** 400, 1),
+    ("/subjects/", "credits", 2.5, "subject"),
+])
+def test_tampered_cursors_are_rejected(client: TestClient, path: str, field: str, value, last_id):
+    response = client.get(path, params={
+        "pageSize": 2,
+        "sorters[0][field]": field,
+        "sorters[0][order]": "asc",
+        "cursor": build_cursor(field, value, last_id),
+    })
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor."
+
+def test_issued_cursors_keep_paging(client: TestClient):
+    params = {"pageSize": 1, "sorters[0][field]": "value", "sorters[0][order]": "desc"}
+    first_page = client.get("/grades/", params=params)
+    assert first_page.status_code == 200
+
+    next_cursor = first_page.headers.get("x-next-cursor")
+    if next_cursor is None:
+        pytest.skip("needs at least two grades")
+
+    next_page = client.get("/grades/", params={**params, "cursor": next_cursor})
+    assert next_page.status_code == 200
+    assert next_page.json()[0]["value"] <= first_page.json()[0]["value"]
@@ -0,0 +1,17 @@
+"""
+Runs the checks of infrastructure.commands.check_query_plans as tests, so a
+hot query falling back to a sequential scan fails the run.
+"""
+import pytest
+
+from infrastructure.commands.check_query_plans import find_sequential_scans, get_hot_queries
+
+HOT_QUERIES = get_hot_queries()
+
+@pytest.mark.parametrize(
+    "statement",
+    [statement for _, statement in HOT_QUERIES],
+    ids=[name for name, _ in HOT_QUERIES]
+)
+def test_hot_query_is_served_by_an_index(db, statement):
+    assert find_sequential_scans(db, statement) == []
@@ -0,0 +1,138 @@
+"""
+The grade reports read their grades with one joined projection, so the
+statements they issue do not grow with the grades shown.
+"""
+import re
+import uuid
+
+from typing import Iterator, List
+
+import pytest
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from infrastructure.db.models import GradeModel, StudentModel, SubjectModel
+from infrastructure.db.query_stats import query_budget
+from infrastructure.repositories.grade_repository_impl import GradeRepositoryImpl
+from infrastructure.utils.query_budgets import QUERY_BUDGETS
+
+REPORT_ID_PREFIX = "TEST-report"
+GRADE_COUNTS = (1, 25)
+
+class ReportData:
+    def __init__(self):
+        self.student_ids: List[str] = []
+        self.subject_ids: List[str] = []
+
+    def new_id(self) -> str:
+        return f"{REPORT_ID_PREFIX}-{uuid.uuid4().hex[:12]}"
+
+    def add_students(self, db: Session, count: int) -> List[str]:
+        student_ids = [self.new_id() for _ in range(count)]
+        db.execute(insert(StudentModel), [
+            {
+                "id": student_id,
+                "name": "Report",
+                "lastname": f"Student {index}",
+                "email": f"report{index}@example.com",
+                "semester": 1,
+                "average": 0.0
+            }
+            for index, student_id in enumerate(student_ids)
+        ])
+        self.student_ids += student_ids
+        return student_ids
+
+    def add_subjects(self, db: Session, count: int) -> List[str]:
+        subject_ids = [self.new_id() for _ in range(count)]
+        db.execute(insert(SubjectModel), [
+            {"id": subject_id, "name": f"Subject {index}", "description": "Report subject", "credits": 5, "semester": 1}
+            for index, subject_id in enumerate(subject_ids)
+        ])
+        self.subject_ids += subject_ids
+        return subject_ids
+
+    def add_grades(self, db: Session, student_ids: List[str], subject_ids: List[str]) -> None:
+        db.execute(insert(GradeModel), [
+            {"student_id": student_id, "subject_id": subject_id, "value": 80.0}
+            for student_id in student_ids
+            for subject_id in subject_ids
+        ])
+
+    def remove(self, db: Session) -> None:
+        """Deletes the seeded rows, students cascade to their stats and dashboard rows."""
+        db.rollback()
+        db.execute(delete(GradeModel).where(
+            GradeModel.student_id.in_(self.student_ids) | GradeModel.subject_id.in_(self.subject_ids)
+        ))
+        db.execute(delete(StudentModel).where(StudentModel.id.in_(self.student_ids)))
+        db.execute(delete(SubjectModel).where(SubjectModel.id.in_(self.subject_ids)))
+        db.commit()
+
+@pytest.fixture
+def report_data(db: Session) -> Iterator[ReportData]:
+    data = ReportData()
+
+    try:
+        yield data
+    finally:
+        data.remove(db)
+
+def seed_subject_report(db: Session, data: ReportData, grades: int) -> str:
+    """Seeds a subject graded for grades students and returns its ID."""
+    (subject_id,) = data.add_subjects(db, 1)
+    data.add_grades(db, data.add_students(db, grades), [subject_id])
+    db.commit()
+    return subject_id
+
+def seed_student_report(db: Session, data: ReportData, grades: int) -> str:
+    """Seeds a student graded in grades subjects and returns their ID."""
+    (student_id,) = data.add_students(db, 1)
+    data.add_grades(db, [student_id], data.add_subjects(db, grades))
+    db.commit()
+    return student_id
+
+def get_query_count(response) -> int:
+    """Reads the statements issued by a request from its Server-Timing header."""
+    match = re.search(r'desc="(\d+) queries"', response.headers["Server-Timing"])
+    assert match, response.headers["Server-Timing"]
+    return int(match.group(1))
+
+def test_subject_grades_to_show_is_one_statement(db, report_data):
+    subject_id = seed_subject_report(db, report_data, GRADE_COUNTS[-1])
+
+    with query_budget(1, "subject grades to show"):
+        grades = GradeRepositoryImpl(db).get_subject_grades_to_show(subject_id)
+
+    assert len(grades) == GRADE_COUNTS[-1]
+    assert {grade.student for grade in grades} == {"Report"}
+
+def test_student_grades_to_show_is_one_statement(db, report_data):
+    student_id = seed_student_report(db, report_data, GRADE_COUNTS[-1])
+
+    with query_budget(1, "student grades to show"):
+        grades = GradeRepositoryImpl(db).get_student_grades_to_show(student_id)
+
+    assert len(grades) == GRADE_COUNTS[-1]
+    assert all(grade.subject.startswith("Subject ") for grade in grades)
+
+@pytest.mark.parametrize(
+    ("route", "seed"),
+    [
+        ("/reports/subjects/{subject_id}/grades", seed_subject_report),
+        ("/reports/students/{student_id}/grades", seed_student_report),
+    ]
+)
+def test_report_query_count_does_not_grow_with_grades(db, client, report_data, route, seed):
+    query_counts = []
+
+    for grades in GRADE_COUNTS:
+        entity_id = seed(db, report_data, grades)
+        response = client.get(route.replace(route[route.index("{"):route.index("}") + 1], entity_id))
+
+        assert response.status_code == 200, response.text
+        query_counts.append(get_query_count(response))
+
+    assert len(set(query_counts)) == 1, f"Query counts by grades {dict(zip(GRADE_COUNTS, query_counts))}"
+    assert query_counts[0] <= QUERY_BUDGETS[f"GET {route}"]
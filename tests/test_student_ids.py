@@ -0,0 +1,148 @@
+"""
+Student IDs are handed out concurrently by threads sharing a repository, by
+workers and pods holding their own, by the async repository and by many
+enrollments through POST /students/ at once, and no ID is ever handed out twice.
+"""
+import asyncio
+import multiprocessing
+import re
+import uuid
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator, List
+
+import pytest
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+
+from domain.repositories.student_id_repository import StudentIdRepository
+from infrastructure.db.async_database import ASYNC_DATABASE_URL
+from infrastructure.db.database import engine
+from infrastructure.db.models import StudentIdCounterModel, StudentModel
+from infrastructure.repositories.async_student_id_repository_impl import AsyncStudentIdRepositoryImpl
+from infrastructure.repositories.student_id_repository_impl import StudentIdRepositoryImpl, get_student_id_prefix, student_id_repository
+
+# A year no student is enrolled in, so the tests never move a real counter
+TEST_YEAR = 1999
+TEST_PREFIX = get_student_id_prefix(TEST_YEAR)
+STUDENT_ID_PATTERN = re.compile(rf"^{TEST_PREFIX}\d{{6}}$")
+
+WORKERS = 4
+CALLS_PER_WORKER = 250
+# Every so often a worker asks for more IDs than a block holds, as bulk imports do
+BULK_CALL_EVERY = 25
+BULK_CALL_COUNT = 60
+# Small blocks make the workers reserve, and so race on the counter, more often
+SMALL_BLOCK_SIZE = 7
+# More enrollments at once than connections in the pool
+ENROLLMENTS = 1000
+ENROLLMENT_CONCURRENCY = 32
+ENROLLED_ID_PATTERN = re.compile(r"^A\d{2}\d{6}$")
+
+@pytest.fixture
+def counter(db: Session) -> Iterator[None]:
+    def reset():
+        db.execute(delete(StudentIdCounterModel).where(StudentIdCounterModel.prefix == TEST_PREFIX))
+        db.commit()
+        student_id_repository.blocks.pop(TEST_PREFIX, None)
+
+    reset()
+
+    try:
+        yield
+    finally:
+        reset()
+
+def take_ids(repository: StudentIdRepository) -> List[str]:
+    """Enrolls CALLS_PER_WORKER times through repository, in bulk every BULK_CALL_EVERY calls."""
+    ids = []
+    for call in range(CALLS_PER_WORKER):
+        ids += repository.next_ids(TEST_YEAR, BULK_CALL_COUNT if call % BULK_CALL_EVERY == 0 else 1)
+    return ids
+
+def take_ids_in_process() -> List[str]:
+    """Enrolls from a new process, through the repository of that process."""
+    return take_ids(student_id_repository)
+
+def expected_id_count(workers: int) -> int:
+    bulk_calls = len(range(0, CALLS_PER_WORKER, BULK_CALL_EVERY))
+    return workers * (CALLS_PER_WORKER - bulk_calls + bulk_calls * BULK_CALL_COUNT)
+
+def assert_unique_student_ids(ids: List[str], workers: int) -> None:
+    assert len(ids) == expected_id_count(workers)
+    assert len(set(ids)) == len(ids), "Student IDs handed out more than once"
+    assert all(STUDENT_ID_PATTERN.match(student_id) for student_id in ids)
+
+def test_threads_and_workers_never_share_an_id(counter):
+    # Half the threads share the repository of this process, the other half
+    # stand for other workers and pods, each with a repository of its own
+    repositories = [student_id_repository] * (WORKERS // 2) + [
+        StudentIdRepositoryImpl(engine, block_size=SMALL_BLOCK_SIZE)
+        for _ in range(WORKERS - WORKERS // 2)
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(repositories)) as executor:
+        results = list(executor.map(take_ids, repositories))
+
+    assert_unique_student_ids([student_id for ids in results for student_id in ids], len(repositories))
+
+def test_processes_never_share_an_id(counter):
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=WORKERS, mp_context=context) as executor:
+        results = [future.result() for future in [executor.submit(take_ids_in_process) for _ in range(WORKERS)]]
+
+    assert_unique_student_ids([student_id for ids in results for student_id in ids], WORKERS)
+
+def test_async_workers_never_share_an_id(counter):
+    async def take_async_ids() -> List[str]:
+        # An engine of its own, the shared one may hold connections of another event loop
+        async_engine = create_async_engine(ASYNC_DATABASE_URL)
+        repositories = [AsyncStudentIdRepositoryImpl(async_engine, block_size=SMALL_BLOCK_SIZE) for _ in range(WORKERS)]
+
+        try:
+            # Every worker serves several requests at once on its event loop
+            results = await asyncio.gather(*(
+                repository.next_ids(TEST_YEAR, BULK_CALL_COUNT if call % BULK_CALL_EVERY == 0 else 1)
+                for repository in repositories
+                for call in range(CALLS_PER_WORKER)
+            ))
+        finally:
+            await async_engine.dispose()
+
+        return [student_id for ids in results for student_id in ids]
+
+    assert_unique_student_ids(asyncio.run(take_async_ids()), WORKERS)
+
+@pytest.fixture
+def enrollment_tag(db: Session) -> Iterator[str]:
+    tag = f"TEST-enrollment-{uuid.uuid4().hex[:12]}"
+
+    try:
+        yield tag
+    finally:
+        db.rollback()
+        db.execute(delete(StudentModel).where(StudentModel.lastname == tag))
+        db.commit()
+
+def test_concurrent_enrollments_never_share_an_id(db, client, enrollment_tag):
+    def enroll(index: int):
+        return client.post("/students/", json={
+            "name": f"Enrollment {index}",
+            "lastname": enrollment_tag,
+            "email": f"enrollment{index}@example.com",
+            "semester": 1
+        })
+
+    with ThreadPoolExecutor(max_workers=ENROLLMENT_CONCURRENCY) as executor:
+        responses = list(executor.map(enroll, range(ENROLLMENTS)))
+
+    assert [response.status_code for response in responses if response.status_code != 201] == []
+    ids = [response.json()["id"] for response in responses]
+    assert len(set(ids)) == ENROLLMENTS, "Student IDs handed out more than once"
+    assert all(ENROLLED_ID_PATTERN.match(student_id) for student_id in ids)
+
+    stored_ids = set(db.scalars(select(StudentModel.id).where(StudentModel.lastname == enrollment_tag)).all())
+    assert stored_ids == set(ids)